@@ -198,6 +198,12 @@ def main(action: str, contract_name: str | None = None) -> None:
                 if contract.deploy:
                     logger.info(f"Deploying {contract.name}")
                     contract.deploy()
+        case "profile":
+            # Imported here since the profiler depends on the generated clients of a prior build
+            from smart_contracts.profiler import profile
+
+            logger.info("Profiling app methods on LocalNet")
+            profile(artifact_path / "profile.json")
         case _:
             logger.error(f"Unknown action: {action}")
 
@@ -6,15 +6,77 @@ ZERO_ADDR_BYTES = b"\x00" * 32
 
 # BOX
 BOX_T_COST = 19_700
-BOX_R_COST = 29_700
-BOX_S_COST = 80_500
+BOX_R_COST = 23_300
+BOX_S_COST = 62_900
+BOX_V_COST = 19_300
+BOX_E_COST = 23_300  # Game seat box MBR, deposited along with the stake and refunded once the seat is released
+BOX_P_PAGE_COST = 212_500
+BOX_F_COST = 208_100
+BOX_L_COST = 516_100
 BOX_R_EXP_ROUND_DELTA = 150000
+BOX_V_PRUNE_ROUND_DELTA = 1_000
+BOX_R_SWEEP_MAX = 3  # Max num of game register boxes swept per call, a box and an account reference each plus the creator
+
+# PLAYERS PAGE
+PLAYERS_PAGE_SEATS = 16
+PLAYERS_PAGE_HEADER_SIZE = 2
+PLAYERS_PAGE_SIZE = 514
+NO_SEAT_IDX = 65535
+
+# GAME LOBBY
+LOBBY_CAPACITY = 128  # Max num of open lobbies listed at once, further games stay unlisted
+LOBBY_HEADER_SIZE = 2  # Num of listed open lobbies
+LOBBY_ENTRY_SIZE = 10  # Game ID (8 bytes) plus free seat count (2 bytes)
+GAME_LOBBY_SIZE = 1282
+NO_LOBBY_SLOT = 65535
+READ_LOBBY_PAGE_MAX = 100  # Max lobby entries per page that fit inside a single 1024-byte ABI return log
+
+# LEADERBOARD
+LEADERBOARD_HEADER_SIZE = 2  # Num of ranked leaderboard entries
+LEADERBOARD_ENTRY_SIZE = 33  # Score (1 byte) plus player address (32 bytes)
+LEADERBOARD_MAX_CAPACITY = 64
+BOX_B_BASE_COST = 4_100  # Base fee plus key and header size fee of the leaderboard box
+BOX_B_ENTRY_COST = 13_200  # Size fee per leaderboard entry
+READ_LEADERBOARD_PAGE_MAX = 30  # Max leaderboard entries per page that fit inside a single 1024-byte ABI return log
+
+# READ PAGE
+READ_GAMES_PAGE_MAX = 6  # Max 149-byte game state entries per page, 4 + 2 + 6 * 149 = 900 bytes fits a 1024-byte ABI return log
+READ_ROSTERS_PAGE_MAX = 16  # Max roster summary entries per page that fit inside a single 1024-byte ABI return log
+
+# GAME POOL
+GAME_POOL_SIZE = 512  # One 8-byte retired game id head per page count bucket (64 buckets)
+
+# VRF BEACON
+VRF_BEACON_TESTNET_APP_ID = 600011887  # Deploy-time value of VRF_BEACON_APP_ID on TestNet
 
 # STAKE
 STAKE_AMOUNT = 1_000_000
+PLAY_FEE_ESCROW = 10_000
+SEED_CACHE_DEPOSIT = BOX_V_COST  # Admin deposit funding the round seed cache box, refunded on game over
 
 # GAME
-MAX_PLAYERS_TOP_BOUND = 16
+MAX_PLAYERS_TOP_BOUND = 1024
 MAX_PLAYERS_BOT_BOUND = 3
 ELIM_THRESHOLD = 10992
+MAX_SCORE = 254
 PHASE_EXPIRY_INTERVAL = 1800
+COMMIT_ROUND_DELTA = 4  # Num of rounds between a randomness commitment and the VRF beacon round it commits to
+
+# SCORE
+# Survival probability q^k of k consecutive rolls above ELIM_THRESHOLD, where q = 1 - ELIM_THRESHOLD / 65535,
+# stored as 64-bit fixed-point values (scaled by 2^64) for the closed-form score sampler
+SCORE_SURVIVAL_POW_1 = 15_352_723_918_705_120_527
+SCORE_SURVIVAL_POW_2 = 12_777_655_004_164_696_558
+SCORE_SURVIVAL_POW_4 = 8_850_801_352_968_660_076
+SCORE_SURVIVAL_POW_8 = 4_246_640_180_873_866_961
+SCORE_SURVIVAL_POW_16 = 977_622_541_612_346_889
+SCORE_SURVIVAL_POW_32 = 51_811_085_471_214_488
+SCORE_SURVIVAL_POW_64 = 145_520_996_387_178
+SCORE_SURVIVAL_POW_128 = 1_147_972_796
+
+# BUDGET
+PCG_ROLL_BUDGET = 200
+GAME_OVER_BUDGET = 2_000
+PLAY_RESOLVE_BUDGET = 700
+LEADERBOARD_BUDGET = 600
+LEADERBOARD_SCAN_BUDGET = 40  # Per tied leaderboard entry scanned for a player's previous entry
@@ -18,6 +18,7 @@ from algopy import (
     gtxn,
     itxn,
     op,
+    subroutine,
     urange,
 )
 
@@ -32,14 +33,21 @@ from . import type_aliases as ta
 class Pieout(ARC4Contract):
     # Global State type declarations
     game_id: UInt64
+    game_generation: UInt64
+    event_seq: UInt64
 
     # Application init method
     def __init__(self) -> None:
         # Box Storage type declarations
         self.box_game_state = BoxMap(UInt64, stc.GameState, key_prefix="s_")
-        self.box_game_players = BoxMap(UInt64, Bytes, key_prefix="p_")
+        self.box_game_players = BoxMap(Bytes, Bytes, key_prefix="p_")
         self.box_game_register = BoxMap(Account, stc.GameRegister, key_prefix="r_")
+        self.box_game_seat = BoxMap(Bytes, stc.GameSeat, key_prefix="e_")
         self.box_game_trophy = Box(stc.GameTrophy, key="t_")
+        self.box_round_seed = BoxMap(UInt64, Bytes, key_prefix="v_")
+        self.box_game_pool = BoxRef(key="f_")
+        self.box_game_lobby = BoxRef(key="l_")
+        self.box_leaderboard = BoxRef(key="b_")
 
     # READ-ONLY: Calculate the minimum balance requirement (MBR) cost for storing a single box unit
     @arc4.abimethod(readonly=True)
@@ -60,6 +68,11 @@ class Pieout(ARC4Contract):
     def read_gen_unix(self) -> UInt64:
         return TemplateVar[UInt64]("GEN_UNIX")
 
+    # READ-ONLY: Return the VRF beacon app ID set at deploy-time
+    @arc4.abimethod(readonly=True)
+    def read_vrf_beacon_app_id(self) -> UInt64:
+        return TemplateVar[UInt64]("VRF_BEACON_APP_ID")
+
     # READ-ONLY: Return True if game trophy box data exists, else False
     @arc4.abimethod(readonly=True)
     def does_box_game_trophy_exist(self) -> bool:
@@ -75,30 +88,187 @@ class Pieout(ARC4Contract):
     def does_box_game_state_exist(self, game_id: UInt64) -> bool:
         return self.box_game_state.maybe(key=game_id)[1]
 
-    # READ-ONLY: Return an array of all active players at time of call
+    # READ-ONLY: Return an array of all active players inside a single players page at time of call
     @arc4.abimethod(readonly=True)
-    def read_box_game_players(self, game_id: UInt64) -> ta.GamePlayersArr:
+    def read_box_game_players(
+        self, game_id: UInt64, page_idx: UInt64
+    ) -> ta.GamePlayersArr:
         # Fail transaction unless the assertion below evaluates True
         assert game_id in self.box_game_state, err.GAME_ID_NOT_FOUND
 
-        # Retrieve byte array of current player addresses from the box using the game id parameter
-        players_b_arr = self.box_game_players[game_id]
+        # Retrieve the game state data from its corresponding box using the game id parameter
+        game_state = self.box_game_state[game_id].copy()
 
         # Define a dynamic array to append all remaining active players
         active_players = ta.GamePlayersArr()
 
-        # Iterate through the players byte array
-        for i in urange(0, players_b_arr.length, cst.ADDRESS_SIZE):
-            # Extract the bytes representing the player address
-            player_addr_bytes = op.extract(players_b_arr, i, cst.ADDRESS_SIZE)
-            # Only append address if its bytes do NOT equal to a zeroed byte array of size 32
-            if player_addr_bytes != Bytes(cst.ZERO_ADDR_BYTES):
-                player_account = Account.from_bytes(player_addr_bytes)
-                active_players.append(arc4.Address(player_account))
+        # A page that was never created or has no live seats has no active players to return
+        if page_idx >= game_state.pages_allocated.native or not op.getbit(
+            game_state.live_pages.native, page_idx
+        ):
+            return active_players
+
+        # Retrieve byte array of the players page box using the game id and page index
+        players_b_arr = self.box_game_players[
+            srt.game_players_page_key(game_id, page_idx)
+        ]
+
+        # Read the live seat bitmap from the players page header
+        live_seats = op.extract_uint16(players_b_arr, 0)
+
+        # Visit only the live seats by repeatedly taking the lowest set bit of the bitmap
+        while live_seats:
+            lowest_live_seat = live_seats & ~(live_seats - 1)
+            live_seats ^= lowest_live_seat
+
+            # Extract the bytes representing the player address stored at the live seat
+            player_addr_bytes = op.extract(
+                players_b_arr,
+                srt.calc_seat_start_pos(op.bitlen(lowest_live_seat) - 1),
+                cst.ADDRESS_SIZE,
+            )
+            active_players.append(arc4.Address(Account.from_bytes(player_addr_bytes)))
 
         # Return the array containing the remaining active players
         return active_players
 
+    # READ-ONLY: Return the game states of existing games with IDs in [start_id, start_id + count), retired ones skipped
+    @arc4.abimethod(readonly=True)
+    def read_games_page(self, start_id: UInt64, count: UInt64) -> ta.GameStatesArr:
+        # Fail transaction unless the assertion below evaluates True
+        assert count <= cst.READ_GAMES_PAGE_MAX, err.INVALID_PAGE_COUNT
+
+        # Define a dynamic array to append the game state entries
+        game_states = ta.GameStatesArr()
+
+        # Iterate through the game IDs of the page, stopping at the next unassigned game ID
+        end_id = start_id + count
+        if end_id > self.game_id:
+            end_id = self.game_id
+        for game_id in urange(start_id, end_id):
+            game_state, game_state_exists = self.box_game_state.maybe(game_id)
+            if game_state_exists and game_state.max_players.native != 0:
+                game_states.append(
+                    stc.GameStateEntry(game_id=arc4.UInt64(game_id), state=game_state.copy())
+                )
+
+        # Return the array containing the game state entries
+        return game_states
+
+    # READ-ONLY: Return the roster summaries of existing games with IDs in [start_id, start_id + count), retired ones skipped
+    @arc4.abimethod(readonly=True)
+    def read_rosters_page(
+        self, start_id: UInt64, count: UInt64
+    ) -> ta.GameRosterSummariesArr:
+        # Fail transaction unless the assertion below evaluates True
+        assert count <= cst.READ_ROSTERS_PAGE_MAX, err.INVALID_PAGE_COUNT
+
+        # Define a dynamic array to append the game roster summaries
+        roster_summaries = ta.GameRosterSummariesArr()
+
+        # Iterate through the game IDs of the page, stopping at the next unassigned game ID
+        end_id = start_id + count
+        if end_id > self.game_id:
+            end_id = self.game_id
+        for game_id in urange(start_id, end_id):
+            game_state, game_state_exists = self.box_game_state.maybe(game_id)
+            if game_state_exists and game_state.max_players.native != 0:
+                roster_summaries.append(
+                    stc.GameRosterSummary(
+                        game_id=arc4.UInt64(game_id),
+                        staking_finalized=game_state.staking_finalized,
+                        active_players=game_state.active_players,
+                        max_players=game_state.max_players,
+                        expiry_ts=game_state.expiry_ts,
+                        prize_pool=game_state.prize_pool,
+                        admin_address=game_state.admin_address,
+                    )
+                )
+
+        # Return the array containing the game roster summaries
+        return roster_summaries
+
+    # READ-ONLY: Return the open lobby index entries in [start_slot, start_slot + count), each w/ its free seat count
+    @arc4.abimethod(readonly=True)
+    def read_open_lobbies(
+        self, start_slot: UInt64, count: UInt64
+    ) -> ta.GameLobbyEntriesArr:
+        # Fail transaction unless the assertion below evaluates True
+        assert self.box_game_lobby, err.BOX_NOT_FOUND
+        assert count <= cst.READ_LOBBY_PAGE_MAX, err.INVALID_PAGE_COUNT
+
+        # Clamp the page to the num of listed open lobbies
+        listed_count = op.extract_uint16(
+            self.box_game_lobby.extract(0, cst.LOBBY_HEADER_SIZE), 0
+        )
+        if start_slot > listed_count:
+            start_slot = listed_count
+        if count > listed_count - start_slot:
+            count = listed_count - start_slot
+
+        # The entries are stored in their ABI encoding, so prefix the length and decode them as an array
+        return ta.GameLobbyEntriesArr.from_bytes(
+            op.extract(op.itob(count), 6, 2)
+            + self.box_game_lobby.extract(
+                cst.LOBBY_HEADER_SIZE + start_slot * cst.LOBBY_ENTRY_SIZE,
+                count * cst.LOBBY_ENTRY_SIZE,
+            )
+        )
+
+    # READ-ONLY: Return the leaderboard entries ranked in [start_rank, start_rank + count), highest score first
+    @arc4.abimethod(readonly=True)
+    def read_leaderboard(
+        self, start_rank: UInt64, count: UInt64
+    ) -> ta.LeaderboardEntriesArr:
+        # Fail transaction unless the assertion below evaluates True
+        assert self.box_leaderboard, err.BOX_NOT_FOUND
+        assert count <= cst.READ_LEADERBOARD_PAGE_MAX, err.INVALID_PAGE_COUNT
+
+        # Clamp the page to the num of ranked entries
+        ranked_count = op.extract_uint16(
+            self.box_leaderboard.extract(0, cst.LEADERBOARD_HEADER_SIZE), 0
+        )
+        if start_rank > ranked_count:
+            start_rank = ranked_count
+        if count > ranked_count - start_rank:
+            count = ranked_count - start_rank
+
+        # The entries are stored in their ABI encoding, so prefix the length and decode them as an array
+        return ta.LeaderboardEntriesArr.from_bytes(
+            op.extract(op.itob(count), 6, 2)
+            + self.box_leaderboard.extract(
+                cst.LEADERBOARD_HEADER_SIZE + start_rank * cst.LEADERBOARD_ENTRY_SIZE,
+                count * cst.LEADERBOARD_ENTRY_SIZE,
+            )
+        )
+
+    # READ-ONLY: Return the first, second and third place addresses by resolving their placement seat indices
+    @arc4.abimethod(readonly=True)
+    def read_game_placements(self, game_id: UInt64) -> ta.GamePlacementsTuple:
+        # Fail transaction unless the assertion below evaluates True
+        assert game_id in self.box_game_state, err.GAME_ID_NOT_FOUND
+
+        # Retrieve the game state data from its corresponding box using the game id parameter
+        game_state = self.box_game_state[game_id].copy()
+
+        # Resolve the placement addresses, an empty placement resolves to the zero address
+        first_place_address, second_place_address, third_place_address = (
+            srt.get_placement_addresses(
+                game_id=game_id,
+                game_state=game_state,
+                box_game_players=self.box_game_players,
+            )
+        )
+
+        # Return the placement addresses
+        return ta.GamePlacementsTuple(
+            (
+                arc4.Address(first_place_address),
+                arc4.Address(second_place_address),
+                arc4.Address(third_place_address),
+            )
+        )
+
     # Generate the smart contract application client
     @arc4.abimethod(create="require")
     def generate(
@@ -109,6 +279,8 @@ class Pieout(ARC4Contract):
 
         # Set Global State variables to their default starting values
         self.game_id = UInt64(1)
+        self.game_generation = UInt64(0)
+        self.event_seq = UInt64(0)
 
     # Allow app creator to mint a one-time NFT asset used as a trophy token to honor the ath address
     @arc4.abimethod
@@ -157,26 +329,629 @@ class Pieout(ARC4Contract):
             ath_address=arc4.Address(Global.zero_address),
         )
 
+    # Allow app creator to create the game pool box that tracks retired game ids available for recycling
+    @arc4.abimethod
+    def init_game_pool(self, box_f_pay: gtxn.PaymentTransaction) -> None:
+        # Fail transaction unless the assertion below evaluates True
+        assert Global.group_size == 2, err.INVALID_GROUP_SIZE
+        assert Txn.sender == Global.creator_address, err.INVALID_CREATOR
+        assert not self.box_game_pool, err.BOX_FOUND
+
+        assert box_f_pay.amount == cst.BOX_F_COST, err.INVALID_BOX_PAY_FEE
+        assert box_f_pay.sender == Txn.sender, err.INVALID_BOX_PAY_SENDER
+        assert (
+            box_f_pay.receiver == Global.current_application_address
+        ), err.INVALID_BOX_PAY_RECEIVER
+
+        # Create the game pool box, every bucket head starts as zero (empty)
+        self.box_game_pool.create(size=cst.GAME_POOL_SIZE)
+
+    # Allow app creator to create the open lobby index box that lists games still in the staking phase
+    @arc4.abimethod
+    def init_game_lobby(self, box_l_pay: gtxn.PaymentTransaction) -> None:
+        # Fail transaction unless the assertion below evaluates True
+        assert Global.group_size == 2, err.INVALID_GROUP_SIZE
+        assert Txn.sender == Global.creator_address, err.INVALID_CREATOR
+        assert not self.box_game_lobby, err.BOX_FOUND
+
+        assert box_l_pay.amount == cst.BOX_L_COST, err.INVALID_BOX_PAY_FEE
+        assert box_l_pay.sender == Txn.sender, err.INVALID_BOX_PAY_SENDER
+        assert (
+            box_l_pay.receiver == Global.current_application_address
+        ), err.INVALID_BOX_PAY_RECEIVER
+
+        # Create the open lobby index box, the listed count header starts as zero
+        self.box_game_lobby.create(size=cst.GAME_LOBBY_SIZE)
+
+    # Allow app creator to create the leaderboard box that ranks the top personal best scores
+    @arc4.abimethod
+    def init_leaderboard(
+        self, box_b_pay: gtxn.PaymentTransaction, capacity: UInt64
+    ) -> None:
+        # Fail transaction unless the assertion below evaluates True
+        assert Global.group_size == 2, err.INVALID_GROUP_SIZE
+        assert Txn.sender == Global.creator_address, err.INVALID_CREATOR
+        assert not self.box_leaderboard, err.BOX_FOUND
+        assert (
+            capacity >= 1 and capacity <= cst.LEADERBOARD_MAX_CAPACITY
+        ), err.INVALID_LEADERBOARD_CAPACITY
+
+        assert (
+            box_b_pay.amount == cst.BOX_B_BASE_COST + capacity * cst.BOX_B_ENTRY_COST
+        ), err.INVALID_BOX_PAY_FEE
+        assert box_b_pay.sender == Txn.sender, err.INVALID_BOX_PAY_SENDER
+        assert (
+            box_b_pay.receiver == Global.current_application_address
+        ), err.INVALID_BOX_PAY_RECEIVER
+
+        # Create the leaderboard box sized to its capacity, the ranked count header starts as zero
+        self.box_leaderboard.create(
+            size=cst.LEADERBOARD_HEADER_SIZE + capacity * cst.LEADERBOARD_ENTRY_SIZE
+        )
+
     # Allow ath address to claim the trophy and add it to their asset balance via an asset transfer inner transaction
     @arc4.abimethod
     def claim_trophy(self) -> None:
         # Fail transaction unless the assertion below evaluates True
         assert Global.group_size == 1, err.STANDALONE_TXN_ONLY
-        assert (
-            Txn.sender == self.box_game_trophy.value.ath_address.native
-        ), err.INVALID_TROPHY_RECEIVER
+
+        # Retrieve the game trophy data from its box once
+        game_trophy = self.box_game_trophy.value.copy()
+
+        # Fail transaction unless the assertions below evaluate True
+        assert Txn.sender == game_trophy.ath_address.native, err.INVALID_TROPHY_RECEIVER
         assert Txn.sender.is_opted_in(
-            Asset(self.box_game_trophy.value.asset_id.native)
+            Asset(game_trophy.asset_id.native)
         ), err.ASSET_OPT_IN_REQUIRED
 
         # Transfer game trophy asset to sender by making an asset transfer inner transaction
         itxn.AssetTransfer(
-            xfer_asset=self.box_game_trophy.value.asset_id.native,
+            xfer_asset=game_trophy.asset_id.native,
             asset_receiver=Txn.sender,
             asset_amount=1,
             note=b'pieout:j{"method":"claim_trophy","concern":"itxn.asset_transfer;transfer_trophy_asset"}',
         ).submit()
 
+    # Allow any account to promote the topscorer of a game to ath address if their top score beats the ath score
+    @arc4.abimethod
+    def promote_ath(self, game_id: UInt64) -> None:
+        # Fail transaction unless the assertions below evaluate True
+        assert game_id in self.box_game_state, err.GAME_ID_NOT_FOUND
+        assert self.box_game_trophy, err.BOX_NOT_FOUND
+
+        # Retrieve current game state from the box using the game id parameter
+        game_state = self.box_game_state[game_id].copy()
+
+        # Promote the game ath candidate, fail if it does not beat the current ath score
+        assert self.promote_ath_candidate(
+            game_id=game_id, game_state=game_state
+        ), err.ATH_NOT_BEATEN
+
+        # Update the game state box with the advanced per-game event sequence number
+        self.box_game_state[game_id] = game_state.copy()
+
+    # Increment the global game generation counter and return its new value
+    @subroutine
+    def next_game_generation(self) -> UInt64:
+        self.game_generation += 1
+        return self.game_generation
+
+    # Increment the app-wide event sequence number stored in global state and return its new value
+    @subroutine
+    def next_event_seq(self) -> UInt64:
+        self.event_seq += 1
+        return self.event_seq
+
+    # Set the fee escrow of a game, emitting an event only if its value changes
+    @subroutine
+    def set_fee_escrow(
+        self, game_id: UInt64, game_state: stc.GameState, fee_escrow: UInt64
+    ) -> None:
+        # Nothing to record if the fee escrow keeps its value
+        if game_state.fee_escrow.native == fee_escrow:
+            return
+
+        # Update the fee escrow of the game state
+        game_state.fee_escrow = arc4.UInt64(fee_escrow)
+
+        # Emit ARC-28 event for off-chain tracking
+        arc4.emit(
+            "fee_escrow_updated(uint64,uint64,uint64,uint64)",
+            self.next_event_seq(),
+            game_id,
+            srt.next_game_event_seq(game_state),
+            game_state.fee_escrow,
+        )
+
+    # Credit an amount to the claimable balance of a receiver's game register
+    @subroutine
+    def credit_claimable(self, receiver: Account, amount: UInt64) -> None:
+        # Nothing to credit for a zero amount
+        if amount == 0:
+            return
+
+        # Add the amount to the receiver's claimable balance, reading and writing their game register box once
+        game_register = self.box_game_register[receiver].copy()
+        game_register.claimable = arc4.UInt64(game_register.claimable.native + amount)
+        self.box_game_register[receiver] = game_register.copy()
+
+        # Emit ARC-28 event for off-chain tracking
+        arc4.emit(
+            "claimable_credited(uint64,address,uint64)",
+            self.next_event_seq(),
+            receiver,
+            amount,
+        )
+
+    # Credit an amount to a receiver's claimable balance, or pay it out directly if they hold no game register box
+    @subroutine
+    def credit_or_payout(self, receiver: Account, amount: UInt64) -> None:
+        if receiver in self.box_game_register:
+            self.credit_claimable(receiver=receiver, amount=amount)
+        elif amount > 0:
+            srt.payout_itxn(
+                receiver=receiver,
+                amount=amount,
+                note=String(
+                    'pieout:j{"method":"play_game","subroutine:"credit_or_payout","concern":"itxn.pay;prize_share"}'
+                ),
+            )
+
+    # Seat a player in a game, recording the seat in their game seat box so membership checks are O(1)
+    @subroutine
+    def take_game_seat(
+        self,
+        game_id: UInt64,
+        game_state: stc.GameState,
+        game_register: stc.GameRegister,
+        player: Account,
+        seat_idx: UInt64,
+    ) -> None:
+        # Retrieve the player's game seat box for this game if they held a seat in it before, it is read once
+        game_seat_key = srt.game_seat_key(game_id, player)
+        game_seat, game_seat_exists = self.box_game_seat.maybe(game_seat_key)
+
+        # A seat box left over from an older round of the game is reused instead of created
+        if game_seat_exists:
+            # Fail transaction unless the assertion below evaluates True
+            assert game_seat.generation != game_state.generation, err.PLAYER_ACTIVE
+
+            # The seat box MBR deposited along with the stake is not needed and the fee escrow of the unplayed
+            # old seat was never used, credit both back to the player
+            game_register.claimable = arc4.UInt64(
+                game_register.claimable.native + cst.BOX_E_COST + cst.PLAY_FEE_ESCROW
+            )
+
+            # Emit ARC-28 event for off-chain tracking
+            arc4.emit(
+                "claimable_credited(uint64,address,uint64)",
+                self.next_event_seq(),
+                player,
+                arc4.UInt64(cst.BOX_E_COST + cst.PLAY_FEE_ESCROW),
+            )
+
+        # Record the game generation and the seat index in the player's game seat box
+        self.box_game_seat[game_seat_key] = stc.GameSeat(
+            generation=game_state.generation,
+            seat_idx=arc4.UInt16(seat_idx),
+        )
+
+        # Keep the game register from expiring while the player is seated
+        srt.extend_register_expiry(
+            game_register=game_register,
+            round_delta=UInt64(cst.BOX_R_EXP_ROUND_DELTA),
+        )
+
+        # For the players page box holding the seat, seat the player and mark their seat as live
+        srt.occupy_seat(
+            game_id=game_id,
+            game_state=game_state,
+            box_game_players=self.box_game_players,
+            seat_idx=seat_idx,
+            account=player,
+        )
+
+    # Check if a game register box is expired and idle, so any account may delete it
+    @subroutine
+    def is_register_reclaimable(self, game_register: stc.GameRegister) -> bool:
+        return (
+            not game_register.hosting_game.native  # Register must not be hosting a game
+            and game_register.expiry_round.native < Global.round  # Register expiry round must have passed
+        )
+
+    # List a game in the open lobby index w/ its free seat count, it stays unlisted if the index is missing or full
+    @subroutine
+    def list_open_lobby(self, game_id: UInt64, game_state: stc.GameState) -> None:
+        # A game that is already listed only needs its free seat count refreshed
+        if game_state.lobby_slot.native != cst.NO_LOBBY_SLOT:
+            self.update_open_lobby(game_state)
+            return
+
+        # Without an open lobby index box or a free slot there is nowhere to list the game
+        if not self.box_game_lobby:
+            return
+        listed_count = op.extract_uint16(
+            self.box_game_lobby.extract(0, cst.LOBBY_HEADER_SIZE), 0
+        )
+        if listed_count == cst.LOBBY_CAPACITY:
+            return
+
+        # Append the game entry after the last listed entry and increment the listed count
+        self.box_game_lobby.replace(
+            cst.LOBBY_HEADER_SIZE + listed_count * cst.LOBBY_ENTRY_SIZE,
+            stc.GameLobbyEntry(
+                game_id=arc4.UInt64(game_id),
+                free_seats=arc4.UInt16(
+                    game_state.max_players.native - game_state.active_players.native
+                ),
+            ).bytes,
+        )
+        self.box_game_lobby.replace(0, op.extract(op.itob(listed_count + 1), 6, 2))
+
+        # Record the slot of the game entry in the game state
+        game_state.lobby_slot = arc4.UInt16(listed_count)
+
+    # Update the free seat count of a game listed in the open lobby index
+    @subroutine
+    def update_open_lobby(self, game_state: stc.GameState) -> None:
+        # An unlisted game has no entry to update
+        if game_state.lobby_slot.native == cst.NO_LOBBY_SLOT:
+            return
+
+        # Overwrite the free seat count of the game entry
+        self.box_game_lobby.replace(
+            cst.LOBBY_HEADER_SIZE
+            + game_state.lobby_slot.native * cst.LOBBY_ENTRY_SIZE
+            + 8,
+            arc4.UInt16(
+                game_state.max_players.native - game_state.active_players.native
+            ).bytes,
+        )
+
+    # Remove a game from the open lobby index by moving the last listed entry into its slot
+    @subroutine
+    def unlist_open_lobby(self, game_state: stc.GameState) -> None:
+        # An unlisted game has no entry to remove
+        lobby_slot = game_state.lobby_slot.native
+        if lobby_slot == cst.NO_LOBBY_SLOT:
+            return
+
+        # If the game entry is not the last one, move the last entry into its slot and update the moved game state
+        last_slot = (
+            op.extract_uint16(self.box_game_lobby.extract(0, cst.LOBBY_HEADER_SIZE), 0)
+            - 1
+        )
+        if lobby_slot != last_slot:
+            last_entry = self.box_game_lobby.extract(
+                cst.LOBBY_HEADER_SIZE + last_slot * cst.LOBBY_ENTRY_SIZE,
+                cst.LOBBY_ENTRY_SIZE,
+            )
+            self.box_game_lobby.replace(
+                cst.LOBBY_HEADER_SIZE + lobby_slot * cst.LOBBY_ENTRY_SIZE, last_entry
+            )
+            self.box_game_state[op.extract_uint64(last_entry, 0)].lobby_slot = (
+                arc4.UInt16(lobby_slot)
+            )
+
+        # Decrement the listed count and mark the game as unlisted
+        self.box_game_lobby.replace(0, op.extract(op.itob(last_slot), 6, 2))
+        game_state.lobby_slot = arc4.UInt16(cst.NO_LOBBY_SLOT)
+
+    # Push a retired game id onto the game pool bucket matching its page count
+    @subroutine
+    def push_retired_game(self, game_id: UInt64, page_count: UInt64) -> None:
+        # Link the retired game to the current bucket head using the first 8 bytes of its first players page box
+        # The page header and seat 0 bytes are dead while retired and are rewritten when the game is recycled
+        head_pos = (page_count - 1) * 8
+        game_players_bref = BoxRef(
+            key=self.box_game_players.key_prefix
+            + srt.game_players_page_key(game_id, UInt64(0))
+        )
+        game_players_bref.replace(0, self.box_game_pool.extract(head_pos, 8))
+
+        # The retired game becomes the new bucket head
+        self.box_game_pool.replace(head_pos, op.itob(game_id))
+
+    # Pop a retired game id from the game pool bucket matching the page count, return zero if the bucket is empty
+    @subroutine
+    def pop_retired_game(self, page_count: UInt64) -> UInt64:
+        # Without a game pool box there is nothing to recycle
+        if not self.box_game_pool:
+            return UInt64(0)
+
+        # Read the bucket head, a zero head means the bucket is empty
+        head_pos = (page_count - 1) * 8
+        game_id = op.extract_uint64(self.box_game_pool.extract(head_pos, 8), 0)
+        if game_id == 0:
+            return game_id
+
+        # Move the bucket head to the next retired game linked from the popped game's first players page box
+        game_players_bref = BoxRef(
+            key=self.box_game_players.key_prefix
+            + srt.game_players_page_key(game_id, UInt64(0))
+        )
+        self.box_game_pool.replace(head_pos, game_players_bref.extract(0, 8))
+
+        # Return the recycled game id
+        return game_id
+
+    # Close out a game instance before deleting or retiring it, return the admin account
+    @subroutine
+    def close_game(self, game_id: UInt64, game_state: stc.GameState) -> Account:
+        # Get the admin account address from the game state
+        admin = game_state.admin_address.native
+
+        # Fail transaction unless the assertions below evaluate True
+        assert game_state.max_players.native != 0, err.GAME_RETIRED
+        assert (
+            Txn.sender == admin or Txn.sender == Global.creator_address
+        ), err.INVALID_CALLER
+
+        # Retrieve the admin's game register data from its corresponding box, it is written back once below
+        admin_register = self.box_game_register[admin].copy()
+
+        # Ensure game has zero active players OR only player left is the admin of a game that is not live yet
+        if game_state.active_players.native == 1:
+            # A live game is settled via its game over path, the prize pool is not the admin's to take
+            assert not game_state.staking_finalized.native, err.STAKING_FINAL_FLAG
+            assert srt.is_seat_held(
+                game_id=game_id,
+                game_state=game_state,
+                box_game_seat=self.box_game_seat,
+                account=admin,
+            ), err.ADMIN_SOLE_PLAYER
+
+            # The admin is leaving their seat, release their game seat box and extend their game register expiry
+            del self.box_game_seat[srt.game_seat_key(game_id, admin)]
+            srt.extend_register_expiry(
+                game_register=admin_register,
+                round_delta=UInt64(cst.BOX_R_EXP_ROUND_DELTA),
+            )
+
+            # Issue prize pool payouts equal to admin stake plus their fee escrow, seed cache deposit and seat box MBR
+            srt.payout_itxn(
+                receiver=Txn.sender,
+                amount=game_state.prize_pool.native
+                + game_state.fee_escrow.native
+                + cst.BOX_E_COST,
+                note=String(
+                    'pieout:j{"method":"close_game","concern":"itxn.pay;prize_pool_admin_stake"}'
+                ),
+            )
+        # Otherwise, allow closing if active players and prize pool equal zero
+        else:
+            # Fail transaction unless the assertion below evaluates True
+            assert game_state.active_players.native == 0, err.NON_ZERO_ACTIVE_PLAYERS
+            assert game_state.prize_pool.native == 0, err.NON_ZERO_PRIZE_POOL
+
+        # Remove the game from the open lobby index if it is still listed
+        self.unlist_open_lobby(game_state)
+
+        # Set the hosting game flag in admin's game register to False and store it as new value of box
+        admin_register.hosting_game = arc4.Bool(False)  # noqa: FBT003
+        self.box_game_register[admin] = admin_register.copy()
+
+        # Return the admin account
+        return admin
+
+    # Check if game is live and execute its conditional logic
+    @subroutine
+    def is_game_live(self, game_id: UInt64, game_state: stc.GameState) -> None:
+        # Check game live criteria
+        if (
+            game_state.expiry_ts < Global.latest_timestamp  # If deadline expired
+            or game_state.active_players == game_state.max_players  # If lobby full
+            or srt.can_quick_play(game_state=game_state)  # If quick play conditions are met
+        ):
+            # Mark join phase as complete when staking finalized evaluates True
+            game_state.staking_finalized = arc4.Bool(True)  # noqa: FBT003
+
+            # Establish game play window by setting expiry timestamp
+            game_state.expiry_ts = arc4.UInt64(
+                Global.latest_timestamp + UInt64(cst.PHASE_EXPIRY_INTERVAL)
+            )
+
+            # Commit the whole roster to a future VRF Beacon round, so players need no commit call of their own
+            game_state.commit_round = arc4.UInt64(Global.round + cst.COMMIT_ROUND_DELTA)
+
+            # Emit ARC-28 event for off-chain tracking
+            arc4.emit(
+                "game_live(uint64,uint64,uint64,bool,uint64,uint64)",
+                self.next_event_seq(),
+                game_id,
+                srt.next_game_event_seq(game_state),
+                game_state.staking_finalized,
+                game_state.expiry_ts,
+                game_state.commit_round,
+            )
+
+    # Check if game is over and execute its conditional logic, return True if the game ended, else False
+    @subroutine
+    def is_game_over(self, game_id: UInt64, game_state: stc.GameState) -> bool:
+        # Check game over criteria
+        if srt.is_game_over_due(
+            game_id=game_id, game_state=game_state, box_game_seat=self.box_game_seat
+        ):
+            # Ensure transaction has sufficient opcode budget to resolve placements and credit shares
+            ensure_budget(
+                required_budget=cst.GAME_OVER_BUDGET, fee_source=OpUpFeeSource.GroupCredit
+            )
+
+            # Game seat boxes and players page boxes of remaining players are left as is, the generation bump marks them stale
+
+            # Mark every players page as having no live seats
+            game_state.live_pages = arc4.UInt64(0)
+
+            # The unspent seed cache deposit goes back to the admin, the fee escrow of seats left unplayed stays
+            # in the app and is refunded along with their stale game seat boxes
+            seed_refund = srt.calc_seed_deposit(game_state)
+
+            # Mark game as over by setting active players to zero
+            game_state.active_players = arc4.UInt16(0)
+
+            # Resolve the placement seat indices to player addresses, seats are not overwritten until the next round
+            first_place_address, second_place_address, third_place_address = (
+                srt.get_placement_addresses(
+                    game_id=game_id,
+                    game_state=game_state,
+                    box_game_players=self.box_game_players,
+                )
+            )
+
+            # Emit ARC-28 event for off-chain tracking
+            arc4.emit(
+                "game_over(uint64,uint64,uint64,uint8,uint8,uint8,address,address,address)",
+                self.next_event_seq(),
+                game_id,
+                srt.next_game_event_seq(game_state),
+                game_state.first_place_score,
+                game_state.second_place_score,
+                game_state.third_place_score,
+                arc4.Address(first_place_address),
+                arc4.Address(second_place_address),
+                arc4.Address(third_place_address),
+            )
+
+            # If only 1 player in lobby after game goes live, they get entire prize pool
+            if game_state.prize_pool.native == cst.STAKE_AMOUNT:
+                first_prize_share = game_state.prize_pool.native
+                second_prize_share = UInt64(0)
+                third_prize_share = UInt64(0)
+            # Elif, only 2 players in lobby after game goes live, split prize pool: 60% / remainder / 0
+            elif game_state.prize_pool.native == 2 * cst.STAKE_AMOUNT:
+                first_prize_share = game_state.prize_pool.native * UInt64(60) // UInt64(100)
+                second_prize_share = game_state.prize_pool.native - first_prize_share
+                third_prize_share = UInt64(0)  # No third player
+            # Else, split prize pool: 50% / 30% / remainder
+            else:
+                first_prize_share = game_state.prize_pool.native * UInt64(50) // UInt64(100)
+                second_prize_share = (
+                    game_state.prize_pool.native * UInt64(30) // UInt64(100)
+                )
+                third_prize_share = (
+                    game_state.prize_pool.native - first_prize_share - second_prize_share
+                )
+
+            # Resolve the receivers of the first, second and third place shares, only empty placements go to the admin
+            first_receiver = srt.resolve_share_receiver(
+                account=first_place_address, fallback=game_state.admin_address.native
+            )
+            second_receiver = srt.resolve_share_receiver(
+                account=second_place_address, fallback=game_state.admin_address.native
+            )
+            third_receiver = srt.resolve_share_receiver(
+                account=third_place_address, fallback=game_state.admin_address.native
+            )
+
+            # Merge the shares of placements going to the same receiver, e.g. the admin fallback
+            if second_receiver == first_receiver:
+                first_prize_share += second_prize_share
+                second_prize_share = UInt64(0)
+            if third_receiver == first_receiver:
+                first_prize_share += third_prize_share
+                third_prize_share = UInt64(0)
+            elif third_receiver == second_receiver:
+                second_prize_share += third_prize_share
+                third_prize_share = UInt64(0)
+
+            # Merge the seed cache refund into the share of the admin if they receive one, else credit it on its own
+            admin = game_state.admin_address.native
+            if first_receiver == admin:
+                first_prize_share += seed_refund
+            elif second_receiver == admin:
+                second_prize_share += seed_refund
+            elif third_receiver == admin:
+                third_prize_share += seed_refund
+            else:
+                self.credit_or_payout(receiver=admin, amount=seed_refund)
+
+            # Credit prize pool shares to each receiver once, a placed player who deleted their game register is paid directly
+            self.credit_or_payout(receiver=first_receiver, amount=first_prize_share)
+            self.credit_or_payout(receiver=second_receiver, amount=second_prize_share)
+            self.credit_or_payout(receiver=third_receiver, amount=third_prize_share)
+
+            # Set prize pool and fee escrow amounts to zero after crediting the shares
+            game_state.prize_pool = arc4.UInt64(0)
+            self.set_fee_escrow(game_id=game_id, game_state=game_state, fee_escrow=UInt64(0))
+
+            # Return True, game is over
+            return True
+
+        # Return False, game is not over
+        return False
+
+    # Settle the game if it is over, retiring its generation so the game seat boxes of remaining players go stale
+    # Return True if the game was settled, else False
+    @subroutine
+    def settle_if_game_over(self, game_id: UInt64, game_state: stc.GameState) -> bool:
+        if self.is_game_over(game_id=game_id, game_state=game_state):
+            game_state.generation = arc4.UInt64(self.next_game_generation())
+
+            # A game that ends before going live is still listed in the open lobby index
+            self.unlist_open_lobby(game_state)
+
+            # Promote the game ath candidate once the game is over, if the trophy has been minted
+            if self.box_game_trophy:
+                self.promote_ath_candidate(game_id=game_id, game_state=game_state)
+
+            # Return True, game was settled
+            return True
+
+        # Return False, game is not over
+        return False
+
+    # Promote the game topscorer to ath address if the game top score beats the ath score, return True if promoted
+    @subroutine
+    def promote_ath_candidate(self, game_id: UInt64, game_state: stc.GameState) -> bool:
+        # Retrieve the game trophy data from its box once, it is written back only if the ath changes
+        game_trophy = self.box_game_trophy.value.copy()
+
+        # Nothing to promote unless the game top score is higher than the ath score
+        if game_state.top_score <= game_trophy.ath_score:
+            return False
+
+        # If ath address is not empty and is not the topscorer already
+        if (
+            game_trophy.ath_address.native != Global.zero_address
+            and game_trophy.ath_address != game_state.topscorer_address
+        ):
+            # Use game trophy data to check account asset balance for trophy
+            asset_balance, asset_exists = op.AssetHoldingGet.asset_balance(
+                game_trophy.ath_address.native,
+                game_trophy.asset_id.native,
+            )
+
+            # If asset exists and its balance is 1, perform clawback via asset transfer inner transaction
+            if asset_exists and asset_balance == 1:
+                srt.clawback_itxn(
+                    asset_id=game_trophy.asset_id.native,
+                    asset_sender=game_trophy.ath_address.native,
+                    asset_receiver=Global.current_application_address,
+                    note=String(
+                        'pieout:j{"method":"promote_ath","subroutine:"clawback_itxn","concern":"itxn.asset_transfer;clawback_trophy_asset"}'
+                    ),
+                )
+
+        # Update ath score and ath address, the game topscorer is the new ath address
+        game_trophy.ath_score = game_state.top_score
+        game_trophy.ath_address = game_state.topscorer_address
+
+        # Update the game trophy box data with a copy containing its modified values
+        self.box_game_trophy.value = game_trophy.copy()
+
+        # Emit ARC-28 event for off-chain tracking
+        arc4.emit(
+            "ath_promoted(uint64,uint64,uint64,address,uint8)",
+            self.next_event_seq(),
+            game_id,
+            srt.next_game_event_seq(game_state),
+            game_trophy.ath_address,
+            game_trophy.ath_score,
+        )
+
+        # Return True since the ath changed
+        return True
+
     # Create a game register box that is a prerequiste to interact with game-related features
     @arc4.abimethod
     def get_box_game_register(self, box_r_pay: gtxn.PaymentTransaction) -> None:
@@ -196,11 +971,13 @@ class Pieout(ARC4Contract):
         self.box_game_register[Txn.sender] = stc.GameRegister(
             hosting_game=arc4.Bool(False),  # noqa: FBT003
             best_score=arc4.UInt8(0),
-            game_id=arc4.UInt64(0),
-            commit_rand_round=arc4.UInt64(0),
             expiry_round=arc4.UInt64(Global.round + cst.BOX_R_EXP_ROUND_DELTA),
+            claimable=arc4.UInt64(0),
         )
 
+        # Emit ARC-28 event for off-chain tracking
+        arc4.emit("register_created(uint64,address)", self.next_event_seq(), Txn.sender)
+
     # Delete the game register box data for their own account
     @arc4.abimethod
     def del_box_game_register_for_self(self) -> None:
@@ -208,21 +985,29 @@ class Pieout(ARC4Contract):
         assert Global.group_size == 1, err.STANDALONE_TXN_ONLY
         assert Txn.sender in self.box_game_register, err.BOX_NOT_FOUND
 
-        assert not self.box_game_register[Txn.sender].hosting_game.native, err.HOSTING_GAME_FLAG
+        # Retrieve the sender's game register data from its corresponding box
+        game_register = self.box_game_register[Txn.sender].copy()
 
-        assert (
-            self.box_game_register[Txn.sender].commit_rand_round.native == 0
-        ), err.NON_ZERO_COMMIT_RAND_ROUND
+        # Fail transaction unless the assertion below evaluates True
+        assert not game_register.hosting_game.native, err.HOSTING_GAME_FLAG
 
         # Delete game register box from the smart contract storage under sender key
         del self.box_game_register[Txn.sender]
 
-        # Issue MBR refund for game register box deletion via a payment inner transaction
+        # Emit ARC-28 event for off-chain tracking
+        arc4.emit(
+            "register_deleted(uint64,address,uint64)",
+            self.next_event_seq(),
+            Txn.sender,
+            cst.BOX_R_COST + game_register.claimable.native,
+        )
+
+        # Issue MBR refund for game register box deletion plus any unclaimed winnings via a payment inner transaction
         srt.payout_itxn(
             receiver=Txn.sender,
-            amount=UInt64(cst.BOX_R_COST),
+            amount=cst.BOX_R_COST + game_register.claimable.native,
             note=String(
-                'pieout:j{"method":"del_box_game_register_for_self","concern":"txn.app_c;mbr_box_r_refund"}'
+                'pieout:j{"method":"del_box_game_register_for_self","concern":"txn.app_c;mbr_box_r_refund+claimable"}'
             ),
         )
 
@@ -233,20 +1018,28 @@ class Pieout(ARC4Contract):
         assert Global.group_size == 1, err.STANDALONE_TXN_ONLY
 
         assert player in self.box_game_register, err.BOX_NOT_FOUND
-        assert not self.box_game_register[player].hosting_game.native, err.HOSTING_GAME_FLAG
 
-        assert (
-            self.box_game_register[player].commit_rand_round.native == 0
-        ), err.NON_ZERO_COMMIT_RAND_ROUND
+        # Retrieve the player's game register data from its corresponding box
+        game_register = self.box_game_register[player].copy()
+
+        # Fail transaction unless the assertion below evaluates True
+        assert not game_register.hosting_game.native, err.HOSTING_GAME_FLAG
 
         assert (
-            self.box_game_register[player].expiry_round.native < Global.round
+            game_register.expiry_round.native < Global.round
         ), err.TIME_CONSTRAINT_VIOLATION
 
-
         # Delete game register box from the smart contract storage under player key
         del self.box_game_register[player]
 
+        # Emit ARC-28 event for off-chain tracking
+        arc4.emit(
+            "register_deleted(uint64,address,uint64)",
+            self.next_event_seq(),
+            player,
+            cst.BOX_R_COST + game_register.claimable.native,
+        )
+
         # Resolve game register box deletion MBR refund receiver by priority
         receiver = srt.resolve_receiver_by_prio(
             acc1=player,
@@ -254,23 +1047,205 @@ class Pieout(ARC4Contract):
             acc3=Global.creator_address,
         )
 
-        # Issue MBR refund for game register box deletion via a payment inner transaction
-        srt.payout_itxn(
-            receiver=receiver,
-            amount=UInt64(cst.BOX_R_COST),
-            note=String(
-                'pieout:j{"method":"del_box_game_register_for_other","concern":"itxn.pay;mbr_box_c_refund"}'
-            ),
-        )
+        # Unclaimed winnings only ever go to the player, or to the creator if the player account is closed
+        claimable_receiver = srt.resolve_claimable_receiver(player)
+        claimable = game_register.claimable.native
+        if claimable_receiver == receiver:
+            # Issue MBR refund for game register box deletion plus any unclaimed winnings via a payment inner transaction
+            srt.payout_itxn(
+                receiver=receiver,
+                amount=cst.BOX_R_COST + claimable,
+                note=String(
+                    'pieout:j{"method":"del_box_game_register_for_other","concern":"itxn.pay;mbr_box_c_refund+claimable"}'
+                ),
+            )
+        else:
+            # Issue MBR refund for game register box deletion via a payment inner transaction
+            srt.payout_itxn(
+                receiver=receiver,
+                amount=UInt64(cst.BOX_R_COST),
+                note=String(
+                    'pieout:j{"method":"del_box_game_register_for_other","concern":"itxn.pay;mbr_box_c_refund"}'
+                ),
+            )
 
-    # Create new game instance with unique ID
+            # Issue any unclaimed winnings to their own receiver via a payment inner transaction
+            if claimable > 0:
+                srt.payout_itxn(
+                    receiver=claimable_receiver,
+                    amount=claimable,
+                    note=String(
+                        'pieout:j{"method":"del_box_game_register_for_other","concern":"itxn.pay;claimable"}'
+                    ),
+                )
+
+    # Allow any account to delete many expired game register boxes in one app call and collect the fallback refunds
+    # References needed: a game register box and an account per player, plus the creator account for the claimable
+    # fallback of closed player accounts, 3 players use 7 of the 8 references and all 4 account slots
     @arc4.abimethod
-    def new_game(
-        self,
-        quick_play_enabled: bool,  # noqa: FBT001
-        max_players: UInt64,
-        box_s_pay: gtxn.PaymentTransaction,
-        box_p_pay: gtxn.PaymentTransaction,
+    def sweep_box_game_registers(self, players: ta.GamePlayersArr) -> None:
+        # Fail transaction unless the assertion below evaluates True
+        assert players.length <= cst.BOX_R_SWEEP_MAX, err.SWEEP_LIMIT_EXCEEDED
+
+        # Delete every expired game register box, skip the rest instead of failing the sweep
+        sender_refund = UInt64(0)
+        for player_addr in players:
+            player = player_addr.native
+            if player in self.box_game_register:
+                # Retrieve the player's game register data from its corresponding box
+                game_register = self.box_game_register[player].copy()
+
+                if self.is_register_reclaimable(game_register):
+                    # Delete game register box from the smart contract storage under player key
+                    del self.box_game_register[player]
+
+                    # Resolve game register box deletion MBR refund receiver by priority
+                    receiver = srt.resolve_receiver_by_prio(
+                        acc1=player,
+                        acc2=Txn.sender,
+                        acc3=Global.creator_address,
+                    )
+                    refund = UInt64(cst.BOX_R_COST)
+
+                    # Unclaimed winnings only ever go to the player, or to the creator if the player account is closed
+                    claimable_receiver = srt.resolve_claimable_receiver(player)
+                    claimable = game_register.claimable.native
+                    if claimable_receiver == receiver:
+                        refund += claimable
+                        claimable = UInt64(0)
+
+                    # Emit ARC-28 event for off-chain tracking
+                    arc4.emit(
+                        "register_deleted(uint64,address,uint64)",
+                        self.next_event_seq(),
+                        player,
+                        cst.BOX_R_COST + game_register.claimable.native,
+                    )
+
+                    # MBR refunds falling back to the sender are aggregated into a single payment below
+                    if receiver == Txn.sender:
+                        sender_refund += refund
+                    # MBR refunds falling back to the app stay in its balance
+                    elif receiver != Global.current_application_address:
+                        srt.payout_itxn(
+                            receiver=receiver,
+                            amount=refund,
+                            note=String(
+                                'pieout:j{"method":"sweep_box_game_registers","concern":"itxn.pay;mbr_box_r_refund+claimable"}'
+                            ),
+                        )
+
+                    # Issue unclaimed winnings not merged into the MBR refund to their own receiver
+                    if claimable > 0:
+                        srt.payout_itxn(
+                            receiver=claimable_receiver,
+                            amount=claimable,
+                            note=String(
+                                'pieout:j{"method":"sweep_box_game_registers","concern":"itxn.pay;claimable"}'
+                            ),
+                        )
+
+        # Issue the aggregated MBR refund of the deleted game register boxes to the sender
+        if sender_refund > 0:
+            srt.payout_itxn(
+                receiver=Txn.sender,
+                amount=sender_refund,
+                note=String(
+                    'pieout:j{"method":"sweep_box_game_registers","concern":"itxn.pay;mbr_box_r_refund_fallback"}'
+                ),
+            )
+
+    # Allow any account to delete a game seat box left over from an ended game round or a deleted game
+    @arc4.abimethod
+    def del_box_game_seat(self, game_id: UInt64, player: Account) -> None:
+        # Fail transaction unless the assertion below evaluates True
+        assert Global.group_size == 1, err.STANDALONE_TXN_ONLY
+
+        # Retrieve the player's game seat box for the game, it is read once
+        game_seat_key = srt.game_seat_key(game_id, player)
+        game_seat, game_seat_exists = self.box_game_seat.maybe(game_seat_key)
+
+        # Fail transaction unless the assertion below evaluates True
+        assert game_seat_exists, err.BOX_NOT_FOUND
+
+        # A seat in the current round of an existing game is still held, it is released when its player plays
+        game_state, game_state_exists = self.box_game_state.maybe(game_id)
+        assert not (
+            game_state_exists and game_state.generation == game_seat.generation
+        ), err.SEAT_IN_USE
+
+        # Delete game seat box from the smart contract storage under game seat key
+        del self.box_game_seat[game_seat_key]
+
+        # Emit ARC-28 event for off-chain tracking
+        arc4.emit(
+            "seat_deleted(uint64,uint64,address,uint64)",
+            self.next_event_seq(),
+            game_id,
+            player,
+            arc4.UInt64(cst.BOX_E_COST + cst.PLAY_FEE_ESCROW),
+        )
+
+        # Resolve game seat box deletion MBR refund receiver by priority, the seat MBR and the fee escrow of the
+        # unplayed seat were deposited by the player
+        receiver = srt.resolve_receiver_by_prio(
+            acc1=player,
+            acc2=Global.creator_address,
+            acc3=Global.creator_address,
+        )
+
+        # Issue MBR refund for game seat box deletion via a payment inner transaction
+        srt.payout_itxn(
+            receiver=receiver,
+            amount=cst.BOX_E_COST + cst.PLAY_FEE_ESCROW,
+            note=String(
+                'pieout:j{"method":"del_box_game_seat","concern":"itxn.pay;mbr_box_e_refund+fee_escrow_refund"}'
+            ),
+        )
+
+    # Allow an account to collect the winnings credited to its game register across every game it placed in
+    @arc4.abimethod
+    def claim_winnings(self) -> None:
+        # Fail transaction unless the assertion below evaluates True
+        assert Global.group_size == 1, err.STANDALONE_TXN_ONLY
+        assert Txn.sender in self.box_game_register, err.BOX_NOT_FOUND
+
+        # Retrieve the claimable balance from the sender's game register box
+        game_register = self.box_game_register[Txn.sender].copy()
+        claimable = game_register.claimable.native
+
+        # Fail transaction unless the assertion below evaluates True
+        assert claimable > 0, err.NOTHING_TO_CLAIM
+
+        # Zero the claimable balance before paying it out
+        game_register.claimable = arc4.UInt64(0)
+        self.box_game_register[Txn.sender] = game_register.copy()
+
+        # Emit ARC-28 event for off-chain tracking
+        arc4.emit(
+            "winnings_claimed(uint64,address,uint64)",
+            self.next_event_seq(),
+            Txn.sender,
+            claimable,
+        )
+
+        # Issue the claimable balance payout to the sender via a payment inner transaction
+        srt.payout_itxn(
+            receiver=Txn.sender,
+            amount=claimable,
+            note=String(
+                'pieout:j{"method":"claim_winnings","concern":"itxn.pay;claimable_winnings"}'
+            ),
+        )
+
+    # Create new game instance with unique ID
+    @arc4.abimethod
+    def new_game(
+        self,
+        quick_play_enabled: bool,  # noqa: FBT001
+        max_players: UInt64,
+        box_s_pay: gtxn.PaymentTransaction,
+        box_p_pay: gtxn.PaymentTransaction,
         stake_pay: gtxn.PaymentTransaction,
     ) -> None:
         # Fail transaction unless the assertion below evaluates True
@@ -278,20 +1253,30 @@ class Pieout(ARC4Contract):
         assert self.box_game_trophy, err.BOX_NOT_FOUND
         assert Txn.sender in self.box_game_register, err.BOX_NOT_FOUND
 
-        assert not self.box_game_register[
-            Txn.sender
-        ].hosting_game.native, err.HOSTING_GAME_FLAG
+        # Retrieve the sender's game register data from its corresponding box
+        game_register = self.box_game_register[Txn.sender].copy()
+
+        # Fail transaction unless the assertion below evaluates True
+        assert not game_register.hosting_game.native, err.HOSTING_GAME_FLAG
 
         assert (
             max_players >= cst.MAX_PLAYERS_BOT_BOUND
             and max_players <= cst.MAX_PLAYERS_TOP_BOUND
         ), err.INVALID_MAX_PLAYERS
 
-        assert stake_pay.amount == cst.STAKE_AMOUNT, err.INVALID_STAKE_PAY_FEE
+        # The stake pay also deposits the game seat box MBR of the admin seat and the seed cache deposit
+        assert (
+            stake_pay.amount
+            == cst.STAKE_AMOUNT
+            + cst.PLAY_FEE_ESCROW
+            + cst.BOX_E_COST
+            + cst.SEED_CACHE_DEPOSIT
+        ), err.INVALID_STAKE_PAY_FEE
         assert box_s_pay.amount == cst.BOX_S_COST, err.INVALID_BOX_PAY_FEE
-        assert box_p_pay.amount == self.calc_single_box_cost(
-            key_size=arc4.UInt8(10),
-            value_size=arc4.UInt16(cst.ADDRESS_SIZE * max_players),
+        # Players page boxes are paid for upfront and created one at a time as seats fill up
+        page_count = srt.calc_players_page_count(max_players)
+        assert (
+            box_p_pay.amount == page_count * cst.BOX_P_PAGE_COST
         ), err.INVALID_BOX_PAY_FEE
 
         assert stake_pay.sender == Txn.sender, err.INVALID_STAKE_PAY_SENDER
@@ -308,43 +1293,110 @@ class Pieout(ARC4Contract):
             box_p_pay.receiver == Global.current_application_address
         ), err.INVALID_BOX_PAY_RECEIVER
 
-        # Create a game state box with unique game ID as key and assign its default starting values
-        self.box_game_state[self.game_id] = stc.GameState(
+        # Draw a retired game id from the game pool first, its boxes are reset in place instead of allocated
+        # Box MBR is a deposit, so recycling does not lower the host's box payments, they refund the retired admin's
+        # deposit in place of a delete, while the app skips creating the game state and players page boxes again
+        game_id = self.pop_retired_game(page_count)
+        pages_allocated = UInt64(1)
+        event_seq = UInt64(0)
+        if game_id != 0:
+            # Retrieve the retired game state, its admin deposited the MBR of the boxes being reused
+            retired_game_state = self.box_game_state[game_id].copy()
+            pages_allocated = retired_game_state.pages_allocated.native
+
+            # Keep counting events from the retired game state so the game ID sequence never restarts
+            event_seq = retired_game_state.event_seq.native
+
+            # Forward the box payments to the depositor of the reused boxes via a payment inner transaction
+            srt.payout_itxn(
+                receiver=srt.resolve_receiver_by_prio(
+                    acc1=retired_game_state.admin_address.native,
+                    acc2=Global.creator_address,
+                    acc3=Global.creator_address,
+                ),
+                amount=cst.BOX_S_COST + page_count * cst.BOX_P_PAGE_COST,
+                note=String(
+                    'pieout:j{"method":"new_game","concern":"itxn.pay;recycled_box_s_mbr+box_p_mbr_forward"}'
+                ),
+            )
+        else:
+            # Take a fresh unique game id and increment it by 1 for the next new game instance
+            game_id = self.game_id
+            self.game_id += 1
+
+            # Create the first players page box with the game ID and page index 0 as key
+            # Assign zeroed bytes to store the page header and a page of player addresses (32 bytes per player)
+            self.box_game_players[srt.game_players_page_key(game_id, UInt64(0))] = (
+                op.bzero(cst.PLAYERS_PAGE_SIZE)
+            )
+
+        # Define the game state of the new game instance with its default starting values
+        game_state = stc.GameState(
             staking_finalized=arc4.Bool(False),  # noqa: FBT003
             quick_play_enabled=arc4.Bool(quick_play_enabled),
-            max_players=arc4.UInt8(max_players),
-            active_players=arc4.UInt8(1),
+            max_players=arc4.UInt16(max_players),
+            active_players=arc4.UInt16(1),
             first_place_score=arc4.UInt8(0),
             second_place_score=arc4.UInt8(0),
             third_place_score=arc4.UInt8(0),
             top_score=arc4.UInt8(0),
             box_p_start_pos=arc4.UInt16(cst.ADDRESS_SIZE),
+            page_count=arc4.UInt8(page_count),
+            pages_allocated=arc4.UInt8(pages_allocated),
+            live_pages=arc4.UInt64(0),
+            lobby_slot=arc4.UInt16(cst.NO_LOBBY_SLOT),
             expiry_ts=arc4.UInt64(Global.latest_timestamp + cst.PHASE_EXPIRY_INTERVAL),
-            prize_pool=arc4.UInt64(stake_pay.amount),
+            commit_round=arc4.UInt64(0),
+            prize_pool=arc4.UInt64(cst.STAKE_AMOUNT),
+            fee_escrow=arc4.UInt64(0),  # Set below once the game created event is emitted
+            generation=arc4.UInt64(self.next_game_generation()),
+            event_seq=arc4.UInt64(event_seq),
+            first_place_seat=arc4.UInt16(cst.NO_SEAT_IDX),
+            second_place_seat=arc4.UInt16(cst.NO_SEAT_IDX),
+            third_place_seat=arc4.UInt16(cst.NO_SEAT_IDX),
             admin_address=arc4.Address(Txn.sender),
-            first_place_address=arc4.Address(Global.zero_address),
-            second_place_address=arc4.Address(Global.zero_address),
-            third_place_address=arc4.Address(Global.zero_address),
             topscorer_address=arc4.Address(Global.zero_address),
         )
 
-        # Set the hosting game flag property in sender's game register box to True
-        self.box_game_register[Txn.sender].hosting_game = arc4.Bool(
-            True  # noqa: FBT003
+        # Set the hosting game flag property in sender's game register to True
+        game_register.hosting_game = arc4.Bool(True)  # noqa: FBT003
+
+        # For the first players page box, seat the sender at index 0
+        self.take_game_seat(
+            game_id=game_id,
+            game_state=game_state,
+            game_register=game_register,
+            player=Txn.sender,
+            seat_idx=UInt64(0),
         )
 
-        # Create a game players box with unique game ID as key
-        # Assign zeroed bytes to store all player addresses (32 bytes per player)
-        self.box_game_players[self.game_id] = op.bzero(cst.ADDRESS_SIZE * max_players)
+        # Update the game register box data with a copy containing its modified values
+        self.box_game_register[Txn.sender] = game_register.copy()
 
-        # For game players box, replace the sender's address at index 0
-        game_players_bref = BoxRef(
-            key=self.box_game_players.key_prefix + op.itob(self.game_id)
+        # List the game in the open lobby index so it can be discovered by joining players
+        self.list_open_lobby(game_id=game_id, game_state=game_state)
+
+        # Emit ARC-28 event for off-chain tracking
+        arc4.emit(
+            "game_created(uint64,uint64,uint64,address,uint16,bool,uint64)",
+            self.next_event_seq(),
+            game_id,
+            srt.next_game_event_seq(game_state),
+            game_state.admin_address,
+            game_state.max_players,
+            game_state.quick_play_enabled,
+            game_state.expiry_ts,
         )
-        game_players_bref.replace(0, Txn.sender.bytes)
 
-        # Increment game id by 1 for next new game instance
-        self.game_id += 1
+        # Escrow the admin play fee and seed cache deposit
+        self.set_fee_escrow(
+            game_id=game_id,
+            game_state=game_state,
+            fee_escrow=cst.PLAY_FEE_ESCROW + cst.SEED_CACHE_DEPOSIT,
+        )
+
+        # Create or overwrite the game state box with the game ID as key and store the game state as its value
+        self.box_game_state[game_id] = game_state.copy()
 
     # Join existing game instance
     @arc4.abimethod
@@ -366,18 +1418,14 @@ class Pieout(ARC4Contract):
         assert self.box_game_trophy, err.BOX_NOT_FOUND
         assert Txn.sender in self.box_game_register, err.BOX_NOT_FOUND
 
-        assert stake_pay.amount == cst.STAKE_AMOUNT, err.INVALID_STAKE_PAY_FEE
+        # The stake pay also deposits the game seat box MBR of the player seat
+        assert (
+            stake_pay.amount == cst.STAKE_AMOUNT + cst.PLAY_FEE_ESCROW + cst.BOX_E_COST
+        ), err.INVALID_STAKE_PAY_FEE
         assert stake_pay.sender == Txn.sender, err.INVALID_STAKE_PAY_SENDER
         assert (
             stake_pay.receiver == Global.current_application_address
         ), err.INVALID_STAKE_PAY_RECEIVER
-        assert not srt.check_acc_in_game(
-            game_id=game_id,
-            account=Txn.sender,
-            box_game_players=self.box_game_players,
-            player_count=self.box_game_state[game_id].active_players.native,
-            clear_player=False,
-        ), err.PLAYER_ACTIVE
 
         assert not game_state.staking_finalized.native, err.STAKING_FINAL_FLAG
         assert (
@@ -389,70 +1437,74 @@ class Pieout(ARC4Contract):
             < cst.ADDRESS_SIZE * game_state.max_players.native
         ), err.BOX_P_START_POS_OVERFLOW
 
-        # For game players box, store the sender's address at the current game state box p_ start position
+        # Find the seat at the current box p start position and the players page box holding it
+        seat_idx = game_state.box_p_start_pos.native // cst.ADDRESS_SIZE
+        page_idx = seat_idx // cst.PLAYERS_PAGE_SEATS
         game_players_bref = BoxRef(
-            key=self.box_game_players.key_prefix + op.itob(game_id)
+            key=self.box_game_players.key_prefix
+            + srt.game_players_page_key(game_id, page_idx)
+        )
+
+        # If the seat opens a page that was paid for but not created yet, create it and add it to the directory
+        if page_idx == game_state.pages_allocated.native:
+            game_players_bref.create(size=cst.PLAYERS_PAGE_SIZE)
+            game_state.pages_allocated = arc4.UInt8(page_idx + 1)
+
+        # Seat the sender, a player may hold seats in many games but only one seat per game round
+        game_register = self.box_game_register[Txn.sender].copy()
+        self.take_game_seat(
+            game_id=game_id,
+            game_state=game_state,
+            game_register=game_register,
+            player=Txn.sender,
+            seat_idx=seat_idx,
         )
-        game_players_bref.replace(game_state.box_p_start_pos.native, Txn.sender.bytes)
+
+        # Update the game register box data with a copy containing its modified values
+        self.box_game_register[Txn.sender] = game_register.copy()
 
         # Increment number of active players by 1
-        game_state.active_players = arc4.UInt8(game_state.active_players.native + 1)
+        game_state.active_players = arc4.UInt16(game_state.active_players.native + 1)
+
+        # Emit ARC-28 event for off-chain tracking
+        arc4.emit(
+            "player_joined(uint64,uint64,uint64,address,uint16,uint16)",
+            self.next_event_seq(),
+            game_id,
+            srt.next_game_event_seq(game_state),
+            Txn.sender,
+            arc4.UInt16(seat_idx),
+            game_state.active_players,
+        )
 
         # Increment current game players box offset by 32 so that next player address can be stored
         game_state.box_p_start_pos = arc4.UInt16(
             game_state.box_p_start_pos.native + cst.ADDRESS_SIZE
         )
 
-        # Increment prize pool by stake payment amount
+        # Increment prize pool by stake amount and fee escrow by play fee escrow amount
         game_state.prize_pool = arc4.UInt64(
-            game_state.prize_pool.native + stake_pay.amount
+            game_state.prize_pool.native + cst.STAKE_AMOUNT
+        )
+        self.set_fee_escrow(
+            game_id=game_id,
+            game_state=game_state,
+            fee_escrow=game_state.fee_escrow.native + cst.PLAY_FEE_ESCROW,
         )
 
         # Check if game is live on every call
-        srt.is_game_live(game_id=game_id, game_state=game_state)
-
-        # Copy the modified game state and store it as new value of box
-        self.box_game_state[game_id] = game_state.copy()
+        self.is_game_live(game_id=game_id, game_state=game_state)
 
-    # Set a commitment that will be used to get on-chain randomness and play the game
-    @arc4.abimethod
-    def set_game_commit(
-        self,
-        game_id: UInt64,
-    ) -> None:
-        # Fail transaction unless the assertion below evaluates True
-        assert Global.group_size == 1, err.STANDALONE_TXN_ONLY
-        assert game_id in self.box_game_state, err.GAME_ID_NOT_FOUND
-        assert Txn.sender in self.box_game_register, err.BOX_NOT_FOUND
-        assert self.box_game_state[
-            game_id
-        ].staking_finalized.native, err.STAKING_FINAL_FLAG
-        assert (
-            srt.check_acc_in_game(  # noqa: E712
-                game_id=game_id,
-                account=Txn.sender,
-                box_game_players=self.box_game_players,
-                player_count=self.box_game_state[game_id].max_players.native,
-                clear_player=False,
-            )
-            == True
-        ), err.PLAYER_NOT_FOUND
-
-        # Retrieve current game register data from box using the game id parameter
-        game_register = self.box_game_register[
-            Txn.sender
-        ].copy()  # Make a copy of the game state else immutable
-
-        # Fail transaction unless the assertion below evaluates True
-        assert game_register.commit_rand_round == 0, err.NON_ZERO_COMMIT_RAND_ROUND
-
-        # Update game register box data commit rand round and game id properties with new values
-        game_register.commit_rand_round = arc4.UInt64(Global.round + 4)
-        game_register.game_id = arc4.UInt64(game_id)
+        # Remove the game from the open lobby index once live, else update its free seat count
+        if game_state.staking_finalized.native:
+            self.unlist_open_lobby(game_state)
+        else:
+            self.update_open_lobby(game_state)
 
         # Copy the modified game state and store it as new value of box
-        self.box_game_register[Txn.sender] = game_register.copy()
+        self.box_game_state[game_id] = game_state.copy()
 
+    # DEPRECATED: Only needed by the two-call `play_game` path, `play_game_v2` does not use it
     # Make app call to add extra resource reference budget, must be grouped w/ play game abimethod
     @arc4.abimethod
     def up_ref_budget_for_play_game(self, game_id: UInt64) -> None:
@@ -471,218 +1523,464 @@ class Pieout(ARC4Contract):
         ), err.INVALID_METHOD_SELECTOR
 
         assert second_txn.app_args(1) == op.itob(game_id), err.INVALID_GAME_ID
-        assert second_txn.app_args(1) == op.itob(
-            self.box_game_register[Txn.sender].game_id.native
-        )
-        assert self.box_game_register[Txn.sender].game_id.native == game_id
-
-    # Play the game, resolve the player's score associated with the game instance, update game state accordingly
-    @arc4.abimethod
-    def play_game(self, game_id: UInt64) -> None:
-        # Ensure transaction has sufficient opcode budget
-        ensure_budget(required_budget=19600, fee_source=OpUpFeeSource.GroupCredit)
-
-        # Get the first transaction in the group
-        first_txn = gtxn.ApplicationCallTransaction(group_index=0)
+        assert (
+            srt.game_seat_key(game_id, Txn.sender) in self.box_game_seat
+        ), err.PLAYER_NOT_FOUND
 
+    # Retrieve the game state of a live game instance whose play window is still open
+    @subroutine
+    def load_live_game(self, game_id: UInt64) -> stc.GameState:
         # Fail transaction unless the assertion below evaluates True
-        assert Global.group_size == 2, err.INVALID_GROUP_SIZE
-        assert Txn.group_index == 1, err.INVALID_GROUP_IDX
-
         assert game_id in self.box_game_state, err.GAME_ID_NOT_FOUND
-        assert Txn.sender in self.box_game_register, err.BOX_NOT_FOUND
-        assert self.box_game_trophy, err.BOX_NOT_FOUND
-
-        assert first_txn.app_id == Global.current_application_id, err.APP_ID_MISMATCH
-        assert first_txn.sender == Txn.sender, err.SENDER_MISMATCH
-        assert first_txn.app_args(0) == arc4.arc4_signature(
-            "up_ref_budget_for_play_game(uint64)void"
-        ), err.INVALID_METHOD_SELECTOR
-
-        assert first_txn.app_args(1) == Txn.application_args(1), err.INVALID_GAME_ID
-        assert first_txn.app_args(1) == op.itob(
-            self.box_game_register[Txn.sender].game_id.native
-        )
-
-        assert (
-            srt.check_acc_in_game(  # noqa: E712
-                game_id=game_id,
-                account=Txn.sender,
-                box_game_players=self.box_game_players,
-                player_count=self.box_game_state[game_id].max_players.native,
-                clear_player=True,
-            )
-            == True
-        ), err.PLAYER_NOT_FOUND
 
         # Retrieve the game state data from its corresponding box using the game id parameter
         game_state = self.box_game_state[
             game_id
         ].copy()  # Make a copy of the game state else immutable
 
-        # Retrieve the game register data from its corresponding box using the game id parameter
-        game_register = self.box_game_register[
-            Txn.sender
-        ].copy()  # Make a copy of the game state else immutable
-
         # Fail transaction unless the assertions below evaluate True
         assert game_state.staking_finalized.native, err.STAKING_FINAL_FLAG
         assert (
             game_state.expiry_ts >= Global.latest_timestamp
         ), err.TIME_CONSTRAINT_VIOLATION
-        assert (
-            self.box_game_register[Txn.sender].game_id.native == game_id
-        ), err.INVALID_GAME_ID
-        assert (
-            Global.round >= self.box_game_register[Txn.sender].commit_rand_round.native
-        ), err.COMMIT_RAND_ROUND_NOT_REACHED
+
+        # Return the game state
+        return game_state
+
+    # Retrieve the game register of a player, it is read once and passed along instead of indexed again
+    @subroutine
+    def load_player_register(self, player: Account) -> stc.GameRegister:
+        # Fail transaction unless the assertion below evaluates True
+        assert player in self.box_game_register, err.BOX_NOT_FOUND
+
+        # Retrieve the game register data from its corresponding box using the player account
+        return self.box_game_register[
+            player
+        ].copy()  # Make a copy of the game register else immutable
+
+    # Retrieve the game seat box of a player in a game, it is read once and passed along instead of indexed again
+    @subroutine
+    def load_game_seat(self, game_id: UInt64, player: Account) -> stc.GameSeat:
+        # Fail transaction unless the assertion below evaluates True
+        game_seat_key = srt.game_seat_key(game_id, player)
+        assert game_seat_key in self.box_game_seat, err.PLAYER_NOT_FOUND
+
+        # Retrieve the game seat data from its corresponding box using the game seat key
+        return self.box_game_seat[
+            game_seat_key
+        ].copy()  # Make a copy of the game seat else immutable
+
+    # Return True if the player is seated in the current game round and the game commit round has matured, else False
+    @subroutine
+    def is_play_resolvable(
+        self,
+        game_state: stc.GameState,
+        game_seat: stc.GameSeat,
+    ) -> bool:
+        # A game seat box is deleted once its player plays, so a current generation seat is still occupied
+        return (
+            game_seat.generation == game_state.generation
+            and Global.round >= game_state.commit_round.native
+        )
+
+    # Return the VRF beacon output of a round, calling the beacon only if no player has cached it yet
+    @subroutine
+    def get_round_seed(
+        self, game_id: UInt64, commit_round: UInt64, game_state: stc.GameState
+    ) -> Bytes:
+        # If an earlier player already filled the round seed cache, return the cached value
+        round_seed, round_seed_exists = self.box_round_seed.maybe(commit_round)
+        if round_seed_exists:
+            return round_seed
 
         # Call the Randomness Beacon smart contract that computes the VRF and outputs a randomness value
-        seed = arc4.abi_call[Bytes](
+        round_seed = arc4.abi_call[Bytes](
             "must_get(uint64,byte[])byte[]",
-            self.box_game_register[Txn.sender].commit_rand_round.native,
-            Txn.sender.bytes,
-            app_id=600011887,  # TestNet VRF Beacon Application ID
+            commit_round,
+            Bytes(),  # No user data, the round seed is shared by every player who committed to this round
+            app_id=TemplateVar[UInt64](
+                "VRF_BEACON_APP_ID"
+            ),  # VRF Beacon Application ID, a stub beacon on LocalNet
         )[0]
 
+        # Cache the round seed only if the admin seed cache deposit is unspent, the fee escrow deposits of seated
+        # players are kept for their refunds (the box MBR is refunded to whoever prunes it)
+        if srt.calc_seed_deposit(game_state) >= cst.BOX_V_COST:
+            self.set_fee_escrow(
+                game_id=game_id,
+                game_state=game_state,
+                fee_escrow=game_state.fee_escrow.native - cst.BOX_V_COST,
+            )
+            self.box_round_seed[commit_round] = round_seed
+
+        # Return the round seed
+        return round_seed
+
+    # Resolve a player's committed play, update the given game state and reset the player's game register
+    @subroutine
+    def resolve_play(
+        self,
+        game_id: UInt64,
+        game_state: stc.GameState,
+        game_register: stc.GameRegister,
+        game_seat: stc.GameSeat,
+        player: Account,
+    ) -> UInt64:
+        # Fail transaction unless the assertions below evaluate True
+        assert game_seat.generation == game_state.generation, err.PLAYER_NOT_FOUND
+        # Every seated player is committed to the game commit round, set once when the game goes live
+        commit_round = game_state.commit_round.native
+        assert commit_round != 0, err.COMMIT_RAND_START_VALUES
+        assert Global.round >= commit_round, err.COMMIT_RAND_ROUND_NOT_REACHED
+
+        # Vacate the player's seat now that they are playing their turn and release their game seat box
+        seat_idx = game_seat.seat_idx.native
+        srt.vacate_seat(
+            game_id=game_id,
+            game_state=game_state,
+            box_game_players=self.box_game_players,
+            seat_idx=seat_idx,
+        )
+        del self.box_game_seat[srt.game_seat_key(game_id, player)]
+
+        # Emit ARC-28 event for off-chain tracking
+        arc4.emit(
+            "seat_cleared(uint64,uint64,uint64,uint16)",
+            self.next_event_seq(),
+            game_id,
+            srt.next_game_event_seq(game_state),
+            arc4.UInt16(seat_idx),
+        )
+
+        # Derive the player seed from the shared round seed, binding it to the player address and the game id
+        seed = op.sha512_256(
+            self.get_round_seed(game_id, commit_round, game_state)
+            + player.bytes
+            + op.itob(game_id)
+        )
+
         # Calculate player score and assign placement if their score qualifies
-        srt.calc_score_get_place(
+        score = srt.calc_score_get_place(
             game_id=game_id,
             game_state=game_state,
             game_register=game_register,
-            player=Txn.sender,
+            box_leaderboard=self.box_leaderboard,
+            player=player,
+            seat_idx=seat_idx,
             seed=seed,  # NOTE: IMPORANT: Use VRF output as seed outside LocalNet env
         )
 
-        # If game state first place score is higher than ath score
-        if game_state.first_place_score > self.box_game_trophy.value.ath_score:
-            # Update ath score, game state first place score is the ath score
-            self.box_game_trophy.value.ath_score = game_state.first_place_score
+        # Emit ARC-28 event for off-chain tracking
+        arc4.emit(
+            "player_score(uint64,uint64,uint64,address,uint8)",
+            self.next_event_seq(),
+            game_id,
+            srt.next_game_event_seq(game_state),
+            player,
+            arc4.UInt8(score),
+        )
 
-            # If ath address is not empty
-            if self.box_game_trophy.value.ath_address.native != Global.zero_address:
-                # Use box game trophy data to check account asset balance for trophy
-                asset_balance, asset_exists = op.AssetHoldingGet.asset_balance(
-                    self.box_game_trophy.value.ath_address.native,
-                    self.box_game_trophy.value.asset_id.native,
-                )
+        # The game top score and topscorer address recorded above are the ath candidate, promoted on game over
+        # or via `promote_ath`, so scoring never touches the trophy box
 
-                # If asset exists and its balance is 1, perform clawback via asset transfer inner transaction
-                if asset_exists and asset_balance == 1:
-                    srt.clawback_itxn(
-                        asset_id=self.box_game_trophy.value.asset_id.native,
-                        asset_sender=self.box_game_trophy.value.ath_address.native,
-                        asset_receiver=Global.current_application_address,
-                        note=String(
-                            'pieout:j{"method":"play_game","subroutine:"clawback_itxn","concern":"itxn.asset_transfer;clawback_trophy_asset"}'
-                        ),
-                    )
+        # Decrement number of active players by 1 and release the player's deposit from the fee escrow
+        game_state.active_players = arc4.UInt16(game_state.active_players.native - 1)
+        self.set_fee_escrow(
+            game_id=game_id,
+            game_state=game_state,
+            fee_escrow=game_state.fee_escrow.native - cst.PLAY_FEE_ESCROW,
+        )
 
-            # Update ath address, transaction sender is the new ath address
-            self.box_game_trophy.value.ath_address = arc4.Address(Txn.sender)
+        # A player resolving their own play did not use their fee escrow, it is refunded with the seat box MBR,
+        # else it goes to the keeper who resolved the play
+        refund = UInt64(cst.BOX_E_COST)
+        keeper_fee = UInt64(cst.PLAY_FEE_ESCROW)
+        if player == Txn.sender:
+            refund += keeper_fee
+            keeper_fee = UInt64(0)
+
+        # Credit the refund to the player's claimable balance
+        game_register.claimable = arc4.UInt64(
+            game_register.claimable.native + refund
+        )
 
-        # Decrement number of active players by 1
-        game_state.active_players = arc4.UInt8(game_state.active_players.native - 1)
+        # Emit ARC-28 event for off-chain tracking
+        arc4.emit(
+            "claimable_credited(uint64,address,uint64)",
+            self.next_event_seq(),
+            player,
+            arc4.UInt64(refund),
+        )
 
-        # Reset game commit values in game register box after score is obtained
-        game_register.game_id = arc4.UInt64(0)
-        game_register.commit_rand_round = arc4.UInt64(0)
-        game_register.expiry_round = arc4.UInt64(
-            Global.round + UInt64(cst.BOX_R_EXP_ROUND_DELTA)
+        # Extend the game register expiry after score is obtained
+        srt.extend_register_expiry(
+            game_register=game_register,
+            round_delta=UInt64(cst.BOX_R_EXP_ROUND_DELTA),
         )
 
         # Update the game register box data with a copy containing its modified values
-        self.box_game_register[Txn.sender] = game_register.copy()
+        self.box_game_register[player] = game_register.copy()
+
+        # Return the fee escrow owed to the keeper who resolved the play, zero if the player resolved it
+        return keeper_fee
+
+    # DEPRECATED: Use `play_game_v2`, this two-call path is kept until all clients migrate
+    # Play the game, resolve the player's score associated with the game instance, update game state accordingly
+    @arc4.abimethod
+    def play_game(self, game_id: UInt64) -> None:
+        # Get the first transaction in the group
+        first_txn = gtxn.ApplicationCallTransaction(group_index=0)
+
+        # Fail transaction unless the assertion below evaluates True
+        assert Global.group_size == 2, err.INVALID_GROUP_SIZE
+        assert Txn.group_index == 1, err.INVALID_GROUP_IDX
+
+        assert first_txn.app_id == Global.current_application_id, err.APP_ID_MISMATCH
+        assert first_txn.sender == Txn.sender, err.SENDER_MISMATCH
+        assert first_txn.app_args(0) == arc4.arc4_signature(
+            "up_ref_budget_for_play_game(uint64)void"
+        ), err.INVALID_METHOD_SELECTOR
+        assert first_txn.app_args(1) == Txn.application_args(1), err.INVALID_GAME_ID
+
+        # Resolve the sender's score and update the game state
+        game_state = self.load_live_game(game_id)
+        self.resolve_play(
+            game_id=game_id,
+            game_state=game_state,
+            game_register=self.load_player_register(Txn.sender),
+            game_seat=self.load_game_seat(game_id=game_id, player=Txn.sender),
+            player=Txn.sender,
+        )
 
         # Check if game is over on every call
-        srt.is_game_over(
+        self.settle_if_game_over(game_id=game_id, game_state=game_state)
+
+        # Update the game state box data with a copy containing its modified values
+        self.box_game_state[game_id] = game_state.copy()
+
+    # Play the game in a single app call, the play that ends the game also settles it
+    # References needed: game state, sender players page, game seat, game register and round seed boxes, VRF Beacon app
+    # The final play also needs the trophy and leaderboard boxes, the placement players pages and the placement and
+    # admin game registers, more than the 8 references of one app call, so a play that may end the game must be
+    # preceded by an `up_ref_budget_for_play_game_batch` call (two if the placements span several players pages)
+    @arc4.abimethod
+    def play_game_v2(self, game_id: UInt64) -> None:
+        # Fail transaction unless the assertion below evaluates True
+        assert Txn.group_index == Global.group_size - 1, err.INVALID_GROUP_IDX
+
+        # Resolve the sender's score and update the game state
+        game_state = self.load_live_game(game_id)
+        self.resolve_play(
             game_id=game_id,
             game_state=game_state,
-            box_game_register=self.box_game_register,
-            box_game_players=self.box_game_players,
+            game_register=self.load_player_register(Txn.sender),
+            game_seat=self.load_game_seat(game_id=game_id, player=Txn.sender),
+            player=Txn.sender,
         )
 
+        # Check if game is over on every call
+        self.settle_if_game_over(game_id=game_id, game_state=game_state)
+
         # Update the game state box data with a copy containing its modified values
         self.box_game_state[game_id] = game_state.copy()
 
-    # Allow any valid account to check and trigger game event progression
+    # Make app call to add extra resource reference budget, must be grouped w/ play game batch or v2 abimethod
     @arc4.abimethod
-    def trigger_game_event(self, game_id: UInt64, trigger_id: arc4.UInt8) -> None:
+    def up_ref_budget_for_play_game_batch(self, game_id: UInt64) -> None:
+        # Get the last transaction in the group
+        last_txn = gtxn.ApplicationCallTransaction(group_index=Global.group_size - 1)
+
         # Fail transaction unless the assertion below evaluates True
-        assert Global.group_size == 1, err.STANDALONE_TXN_ONLY
-        assert game_id in self.box_game_state, err.GAME_ID_NOT_FOUND
+        assert Txn.group_index < Global.group_size - 1, err.INVALID_GROUP_IDX
+        assert last_txn.app_id == Global.current_application_id, err.APP_ID_MISMATCH
+        assert last_txn.sender == Txn.sender, err.SENDER_MISMATCH
+        assert last_txn.app_args(0) == arc4.arc4_signature(
+            "play_game_batch(uint64,address[])void"
+        ) or last_txn.app_args(0) == arc4.arc4_signature(
+            "play_game_v2(uint64)void"
+        ), err.INVALID_METHOD_SELECTOR
+        assert last_txn.app_args(1) == op.itob(game_id), err.INVALID_GAME_ID
 
-        # Retrieve current game state data from its corresponding box using the game id parameter
-        game_state = self.box_game_state[
-            game_id
-        ].copy()  # Make a copy of the game state else immutable
+    # Allow any account to act as a keeper and resolve the matured commitments of many players in one app call
+    @arc4.abimethod
+    def play_game_batch(self, game_id: UInt64, players: ta.GamePlayersArr) -> None:
+        # Fail transaction unless the assertion below evaluates True
+        assert Txn.group_index == Global.group_size - 1, err.INVALID_GROUP_IDX
 
-        # Trigger ID 0 corresponds w/ event: Game Live
-        if trigger_id.native == 0:
-            # Fail transaction unless the assertion below evaluates True
-            assert not game_state.staking_finalized.native, err.STAKING_FINAL_FLAG
+        # Retrieve the game state of the live game instance
+        game_state = self.load_live_game(game_id)
 
-            # Special case: Check if the admin is the only active player, if true, just end the game
-            if game_state.active_players.native == 1 and srt.check_acc_in_game(
-                game_id=game_id,
-                account=game_state.admin_address.native,
-                box_game_players=self.box_game_players,
-                player_count=UInt64(1),
-                clear_player=False,
+        # Resolve every player with a matured commitment, skip the rest instead of failing the batch
+        keeper_refund = UInt64(0)
+        for player_addr in players:
+            # A player without a game register box has nothing to resolve
+            if player_addr.native not in self.box_game_register:
+                continue
+
+            # Retrieve the player's game seat box once, it is shared by the resolvable check and the resolution
+            game_seat, game_seat_exists = self.box_game_seat.maybe(
+                srt.game_seat_key(game_id, player_addr.native)
+            )
+            if game_seat_exists and self.is_play_resolvable(
+                game_state=game_state,
+                game_seat=game_seat.copy(),
             ):
-                srt.is_game_over(
+                # Ensure transaction has sufficient opcode budget to resolve the next play
+                ensure_budget(
+                    required_budget=cst.PLAY_RESOLVE_BUDGET,
+                    fee_source=OpUpFeeSource.GroupCredit,
+                )
+                keeper_refund += self.resolve_play(
                     game_id=game_id,
                     game_state=game_state,
-                    box_game_register=self.box_game_register,
-                    box_game_players=self.box_game_players,
+                    game_register=self.box_game_register[player_addr.native].copy(),
+                    game_seat=game_seat.copy(),
+                    player=player_addr.native,
                 )
 
-                # Update the game state box data with a copy containing its modified values
-                self.box_game_state[game_id] = game_state.copy()
+        # Refund the keeper the fee escrow released by the plays it resolved for other players
+        if keeper_refund > 0:
+            srt.payout_itxn(
+                receiver=Txn.sender,
+                amount=keeper_refund,
+                note=String(
+                    'pieout:j{"method":"play_game_batch","concern":"itxn.pay;keeper_fee_escrow_refund"}'
+                ),
+            )
 
-                # Make an early return
-                return
+        # Check if game is over once for the whole batch
+        self.settle_if_game_over(game_id=game_id, game_state=game_state)
 
-            # Fail transaction unless the assertion below evaluates True
-            assert (
-                game_state.expiry_ts
-                < Global.latest_timestamp  # Game live timer must expired, OR
-                or srt.can_quick_play(
-                    game_state=game_state
-                )  # Quick play conditions are met
-            ), err.INVALID_TRIGGER_CONDITIONS
+        # Update the game state box data with a copy containing its modified values
+        self.box_game_state[game_id] = game_state.copy()
 
-            # Check if game is live
-            srt.is_game_live(game_id=game_id, game_state=game_state)
+    # Allow any account to prune the cached seeds of old rounds and collect their refunded box MBR
+    @arc4.abimethod
+    def prune_round_seeds(self, rounds: arc4.DynamicArray[arc4.UInt64]) -> None:
+        # Fail transaction unless the assertion below evaluates True
+        assert Global.group_size == 1, err.STANDALONE_TXN_ONLY
 
-        # Trigger ID 2 corresponds w/ event: Game Over
-        elif trigger_id.native == 2:
-            # Fail transaction unless the assertion below evaluates True
-            assert game_state.staking_finalized.native, err.STAKING_FINAL_FLAG
-            assert (
-                game_state.expiry_ts < Global.latest_timestamp
-            ), err.TIME_CONSTRAINT_VIOLATION
+        # Delete every cached round seed old enough to prune, skip the rest instead of failing
+        prune_refund = UInt64(0)
+        for commit_round in rounds:
+            if (
+                commit_round.native in self.box_round_seed
+                and commit_round.native + cst.BOX_V_PRUNE_ROUND_DELTA < Global.round
+            ):
+                del self.box_round_seed[commit_round.native]
+                prune_refund += cst.BOX_V_COST
 
-            # Check if game is over
-            srt.is_game_over(
-                game_id=game_id,
-                game_state=game_state,
-                box_game_register=self.box_game_register,
-                box_game_players=self.box_game_players,
+        # Issue MBR refund of the deleted round seed boxes to the pruner via payment inner transaction, the bounty
+        # that makes pruning worth a call
+        if prune_refund > 0:
+            srt.payout_itxn(
+                receiver=Txn.sender,
+                amount=prune_refund,
+                note=String(
+                    'pieout:j{"method":"prune_round_seeds","concern":"itxn.pay;box_v_mbr_refund"}'
+                ),
             )
 
-            # Update the game state box data with a copy containing its modified values
-            self.box_game_state[game_id] = game_state.copy()
+    # Apply a game event to a game instance, return False w/o changes if the event conditions are not met
+    @subroutine
+    def apply_game_event(
+        self, game_id: UInt64, game_state: stc.GameState, trigger_id: UInt64
+    ) -> bool:
+        # A retired game instance has no game events to progress
+        if game_state.max_players.native == 0:
+            return False
 
-            # Make an early return
-            return
+        # Trigger ID 0 corresponds w/ event: Game Live
+        if trigger_id == 0:
+            # Game must still be in the staking phase
+            if game_state.staking_finalized.native:
+                return False
+
+            # Special case: If the admin is the only active player, just end the game, the game over check reads
+            # the admin's game seat box so it is not read here as well
+            if game_state.active_players.native == 1 and self.settle_if_game_over(
+                game_id=game_id, game_state=game_state
+            ):
+                # Update the game state box data with a copy containing its modified values
+                self.box_game_state[game_id] = game_state.copy()
+                return True
 
-        # Else, trigger id is not found, fail transaction
+            # Game live timer must be expired, OR quick play conditions must be met
+            if not (
+                game_state.expiry_ts < Global.latest_timestamp
+                or srt.can_quick_play(game_state=game_state)
+            ):
+                return False
+
+            # Check if game is live
+            self.is_game_live(game_id=game_id, game_state=game_state)
+
+            # Remove the game from the open lobby index once live
+            if game_state.staking_finalized.native:
+                self.unlist_open_lobby(game_state)
+
+        # Trigger ID 2 corresponds w/ event: Game Over
+        elif trigger_id == 2:
+            # Game must be live, hold a prize pool and be due to end, the game over check settles it if it is due
+            if not (
+                game_state.staking_finalized.native
+                and game_state.prize_pool.native > 0
+                and self.settle_if_game_over(game_id=game_id, game_state=game_state)
+            ):
+                return False
+
+        # Else, trigger id is not found
         else:
-            assert False, err.TRIGGER_ID_NOT_FOUND  # noqa: B011
+            return False
 
         # Update the game state box data with a copy containing its modified values
         self.box_game_state[game_id] = game_state.copy()
+        return True
+
+    # Allow any valid account to check and trigger game event progression
+    @arc4.abimethod
+    def trigger_game_event(self, game_id: UInt64, trigger_id: arc4.UInt8) -> None:
+        # Fail transaction unless the assertion below evaluates True
+        assert Global.group_size == 1, err.STANDALONE_TXN_ONLY
+        assert game_id in self.box_game_state, err.GAME_ID_NOT_FOUND
+        assert (
+            trigger_id.native == 0 or trigger_id.native == 2
+        ), err.TRIGGER_ID_NOT_FOUND
+
+        # Retrieve current game state data from its corresponding box using the game id parameter
+        game_state = self.box_game_state[
+            game_id
+        ].copy()  # Make a copy of the game state else immutable
+
+        # Fail transaction unless the assertion below evaluates True
+        assert game_state.staking_finalized.native == (
+            trigger_id.native == 2
+        ), err.STAKING_FINAL_FLAG
+
+        # Apply the game event, fail transaction if its conditions are not met
+        assert self.apply_game_event(
+            game_id=game_id, game_state=game_state, trigger_id=trigger_id.native
+        ), err.INVALID_TRIGGER_CONDITIONS
+
+    # Allow any account to act as a keeper and trigger the game events of many game instances in one app call
+    @arc4.abimethod
+    def trigger_game_events(
+        self,
+        game_ids: arc4.DynamicArray[arc4.UInt64],
+        trigger_ids: arc4.DynamicArray[arc4.UInt8],
+    ) -> None:
+        # Fail transaction unless the assertion below evaluates True
+        assert game_ids.length == trigger_ids.length, err.TRIGGER_ARGS_MISMATCH
+
+        # Apply every game event whose conditions are met, skip the rest instead of failing the batch
+        for i in urange(game_ids.length):
+            game_id = game_ids[i].native
+            if game_id in self.box_game_state:
+                self.apply_game_event(
+                    game_id=game_id,
+                    game_state=self.box_game_state[game_id].copy(),
+                    trigger_id=trigger_ids[i].native,
+                )
 
     # Allow admin to reset an existing game instance
     @arc4.abimethod
@@ -702,7 +2000,13 @@ class Pieout(ARC4Contract):
         assert (
             stake_pay.receiver == Global.current_application_address
         ), err.INVALID_STAKE_PAY_RECEIVER
-        assert stake_pay.amount >= cst.STAKE_AMOUNT, err.INVALID_STAKE_PAY_FEE
+        assert (
+            stake_pay.amount
+            >= cst.STAKE_AMOUNT
+            + cst.PLAY_FEE_ESCROW
+            + cst.BOX_E_COST
+            + cst.SEED_CACHE_DEPOSIT
+        ), err.INVALID_STAKE_PAY_FEE
 
         # Retrieve current game state data from its corresponding box using the game id parameter
         game_state = self.box_game_state[
@@ -710,19 +2014,29 @@ class Pieout(ARC4Contract):
         ].copy()  # Make a copy of the game state else immutable
 
         # Fail transaction unless the assertion below evaluates True
+        assert game_state.max_players.native != 0, err.GAME_RETIRED
         assert game_state.admin_address == Txn.sender, err.INVALID_ADMIN
         assert game_state.prize_pool.native == 0, err.NON_ZERO_PRIZE_POOL
         assert game_state.active_players.native == 0, err.NON_ZERO_ACTIVE_PLAYERS
 
-        # For game players box, replace the sender's address at start index 0
-        game_players_bref = BoxRef(
-            key=self.box_game_players.key_prefix + op.itob(game_id)
+        # Retrieve the sender's game register data from its corresponding box
+        game_register = self.box_game_register[Txn.sender].copy()
+
+        # For the first players page box, seat the sender at start index 0
+        self.take_game_seat(
+            game_id=game_id,
+            game_state=game_state,
+            game_register=game_register,
+            player=Txn.sender,
+            seat_idx=UInt64(0),
         )
-        game_players_bref.replace(0, Txn.sender.bytes)
+
+        # Update the game register box data with a copy containing its modified values
+        self.box_game_register[Txn.sender] = game_register.copy()
 
         # Reset game state properties back to their default starting values
         game_state.staking_finalized = arc4.Bool(False)  # noqa: FBT003
-        game_state.active_players = arc4.UInt8(1)
+        game_state.active_players = arc4.UInt16(1)
         game_state.first_place_score = arc4.UInt8(0)
         game_state.second_place_score = arc4.UInt8(0)
         game_state.third_place_score = arc4.UInt8(0)
@@ -730,12 +2044,13 @@ class Pieout(ARC4Contract):
         game_state.expiry_ts = arc4.UInt64(
             Global.latest_timestamp + cst.PHASE_EXPIRY_INTERVAL
         )
+        game_state.commit_round = arc4.UInt64(0)
         game_state.prize_pool = arc4.UInt64(
             game_state.prize_pool.native + cst.STAKE_AMOUNT
         )
-        game_state.first_place_address = arc4.Address(Global.zero_address)
-        game_state.second_place_address = arc4.Address(Global.zero_address)
-        game_state.third_place_address = arc4.Address(Global.zero_address)
+        game_state.first_place_seat = arc4.UInt16(cst.NO_SEAT_IDX)
+        game_state.second_place_seat = arc4.UInt16(cst.NO_SEAT_IDX)
+        game_state.third_place_seat = arc4.UInt16(cst.NO_SEAT_IDX)
 
         # If caller sets change_quick_play bool as True
         if change_quick_play:
@@ -752,78 +2067,216 @@ class Pieout(ARC4Contract):
                 and new_max_players <= cst.MAX_PLAYERS_TOP_BOUND
             ), err.INVALID_MAX_PLAYERS
 
+            # New max players must fit inside the players page boxes paid for at game creation
+            assert (
+                srt.calc_players_page_count(new_max_players)
+                <= game_state.page_count.native
+            ), err.INVALID_MAX_PLAYERS
+
             # Update the old max players value with the new value
-            game_state.max_players = arc4.UInt8(new_max_players)
+            game_state.max_players = arc4.UInt16(new_max_players)
+
+        # List the game in the open lobby index again now that it is back in the staking phase
+        self.list_open_lobby(game_id=game_id, game_state=game_state)
+
+        # Emit ARC-28 event for off-chain tracking
+        arc4.emit(
+            "game_reset(uint64,uint64,uint64,uint16,bool,uint64)",
+            self.next_event_seq(),
+            game_id,
+            srt.next_game_event_seq(game_state),
+            game_state.max_players,
+            game_state.quick_play_enabled,
+            game_state.expiry_ts,
+        )
+
+        # Escrow the admin play fee and seed cache deposit
+        self.set_fee_escrow(
+            game_id=game_id,
+            game_state=game_state,
+            fee_escrow=cst.PLAY_FEE_ESCROW + cst.SEED_CACHE_DEPOSIT,
+        )
 
         # Copy the modified game state and store it as new value of box
         self.box_game_state[game_id] = game_state.copy()
 
+    # Make app call to add extra resource reference budget, must be grouped w/ delete game or delete retired game abimethod
+    @arc4.abimethod
+    def up_ref_budget_for_delete_game(self, game_id: UInt64) -> None:
+        # Get the last transaction in the group
+        last_txn = gtxn.ApplicationCallTransaction(group_index=Global.group_size - 1)
+
+        # Fail transaction unless the assertion below evaluates True
+        assert Txn.group_index < Global.group_size - 1, err.INVALID_GROUP_IDX
+        assert last_txn.app_id == Global.current_application_id, err.APP_ID_MISMATCH
+        assert last_txn.sender == Txn.sender, err.SENDER_MISMATCH
+        assert last_txn.app_args(0) == arc4.arc4_signature(
+            "delete_game(uint64)void"
+        ) or last_txn.app_args(0) == arc4.arc4_signature(
+            "delete_retired_game(uint64,uint64)void"
+        ), err.INVALID_METHOD_SELECTOR
+        assert last_txn.app_args(1) == op.itob(game_id), err.INVALID_GAME_ID
+
     # Allow application creator or admin to delete an existing game instance
+    # References needed: game state box, admin game register box, open lobby box and every allocated players page box
+    # A game with more players pages than one app call can reference may be preceded by
+    # `up_ref_budget_for_delete_game` calls that only add resource references
     @arc4.abimethod
     def delete_game(
         self,
         game_id: UInt64,
+    ) -> None:
+        # Fail transaction unless the assertions below evaluate True
+        assert Txn.group_index == Global.group_size - 1, err.INVALID_GROUP_IDX
+        assert game_id in self.box_game_state, err.GAME_ID_NOT_FOUND
+
+        # Retrieve current game state data from its corresponding box using the game id parameter
+        game_state = self.box_game_state[
+            game_id
+        ].copy()  # Make a copy of the game state else immutable
+
+        # Close out the game instance, paying back the admin stake if the admin is the sole remaining player
+        self.close_game(game_id=game_id, game_state=game_state)
+
+        # Delete box game state and every created players page box from the smart contract storage
+        del self.box_game_state[game_id]
+        for page_idx in urange(game_state.pages_allocated.native):
+            del self.box_game_players[srt.game_players_page_key(game_id, page_idx)]
+
+        # Emit ARC-28 event for off-chain tracking
+        arc4.emit(
+            "game_deleted(uint64,uint64,uint64)",
+            self.next_event_seq(),
+            game_id,
+            srt.next_game_event_seq(game_state),
+        )
+
+        # Calculate box game players fee, every page paid for at game creation is refunded
+        box_p_cost = game_state.page_count.native * cst.BOX_P_PAGE_COST
+
+        # Issue MBR refund for game state box and game players box deletion via a payment inner transaction
+        srt.payout_itxn(
+            receiver=Txn.sender,
+            amount=cst.BOX_S_COST + box_p_cost,
+            note=String(
+                'pieout:j{"method":"delete_game","concern":"itxn.pay;box_s_mbr_refund+box_p_mbr_refund"}'
+            ),
+        )
+
+    # Allow application creator or admin to retire an existing game instance to the game pool instead of deleting it
+    @arc4.abimethod
+    def retire_game(
+        self,
+        game_id: UInt64,
     ) -> None:
         # Fail transaction unless the assertions below evaluate True
         assert Global.group_size == 1, err.STANDALONE_TXN_ONLY
         assert game_id in self.box_game_state, err.GAME_ID_NOT_FOUND
+        assert self.box_game_pool, err.BOX_NOT_FOUND
 
         # Retrieve current game state data from its corresponding box using the game id parameter
         game_state = self.box_game_state[
             game_id
         ].copy()  # Make a copy of the game state else immutable
 
-        # Get the admin account address from the game state box
-        admin = self.box_game_state[game_id].admin_address.native
+        # Close out the game instance, paying back the admin stake if the admin is the sole remaining player
+        self.close_game(game_id=game_id, game_state=game_state)
+
+        # Mark the game as retired, the admin stays on record as the depositor of the game boxes MBR
+        game_state.max_players = arc4.UInt16(0)
+        game_state.staking_finalized = arc4.Bool(True)  # noqa: FBT003
+        game_state.active_players = arc4.UInt16(0)
+        game_state.prize_pool = arc4.UInt64(0)
+        game_state.live_pages = arc4.UInt64(0)
+        game_state.generation = arc4.UInt64(self.next_game_generation())
+
+        # Emit ARC-28 event for off-chain tracking
+        arc4.emit(
+            "game_retired(uint64,uint64,uint64)",
+            self.next_event_seq(),
+            game_id,
+            srt.next_game_event_seq(game_state),
+        )
+
+        # Clear the fee escrow, an unspent one was paid back to the admin when closing the game
+        self.set_fee_escrow(game_id=game_id, game_state=game_state, fee_escrow=UInt64(0))
+
+        # Update the game state box data with a copy containing its modified values
+        self.box_game_state[game_id] = game_state.copy()
+
+        # Push the game id onto the game pool bucket matching its page count
+        self.push_retired_game(game_id=game_id, page_count=game_state.page_count.native)
+
+    # Allow application creator or the retired admin to delete a retired game instance and refund its box MBR
+    # Previous game ID is the game pool entry linking to the game, or zero if the game is its bucket head
+    # A game with more players pages than one app call can reference may be preceded by
+    # `up_ref_budget_for_delete_game` calls that only add resource references
+    @arc4.abimethod
+    def delete_retired_game(self, game_id: UInt64, prev_game_id: UInt64) -> None:
+        # Fail transaction unless the assertions below evaluate True
+        assert Txn.group_index == Global.group_size - 1, err.INVALID_GROUP_IDX
+        assert game_id in self.box_game_state, err.GAME_ID_NOT_FOUND
+
+        # Retrieve current game state data from its corresponding box using the game id parameter
+        game_state = self.box_game_state[
+            game_id
+        ].copy()  # Make a copy of the game state else immutable
 
         # Fail transaction unless the assertions below evaluate True
+        assert game_state.max_players.native == 0, err.GAME_NOT_RETIRED
+        admin = game_state.admin_address.native
         assert (
             Txn.sender == admin or Txn.sender == Global.creator_address
         ), err.INVALID_CALLER
 
-        # Ensure game has zero active players OR only player left is the admin
-        if game_state.active_players.native == 1:
-            assert srt.check_acc_in_game(
-                game_id=game_id,
-                account=admin,
-                box_game_players=self.box_game_players,
-                player_count=UInt64(1),
-                clear_player=False,
-            ), err.ADMIN_SOLE_PLAYER
-
-            # Issue prize pool payouts equal to admin stake
-            srt.payout_itxn(
-                receiver=Txn.sender,
-                amount=game_state.prize_pool.native,
-                note=String(
-                    'pieout:j{"method":"delete_game","concern":"itxn.pay;prize_pool_admin_stake"}'
-                ),
-            )
-        # Otherwise, allow deletion if active players and prize pool equal zero
+        # Read the link to the next retired game from the first 8 bytes of the game's first players page box
+        page_count = game_state.page_count.native
+        head_pos = (page_count - 1) * 8
+        next_link = BoxRef(
+            key=self.box_game_players.key_prefix
+            + srt.game_players_page_key(game_id, UInt64(0))
+        ).extract(0, 8)
+
+        # Unlink the game from its game pool bucket, either as the bucket head or from the previous pool entry
+        if prev_game_id == 0:
+            assert self.box_game_pool.extract(head_pos, 8) == op.itob(
+                game_id
+            ), err.INVALID_POOL_LINK
+            self.box_game_pool.replace(head_pos, next_link)
         else:
-            # Fail transaction unless the assertion below evaluates True
-            assert game_state.active_players.native == 0, err.NON_ZERO_ACTIVE_PLAYERS
-            assert game_state.prize_pool.native == 0, err.NON_ZERO_PRIZE_POOL
+            assert (
+                self.box_game_state[prev_game_id].max_players.native == 0
+            ), err.INVALID_POOL_LINK
+            prev_bref = BoxRef(
+                key=self.box_game_players.key_prefix
+                + srt.game_players_page_key(prev_game_id, UInt64(0))
+            )
+            assert prev_bref.extract(0, 8) == op.itob(game_id), err.INVALID_POOL_LINK
+            prev_bref.replace(0, next_link)
 
-        # Delete box game state and box game players from the smart contract storage
+        # Delete box game state and every created players page box from the smart contract storage
         del self.box_game_state[game_id]
-        del self.box_game_players[game_id]
-
-        # Set the hosting game flag in admin's game register box to False
-        self.box_game_register[admin].hosting_game = arc4.Bool(False)  # noqa: FBT003
-
-        # Calculate box game players fee
-        box_p_cost = self.calc_single_box_cost(
-            key_size=arc4.UInt8(10),
-            value_size=arc4.UInt16(cst.ADDRESS_SIZE * game_state.max_players.native),
+        for page_idx in urange(game_state.pages_allocated.native):
+            del self.box_game_players[srt.game_players_page_key(game_id, page_idx)]
+
+        # Emit ARC-28 event for off-chain tracking
+        arc4.emit(
+            "game_deleted(uint64,uint64,uint64)",
+            self.next_event_seq(),
+            game_id,
+            srt.next_game_event_seq(game_state),
         )
 
-        # Issue MBR refund for game state box and game players box deletion via a payment inner transaction
+        # Issue MBR refund for game state box and every players page box paid for to the retired admin who deposited it
         srt.payout_itxn(
-            receiver=Txn.sender,
-            amount=cst.BOX_S_COST + box_p_cost,
+            receiver=srt.resolve_receiver_by_prio(
+                acc1=admin,
+                acc2=Global.creator_address,
+                acc3=Global.creator_address,
+            ),
+            amount=cst.BOX_S_COST + page_count * cst.BOX_P_PAGE_COST,
             note=String(
-                'pieout:j{"method":"delete_game","concern":"itxn.pay;box_s_mbr_refund+box_p_mbr_refund"}'
+                'pieout:j{"method":"delete_retired_game","concern":"itxn.pay;retired_box_s_mbr_refund+box_p_mbr_refund"}'
             ),
         )
 
@@ -837,14 +2290,15 @@ class Pieout(ARC4Contract):
         # Check if game trophy box exists
         if self.box_game_trophy:
             # Use game trophy box data asset id property to check app account asset balance for trophy
+            trophy_asset_id = self.box_game_trophy.value.asset_id.native
             asset_balance, asset_exists = op.AssetHoldingGet.asset_balance(
                 Global.current_application_address,
-                self.box_game_trophy.value.asset_id.native,
+                trophy_asset_id,
             )
             # If asset exists and its balance is 1, perform burn via asset config inner transaction
             if asset_exists and asset_balance == 1:
                 srt.burn_itxn(
-                    asset_id=self.box_game_trophy.value.asset_id.native,
+                    asset_id=trophy_asset_id,
                     note=String(
                         'pieout:j{"method":"terminate","concern":"itxn.asset_config;burn_trophy_asset"}'
                     ),
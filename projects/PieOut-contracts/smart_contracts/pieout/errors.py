@@ -24,13 +24,14 @@ INVALID_TRIGGER_CONDITIONS: Final[str] = "Conditions required to trigger this ga
 GAME_ID_NOT_FOUND: Final[str] = "Box game state not found. Check if game ID exists."
 PLAYER_NOT_FOUND: Final[str] = "Account is not recognized as an active player for this game."
 TRIGGER_ID_NOT_FOUND: Final[str] = "Game event not found. Check if game event Trigger ID exists"
+TRIGGER_ARGS_MISMATCH: Final[str] = "Game ID and Trigger ID arrays must have the same number of entries."
 BOX_NOT_FOUND: Final[str] = "Box not found. Ensure the box you are trying to access was created and still exists."
 BOX_FOUND: Final[str] = "Box found. Ensure the box you are trying to access does not exist already."
 STANDALONE_TXN_ONLY: Final[str] = "Invalid group size. This app call can only take standalone transactions."
-PLAYER_ACTIVE: Final[str] = "Player with this address must not be an active game participant in the game."
+PLAYER_ACTIVE: Final[str] = "Player with this address is already seated in the current round of this game."
+SEAT_IN_USE: Final[str] = "Game seat box is still held by the current round of its game and can not be deleted."
 NON_ZERO_ACTIVE_PLAYERS: Final[str] = "Game lobby not empty. Number of active players must be zero."
 NON_ZERO_PRIZE_POOL: Final[str] = "Prize pool not empty. Amount in prize pool must be zero."
-NON_ZERO_COMMIT_RAND_ROUND: Final[str] = "Commit Rand Round not empty. Value must be zero to obtain a valid one."
 FULL_GAME_LOBBY: Final[str] = "Number of active players must not exceed number of max players."
 TIME_CONSTRAINT_VIOLATION: Final[str] = "Invalid time frame. Call made outside the permitted block or timestamp range."
 STAKING_FINAL_FLAG: Final[str] = "Game state staking finalized boolean value mismatch."
@@ -42,4 +43,12 @@ APP_ID_MISMATCH: Final[str] = "Application ID mismatch. App ID must be same acro
 COMMIT_RAND_ROUND_NOT_REACHED: Final[str] = "Randomness commit round not reached yet."
 COMMIT_RAND_START_VALUES: Final[str] = "Box Commit Rand fields must not have their default starting values."
 ASSET_OPT_IN_REQUIRED: Final[str] = "Account must be opted in to asset in order to perform this action."
+SWEEP_LIMIT_EXCEEDED: Final[str] = "Number of game register boxes to sweep exceeds the max num allowed per call."
+INVALID_PAGE_COUNT: Final[str] = "Page count exceeds the max num of entries that fit inside a single ABI return value."
+NOTHING_TO_CLAIM: Final[str] = "Game register claimable balance is zero. There are no winnings to claim."
+INVALID_LEADERBOARD_CAPACITY: Final[str] = "Leaderboard capacity must be at least one and must not exceed the max capacity."
+ATH_NOT_BEATEN: Final[str] = "Game top score does not beat the all-time highest score. There is no ath to promote."
+GAME_RETIRED: Final[str] = "Game instance is retired to the game pool and can not be used until it is recycled."
+GAME_NOT_RETIRED: Final[str] = "Game instance is not retired to the game pool. Use delete game for live instances."
+INVALID_POOL_LINK: Final[str] = "Previous game ID arg must be the game pool entry linking to the game ID arg."
 DELETEABLE_NOT_TRUE: Final[str] = "Template variable 'DELETABLE' needs to be 'True' at deploy-time."
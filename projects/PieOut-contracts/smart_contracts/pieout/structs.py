@@ -6,20 +6,57 @@ from algopy import arc4
 class GameState(arc4.Struct):
     staking_finalized: arc4.Bool  # If True, game is live, else players can join
     quick_play_enabled: arc4.Bool  # If True, admin can start live phase
-    max_players: arc4.UInt8  # Max num of players per game instance
-    active_players: arc4.UInt8  # Active num of players currently
+    max_players: arc4.UInt16  # Max num of players per game instance, zero if retired to the game pool
+    active_players: arc4.UInt16  # Active num of players currently
     first_place_score: arc4.UInt8  # First place score per round
     second_place_score: arc4.UInt8  # Second place score per round
     third_place_score: arc4.UInt8  # Third place score per round
     top_score: arc4.UInt8  # Top score for this game instance
-    box_p_start_pos: arc4.UInt16  # Index where to add new address bytes to players box
+    box_p_start_pos: arc4.UInt16  # Index where to add new address bytes across all players page boxes
+    page_count: arc4.UInt8  # Num of players page boxes paid for at game creation
+    pages_allocated: arc4.UInt8  # Num of players page boxes created so far, pages are created in order
+    live_pages: arc4.UInt64  # Bitmap of players page boxes with at least one live seat, bit i is page i
+    lobby_slot: arc4.UInt16  # Index of the game entry inside the open lobby index box, NO_LOBBY_SLOT if unlisted
     expiry_ts: arc4.UInt64  # Expiry timestamp of game phase, queue or live
+    commit_round: arc4.UInt64  # VRF Beacon commitment round shared by every seated player, set when game goes live
     prize_pool: arc4.UInt64  # Prize pool amount for payouts
+    fee_escrow: arc4.UInt64  # Fee escrow deposited by players to refund keepers who resolve their plays
+    generation: arc4.UInt64  # Current game generation, game seat boxes of an older generation are stale
+    event_seq: arc4.UInt64  # Sequence number of the last event emitted for this game ID, outlives game generations
+    first_place_seat: arc4.UInt16  # First place seat index per round, NO_SEAT_IDX if empty
+    second_place_seat: arc4.UInt16  # Second place seat index per round, NO_SEAT_IDX if empty
+    third_place_seat: arc4.UInt16  # Third place seat index per round, NO_SEAT_IDX if empty
     admin_address: arc4.Address  # Game creator address, assigned as admin
-    first_place_address: arc4.Address  # First place address per round
-    second_place_address: arc4.Address  # Second place address per round
-    third_place_address: arc4.Address  # Third place address per round
-    topscorer_address: arc4.Address  # Topscorer address for this game instance
+    topscorer_address: arc4.Address  # Topscorer address for this game instance, outlives the seats of a round
+
+
+# Struct containing a game state entry of a paged game states read
+class GameStateEntry(arc4.Struct):
+    game_id: arc4.UInt64  # Game ID of the game state
+    state: GameState  # Game state values
+
+
+# Struct containing the roster summary of a game instance for lobby listings
+class GameRosterSummary(arc4.Struct):
+    game_id: arc4.UInt64  # Game ID of the game instance
+    staking_finalized: arc4.Bool  # If True, game is live, else players can join
+    active_players: arc4.UInt16  # Active num of players currently
+    max_players: arc4.UInt16  # Max num of players per game instance
+    expiry_ts: arc4.UInt64  # Expiry timestamp of game phase, queue or live
+    prize_pool: arc4.UInt64  # Prize pool amount for payouts
+    admin_address: arc4.Address  # Game creator address, assigned as admin
+
+
+# Struct containing an open lobby index entry
+class GameLobbyEntry(arc4.Struct):
+    game_id: arc4.UInt64  # Game ID of the open lobby
+    free_seats: arc4.UInt16  # Num of seats still available to join
+
+
+# Struct containing a leaderboard entry
+class LeaderboardEntry(arc4.Struct):
+    score: arc4.UInt8  # Personal best score of the ranked player
+    player_address: arc4.Address  # Ranked player address
 
 
 # Struct containing game trophy values
@@ -33,8 +70,13 @@ class GameTrophy(arc4.Struct):
 class GameRegister(arc4.Struct):
     hosting_game: arc4.Bool  # Track if user is already hosting a game
     best_score: arc4.UInt8  # User personal best score across all games played on app
-    game_id: arc4.UInt64  # Game ID user has made a commitment towards playing
-    commit_rand_round: arc4.UInt64  # VRF Beacon smart contract commitment round value
     expiry_round: (
         arc4.UInt64
     )  # Round after which registration expires and box can be deleted by others
+    claimable: arc4.UInt64  # Winnings and seat box refunds credited to user and not claimed yet
+
+
+# Struct containing the seat a player holds in a game instance, one box per game and player
+class GameSeat(arc4.Struct):
+    generation: arc4.UInt64  # Generation of the game at the time user was seated, stale once the game moves on
+    seat_idx: arc4.UInt16  # Index of the seat user occupies across the game players page boxes
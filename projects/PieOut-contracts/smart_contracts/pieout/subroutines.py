@@ -5,14 +5,16 @@ from algopy import (
     BoxRef,
     Bytes,
     Global,
+    OpUpFeeSource,
     String,
+    TemplateVar,
     Txn,
     UInt64,
     arc4,
+    ensure_budget,
     itxn,
     op,
     subroutine,
-    urange,
 )
 from lib_pcg import pcg16_init, pcg16_random
 
@@ -81,98 +83,446 @@ def resolve_receiver_by_prio(
         return Global.current_application_address
 
 
-# Reset game commit values inside the game register box back to their initial default state
+# Resolve the receiver of a player's unclaimed winnings, the player or the creator if the player account is closed
 @subroutine
-def reset_game_commit_values(
-    box_game_register: BoxMap[Account, stc.GameRegister],
-    account: Account,
+def resolve_claimable_receiver(player: Account) -> Account:
+    if op.AcctParamsGet.acct_balance(player)[1]:
+        return player
+    return Global.creator_address
+
+
+# Increment the per-game event sequence number stored in the game state and return its new value
+@subroutine
+def next_game_event_seq(game_state: stc.GameState) -> UInt64:
+    game_state.event_seq = arc4.UInt64(game_state.event_seq.native + 1)
+    return game_state.event_seq.native
+
+
+# Resolve the account receiving a placement share, use the fallback account for an empty placement
+@subroutine
+def resolve_share_receiver(account: Account, fallback: Account) -> Account:
+    # A placed player always keeps their share, only an empty placement falls back
+    if account == Global.zero_address:
+        return fallback
+    return account
+
+
+# Calculate the unspent seed cache deposit, the fee escrow less the deposits of seated players yet to play
+@subroutine
+def calc_seed_deposit(game_state: stc.GameState) -> UInt64:
+    return (
+        game_state.fee_escrow.native
+        - game_state.active_players.native * cst.PLAY_FEE_ESCROW
+    )
+
+
+# Push the expiry round of a loaded game register forward since the player is still around, caller stores it
+@subroutine
+def extend_register_expiry(
+    game_register: stc.GameRegister,
     round_delta: UInt64,
 ) -> None:
-    box_game_register[account].game_id = arc4.UInt64(0)
-    box_game_register[account].commit_rand_round = arc4.UInt64(0)
-    box_game_register[account].expiry_round = arc4.UInt64(Global.round + round_delta)
+    game_register.expiry_round = arc4.UInt64(Global.round + round_delta)
+
+
+# Calculate the number of players page boxes needed to seat a given number of max players
+@subroutine
+def calc_players_page_count(max_players: UInt64) -> UInt64:
+    return (max_players + cst.PLAYERS_PAGE_SEATS - 1) // cst.PLAYERS_PAGE_SEATS
+
+
+# Build the game players box key of a page from the game id and the page index
+@subroutine
+def game_players_page_key(game_id: UInt64, page_idx: UInt64) -> Bytes:
+    return op.itob(game_id) + op.extract(op.itob(page_idx), 7, 1)
+
+
+# Build the game seat box key of a player from the game id and the player account
+@subroutine
+def game_seat_key(game_id: UInt64, account: Account) -> Bytes:
+    return op.itob(game_id) + account.bytes
+
+
+# Calculate the start index of a seat inside the players page box holding it, past the page header
+@subroutine
+def calc_seat_start_pos(seat_idx: UInt64) -> UInt64:
+    return (
+        cst.PLAYERS_PAGE_HEADER_SIZE
+        + (seat_idx % cst.PLAYERS_PAGE_SEATS) * cst.ADDRESS_SIZE
+    )
 
 
-# Check if account is an active player of a game
+# Read the live seat bitmap stored in the header of a players page box
 @subroutine
-def check_acc_in_game(
+def read_live_seats(game_players_bref: BoxRef) -> UInt64:
+    return op.extract_uint16(
+        game_players_bref.extract(0, cst.PLAYERS_PAGE_HEADER_SIZE), 0
+    )
+
+
+# Write the live seat bitmap into the header of a players page box
+@subroutine
+def write_live_seats(game_players_bref: BoxRef, live_seats: UInt64) -> None:
+    game_players_bref.replace(0, op.extract(op.itob(live_seats), 6, 2))
+
+
+# Check if account holds a seat in the current round of a game, the game seat box is deleted once its player plays
+@subroutine
+def is_seat_held(
     game_id: UInt64,
+    game_state: stc.GameState,
+    box_game_seat: BoxMap[Bytes, stc.GameSeat],
     account: Account,
-    box_game_players: BoxMap[UInt64, Bytes],
-    player_count: UInt64,
-    clear_player: bool,  # noqa: FBT001
 ) -> bool:
-    # Calculate total byte length to iterate over based on player count and address size
-    game_players_length = player_count * cst.ADDRESS_SIZE
+    game_seat, game_seat_exists = box_game_seat.maybe(game_seat_key(game_id, account))
+    return game_seat_exists and game_seat.generation == game_state.generation
 
-    # Initialize flag to track if account is found in game
-    acc_in_game = False
 
-    # Iterate through the player byte array in 32-byte chunks (one address per chunk)
-    for i in urange(0, game_players_length, cst.ADDRESS_SIZE):
-        # Extract the 32-byte player address at start index i
-        player_addr_bytes = op.extract(box_game_players[game_id], i, cst.ADDRESS_SIZE)
+# Resolve a seat index to the player address stored at that seat, zero address if the seat index is empty
+# The players page box last read is passed along with its index, so a page is only read again for another page
+@subroutine
+def read_seat_address(
+    game_id: UInt64,
+    box_game_players: BoxMap[Bytes, Bytes],
+    seat_idx: UInt64,
+    page_idx: UInt64,
+    page: Bytes,
+) -> tuple[Account, UInt64, Bytes]:
+    # An empty placement has no address
+    if seat_idx == cst.NO_SEAT_IDX:
+        return Global.zero_address, page_idx, page
+
+    # Read the players page box holding the seat unless it is the page read last
+    seat_page_idx = seat_idx // cst.PLAYERS_PAGE_SEATS
+    if seat_page_idx != page_idx:
+        page_idx = seat_page_idx
+        page = box_game_players[game_players_page_key(game_id, page_idx)]
+
+    # Extract the 32-byte player address stored at the seat
+    return (
+        Account.from_bytes(
+            op.extract(page, calc_seat_start_pos(seat_idx), cst.ADDRESS_SIZE)
+        ),
+        page_idx,
+        page,
+    )
+
 
-        # Check if the extracted player address bytes match up with the account bytes
-        if account.bytes == player_addr_bytes:
-            acc_in_game = True
+# Resolve the first, second and third place seat indices to player addresses, reading each players page box once
+@subroutine
+def get_placement_addresses(
+    game_id: UInt64,
+    game_state: stc.GameState,
+    box_game_players: BoxMap[Bytes, Bytes],
+) -> tuple[Account, Account, Account]:
+    # No players page box has been read yet
+    page_idx = UInt64(cst.NO_SEAT_IDX)
+    page = Bytes()
+
+    first_place_address, page_idx, page = read_seat_address(
+        game_id=game_id,
+        box_game_players=box_game_players,
+        seat_idx=game_state.first_place_seat.native,
+        page_idx=page_idx,
+        page=page,
+    )
+    second_place_address, page_idx, page = read_seat_address(
+        game_id=game_id,
+        box_game_players=box_game_players,
+        seat_idx=game_state.second_place_seat.native,
+        page_idx=page_idx,
+        page=page,
+    )
+    third_place_address, page_idx, page = read_seat_address(
+        game_id=game_id,
+        box_game_players=box_game_players,
+        seat_idx=game_state.third_place_seat.native,
+        page_idx=page_idx,
+        page=page,
+    )
 
-            # Optionally clear this player from the box by replacing their address with zero bytes
-            if clear_player:
-                game_players_bref = BoxRef(
-                    key=box_game_players.key_prefix + op.itob(game_id)
-                )
-                game_players_bref.replace(i, cst.ZERO_ADDR_BYTES)
+    # Return the placement addresses
+    return first_place_address, second_place_address, third_place_address
 
-            # Exit loop early since sender was found
-            break
 
-    # Return True if account was found in the game, else False
-    return acc_in_game
+# Occupy a seat by storing the account address and marking the seat and its page as live
+@subroutine
+def occupy_seat(
+    game_id: UInt64,
+    game_state: stc.GameState,
+    box_game_players: BoxMap[Bytes, Bytes],
+    seat_idx: UInt64,
+    account: Account,
+) -> None:
+    # Read the players page box holding the seat once, it is written back once below
+    page_idx = seat_idx // cst.PLAYERS_PAGE_SEATS
+    page_key = game_players_page_key(game_id, page_idx)
+    page = box_game_players[page_key]
+
+    # Seats fill in order, so the first seat of a page starts a fresh bitmap and drops bits of older generations
+    live_seats = UInt64(0)
+    if seat_idx % cst.PLAYERS_PAGE_SEATS != 0:
+        live_seats = op.extract_uint16(page, 0)
+
+    # Set the seat bit in the page live seat bitmap and store the account address at the seat
+    live_seats = op.setbit_uint64(live_seats, seat_idx % cst.PLAYERS_PAGE_SEATS, 1)
+    page = op.replace(page, 0, op.extract(op.itob(live_seats), 6, 2))
+    page = op.replace(page, calc_seat_start_pos(seat_idx), account.bytes)
+    box_game_players[page_key] = page
+
+    # Set the page bit in the game state live pages bitmap
+    game_state.live_pages = arc4.UInt64(
+        op.setbit_uint64(game_state.live_pages.native, page_idx, 1)
+    )
 
 
-# Use the PCG AVM library to generate a sequence of numbers and compute the final score and placement
+# Vacate a seat by clearing its bit in the page live seat bitmap, clear the page bit too if the page emptied
 @subroutine
-def calc_score_get_place(
+def vacate_seat(
     game_id: UInt64,
     game_state: stc.GameState,
-    game_register: stc.GameRegister,
-    player: Account,
-    seed: Bytes,
+    box_game_players: BoxMap[Bytes, Bytes],
+    seat_idx: UInt64,
 ) -> None:
+    # Reference the players page box holding the seat
+    page_idx = seat_idx // cst.PLAYERS_PAGE_SEATS
+    game_players_bref = BoxRef(
+        key=box_game_players.key_prefix + game_players_page_key(game_id, page_idx)
+    )
+
+    # Clear the seat bit in the page live seat bitmap, the address bytes are left in place
+    live_seats = op.setbit_uint64(
+        read_live_seats(game_players_bref), seat_idx % cst.PLAYERS_PAGE_SEATS, 0
+    )
+    write_live_seats(game_players_bref, live_seats)
+
+    # If no live seats remain in the page, clear the page bit in the game state live pages bitmap
+    if live_seats == 0:
+        game_state.live_pages = arc4.UInt64(
+            op.setbit_uint64(game_state.live_pages.native, page_idx, 0)
+        )
+
+
+# Use the PCG AVM library to stream random numbers one at a time and count the rolls survived
+@subroutine
+def calc_score_pcg(seed: Bytes) -> UInt64:
     # Initialize the PCG pseudo-random generator state using 8 bytes from the given seed
     state = pcg16_init(seed=op.extract(seed, 16, 8))
 
-    # Generate a sequence of 100 random 16-bit integers (UInt16)
-    sequence = pcg16_random(
-        state=state,  # Data type is UInt16
+    # Draw and discard the first roll, scoring has always started from the second value of the sequence
+    state = pcg16_random(
+        state=state,
         lower_bound=UInt64(1),  # Lower bound is 1 (to disallow 0 as a value)
         upper_bound=UInt64(0),  # Upper bound is 0 (to indicate full range)
-        length=UInt64(255),  # Number of values generated is 255
-    )[1]
+        length=UInt64(1),  # Generate a single value per call
+    )[0]
 
     # Initialize the player's score
     score = UInt64(0)
 
-    # Iterate through the sequence as a byte array starting at byte index 2 (skip array header bytes)
-    for i in urange(2, sequence.bytes.length, 2):
-        # Extract a 16-bit unsigned integer from the byte sequence
-        roll = op.extract_uint16(sequence.bytes[2:], i)
+    # Stream rolls one at a time and stop generating at the first elimination roll
+    while score < cst.MAX_SCORE:
+        # Top up the opcode budget only when the remaining budget can not cover another roll
+        ensure_budget(
+            required_budget=cst.PCG_ROLL_BUDGET, fee_source=OpUpFeeSource.GroupCredit
+        )
+
+        # Generate the next random 16-bit integer (UInt16) and carry the generator state forward
+        state, rolls = pcg16_random(
+            state=state,
+            lower_bound=UInt64(1),
+            upper_bound=UInt64(0),
+            length=UInt64(1),
+        )
 
         # Stop accumulating score if the roll is below or equal to the elimination threshold
-        if roll <= cst.ELIM_THRESHOLD:
+        if rolls[0].native <= cst.ELIM_THRESHOLD:
             break
 
         # Increment score for each roll above the threshold
         score += 1
 
-    # Emit ARC-28 event for off-chain tracking
-    arc4.emit(
-        "player_score(uint64,address,uint8)",
-        game_id,
-        player,
-        arc4.UInt8(score),
+    # Return the player's score
+    return score
+
+
+# Advance the closed-form score sampler by one bit of the score
+@subroutine
+def sample_score_bit(
+    draw: UInt64,
+    score: UInt64,
+    survival: UInt64,
+    step: UInt64,
+    survival_pow: UInt64,
+) -> tuple[UInt64, UInt64]:
+    # Multiply the survival probability by q^step in fixed point by keeping the high word of the 128-bit product
+    candidate = op.mulw(survival, survival_pow)[0]
+
+    # If the draw still falls below the candidate survival probability, the score reaches at least score + step
+    if draw < candidate:
+        return score + step, candidate
+
+    # Else, keep the current score and survival probability
+    return score, survival
+
+
+# Derive the score straight from the seed with a fixed cost by inverting the geometric distribution bit by bit
+@subroutine
+def calc_score_closed_form(seed: Bytes) -> UInt64:
+    # Hash the seed and read its first 8 bytes as a uniform fixed-point draw in [0, 1)
+    draw = op.extract_uint64(op.sha512_256(seed), 0)
+
+    # Find the largest score whose survival probability q^score is still above the draw, from highest bit to lowest
+    score = UInt64(0)
+    survival = UInt64(2**64 - 1)  # Fixed-point value of q^0, just below 1
+    score, survival = sample_score_bit(
+        draw, score, survival, UInt64(128), UInt64(cst.SCORE_SURVIVAL_POW_128)
+    )
+    score, survival = sample_score_bit(
+        draw, score, survival, UInt64(64), UInt64(cst.SCORE_SURVIVAL_POW_64)
+    )
+    score, survival = sample_score_bit(
+        draw, score, survival, UInt64(32), UInt64(cst.SCORE_SURVIVAL_POW_32)
+    )
+    score, survival = sample_score_bit(
+        draw, score, survival, UInt64(16), UInt64(cst.SCORE_SURVIVAL_POW_16)
+    )
+    score, survival = sample_score_bit(
+        draw, score, survival, UInt64(8), UInt64(cst.SCORE_SURVIVAL_POW_8)
+    )
+    score, survival = sample_score_bit(
+        draw, score, survival, UInt64(4), UInt64(cst.SCORE_SURVIVAL_POW_4)
+    )
+    score, survival = sample_score_bit(
+        draw, score, survival, UInt64(2), UInt64(cst.SCORE_SURVIVAL_POW_2)
+    )
+    score, survival = sample_score_bit(
+        draw, score, survival, UInt64(1), UInt64(cst.SCORE_SURVIVAL_POW_1)
+    )
+
+    # Apply the same score cap as the PCG path
+    if score > cst.MAX_SCORE:
+        score = UInt64(cst.MAX_SCORE)
+
+    # Return the player's score
+    return score
+
+
+# Read the score of the leaderboard entry at the given rank
+@subroutine
+def read_leaderboard_score(box_leaderboard: BoxRef, rank: UInt64) -> UInt64:
+    return op.btoi(
+        box_leaderboard.extract(
+            cst.LEADERBOARD_HEADER_SIZE + rank * cst.LEADERBOARD_ENTRY_SIZE, 1
+        )
+    )
+
+
+# Binary search the descending leaderboard for the first rank whose score is lower than the given score
+@subroutine
+def find_leaderboard_rank(
+    box_leaderboard: BoxRef, ranked_count: UInt64, score: UInt64
+) -> UInt64:
+    # Narrow the [low, high) range until both ends meet, ties keep the earlier achiever ranked higher
+    low = UInt64(0)
+    high = ranked_count
+    while low < high:
+        mid = (low + high) // 2
+        if read_leaderboard_score(box_leaderboard=box_leaderboard, rank=mid) >= score:
+            low = mid + 1
+        else:
+            high = mid
+
+    # Return the rank where the score would be inserted
+    return low
+
+
+# Move a player's personal best onto the leaderboard, replacing their previous entry if it is ranked
+@subroutine
+def update_leaderboard(
+    box_leaderboard: BoxRef, player: Account, prev_best: UInt64, score: UInt64
+) -> None:
+    # Without a leaderboard box there is nothing to rank
+    if not box_leaderboard:
+        return
+
+    # Ensure transaction has sufficient opcode budget for the binary searches and the splices below
+    ensure_budget(
+        required_budget=cst.LEADERBOARD_BUDGET, fee_source=OpUpFeeSource.GroupCredit
+    )
+
+    # Get the leaderboard capacity from the box size and the num of ranked entries from its header
+    capacity = (
+        box_leaderboard.length - cst.LEADERBOARD_HEADER_SIZE
+    ) // cst.LEADERBOARD_ENTRY_SIZE
+    ranked_count = op.extract_uint16(
+        box_leaderboard.extract(0, cst.LEADERBOARD_HEADER_SIZE), 0
+    )
+
+    # A player's entry always holds their previous best, so only the ranks tied at that score need to be scanned
+    if prev_best != 0:
+        rank = find_leaderboard_rank(
+            box_leaderboard=box_leaderboard,
+            ranked_count=ranked_count,
+            score=prev_best + 1,
+        )
+        end_rank = find_leaderboard_rank(
+            box_leaderboard=box_leaderboard,
+            ranked_count=ranked_count,
+            score=prev_best,
+        )
+
+        # Every rank tied at the previous best may be scanned, so top up the budget for the scan on top of the rest
+        ensure_budget(
+            required_budget=(end_rank - rank) * cst.LEADERBOARD_SCAN_BUDGET
+            + cst.LEADERBOARD_BUDGET,
+            fee_source=OpUpFeeSource.GroupCredit,
+        )
+        while rank < end_rank:
+            entry_pos = cst.LEADERBOARD_HEADER_SIZE + rank * cst.LEADERBOARD_ENTRY_SIZE
+            if box_leaderboard.extract(entry_pos + 1, cst.ADDRESS_SIZE) == player.bytes:
+                # Remove the previous entry by shifting the lower ranked entries up, the box end is zero padded
+                box_leaderboard.splice(entry_pos, cst.LEADERBOARD_ENTRY_SIZE, Bytes())
+                ranked_count -= 1
+                break
+            rank += 1
+
+    # Find the rank of the new score, it does not qualify if every rank up to capacity outscores it
+    rank = find_leaderboard_rank(
+        box_leaderboard=box_leaderboard, ranked_count=ranked_count, score=score
     )
+    if rank < capacity:
+        # Insert the entry by shifting the lower ranked entries down, the last entry drops off a full leaderboard
+        box_leaderboard.splice(
+            cst.LEADERBOARD_HEADER_SIZE + rank * cst.LEADERBOARD_ENTRY_SIZE,
+            0,
+            stc.LeaderboardEntry(
+                score=arc4.UInt8(score), player_address=arc4.Address(player)
+            ).bytes,
+        )
+        if ranked_count < capacity:
+            ranked_count += 1
+
+    # Write the num of ranked entries back to the header
+    box_leaderboard.replace(0, op.extract(op.itob(ranked_count), 6, 2))
+
+
+# Compute the player's score using the deploy-time scoring mode, assign placement if it qualifies and return it
+@subroutine
+def calc_score_get_place(
+    game_id: UInt64,
+    game_state: stc.GameState,
+    game_register: stc.GameRegister,
+    box_leaderboard: BoxRef,
+    player: Account,
+    seat_idx: UInt64,
+    seed: Bytes,
+) -> UInt64:
+    # Use the constant-cost closed-form sampler if enabled at deploy-time, else stream PCG rolls
+    if TemplateVar[bool]("CLOSED_FORM_SCORE"):
+        score = calc_score_closed_form(seed=seed)
+    else:
+        score = calc_score_pcg(seed=seed)
 
     # Check if score is greater than the game state's top score
     if score > game_state.top_score.native:
@@ -181,42 +531,55 @@ def calc_score_get_place(
 
     # Check if score is greater than the game register account's best score across every game played
     if score > game_register.best_score.native:
+        # Rank the new personal best on the leaderboard
+        update_leaderboard(
+            box_leaderboard=box_leaderboard,
+            player=player,
+            prev_best=game_register.best_score.native,
+            score=score,
+        )
         game_register.best_score = arc4.UInt8(score)  # Update personal top score
 
+    # Placements store the player's seat index, the address stays in the players page box until the next round
+    place_seat = arc4.UInt16(seat_idx)
+
     # Check if score is great enough for a top three placement and arrange leaderboard accordingly
     if (
         # First Place
-        game_state.first_place_address == arc4.Address(Global.zero_address)
+        game_state.first_place_seat == cst.NO_SEAT_IDX
         or score > game_state.first_place_score.native
     ):
         # Assign: Second -> Third
         game_state.third_place_score = game_state.second_place_score
-        game_state.third_place_address = game_state.second_place_address
+        game_state.third_place_seat = game_state.second_place_seat
         # Assign: First -> Second
         game_state.second_place_score = game_state.first_place_score
-        game_state.second_place_address = game_state.first_place_address
+        game_state.second_place_seat = game_state.first_place_seat
         # Assign: Score -> First
         game_state.first_place_score = arc4.UInt8(score)
-        game_state.first_place_address = arc4.Address(player)
+        game_state.first_place_seat = place_seat
     elif (
         # Second Place
-        game_state.second_place_address == arc4.Address(Global.zero_address)
+        game_state.second_place_seat == cst.NO_SEAT_IDX
         or score > game_state.second_place_score.native
     ):
         # Assign: Second -> Third
         game_state.third_place_score = game_state.second_place_score
-        game_state.third_place_address = game_state.second_place_address
+        game_state.third_place_seat = game_state.second_place_seat
         # Assign: Score -> Second
         game_state.second_place_score = arc4.UInt8(score)
-        game_state.second_place_address = arc4.Address(player)
+        game_state.second_place_seat = place_seat
     elif (
         # Third Place
-        game_state.third_place_address == arc4.Address(Global.zero_address)
+        game_state.third_place_seat == cst.NO_SEAT_IDX
         or score > game_state.third_place_score.native
     ):
         # Assign: Score -> Third
         game_state.third_place_score = arc4.UInt8(score)
-        game_state.third_place_address = arc4.Address(player)
+        game_state.third_place_seat = place_seat
+
+    # Return the player's score
+    return score
 
 
 # Check if quick play is permitted, return true if all conditions are met, else false
@@ -229,150 +592,23 @@ def can_quick_play(game_state: stc.GameState) -> bool:
     )
 
 
-# Check if game is live and execute its conditional logic
-@subroutine
-def is_game_live(game_id: UInt64, game_state: stc.GameState) -> None:
-    # Check game live criteria
-    if (
-        game_state.expiry_ts < Global.latest_timestamp  # If deadline expired
-        or game_state.active_players == game_state.max_players  # If lobby full
-        or can_quick_play(game_state=game_state)  # If quick play conditions are met
-    ):
-        # Mark join phase as complete when staking finalized evaluates True
-        game_state.staking_finalized = arc4.Bool(True)  # noqa: FBT003
-
-        # Establish game play window by setting expiry timestamp
-        game_state.expiry_ts = arc4.UInt64(
-            Global.latest_timestamp + UInt64(cst.PHASE_EXPIRY_INTERVAL)
-        )
-
-        # Emit ARC-28 event for off-chain tracking
-        arc4.emit(
-            "game_live(uint64,bool,uint64)",
-            game_id,
-            game_state.staking_finalized,
-            game_state.expiry_ts,
-        )
-
-# Check if game is over and execute its conditional logic
+# Check if game over criteria are met, return true if any of them are met, else false
 @subroutine
-def is_game_over(
+def is_game_over_due(
     game_id: UInt64,
     game_state: stc.GameState,
-    box_game_register: BoxMap[Account, stc.GameRegister],
-    box_game_players: BoxMap[UInt64, Bytes],
-) -> None:
-    # Define game over criteria
-    deadline_expired = game_state.expiry_ts < Global.latest_timestamp
-    no_active_players = game_state.active_players.native == 0
-    admin_only_player = (
-        game_state.active_players.native == 1
-        and check_acc_in_game(
-            game_id=game_id,
-            account=game_state.admin_address.native,
-            box_game_players=box_game_players,
-            player_count=UInt64(1),
-            clear_player=False,
-        )
-    )
-
-    # Check game over criteria
-    if deadline_expired or no_active_players or admin_only_player:
-        # Reset game register box contents for any remaining players
-        game_players_bref = BoxRef(key=box_game_players.key_prefix + op.itob(game_id))
-        for i in urange(0, game_players_bref.length, 32):
-            player_addr_bytes = game_players_bref.extract(i, 32)
-            if player_addr_bytes != Bytes(cst.ZERO_ADDR_BYTES):
-                player = Account.from_bytes(player_addr_bytes)
-                # Reset game commit values after scoring
-                reset_game_commit_values(
-                    box_game_register=box_game_register,
-                    account=player,
-                    round_delta=UInt64(cst.BOX_R_EXP_ROUND_DELTA),
-                )
-
-        # Clear box game players data by setting its value to all zeroes
-        box_game_players[game_id] = op.bzero(
-            cst.ADDRESS_SIZE * game_state.max_players.native
-        )
-
-        # Mark game as over by setting active players to zero
-        game_state.active_players = arc4.UInt8(0)
-
-        # Emit ARC-28 event for off-chain tracking
-        arc4.emit(
-            "game_over(uint64,uint8,uint8,uint8,address,address,address)",
-            game_id,
-            game_state.first_place_score,
-            game_state.second_place_score,
-            game_state.third_place_score,
-            game_state.first_place_address,
-            game_state.second_place_address,
-            game_state.third_place_address,
-        )
-
-        # If only 1 player in lobby after game goes live, they get entire prize pool
-        if game_state.prize_pool.native == cst.STAKE_AMOUNT:
-            first_prize_share = game_state.prize_pool.native
-            second_prize_share = UInt64(0)
-            third_prize_share = UInt64(0)
-        # Elif, only 2 players in lobby after game goes live, split prize pool: 60% / remainder / 0
-        elif game_state.prize_pool.native == 2 * cst.STAKE_AMOUNT:
-            first_prize_share = game_state.prize_pool.native * UInt64(60) // UInt64(100)
-            second_prize_share = game_state.prize_pool.native - first_prize_share
-            third_prize_share = UInt64(0)  # No third player
-        # Else, split prize pool: 50% / 30% / remainder
-        else:
-            first_prize_share = game_state.prize_pool.native * UInt64(50) // UInt64(100)
-            second_prize_share = (
-                game_state.prize_pool.native * UInt64(30) // UInt64(100)
-            )
-            third_prize_share = (
-                game_state.prize_pool.native - first_prize_share - second_prize_share
+    box_game_seat: BoxMap[Bytes, stc.GameSeat],
+) -> bool:
+    return (
+        game_state.expiry_ts < Global.latest_timestamp  # If deadline expired
+        or game_state.active_players.native == 0  # If no active players remain
+        or (
+            game_state.active_players.native == 1  # If admin is the only remaining player
+            and is_seat_held(
+                game_id=game_id,
+                game_state=game_state,
+                box_game_seat=box_game_seat,
+                account=game_state.admin_address.native,
             )
-
-        # Resolve prize pool win share receivers by priority
-        first_place_receiver = resolve_receiver_by_prio(
-            acc1=game_state.first_place_address.native,
-            acc2=game_state.admin_address.native,
-            acc3=Global.creator_address,
-        )
-        second_place_receiver = resolve_receiver_by_prio(
-            acc1=game_state.second_place_address.native,
-            acc2=game_state.admin_address.native,
-            acc3=Global.creator_address,
         )
-        third_place_receiver = resolve_receiver_by_prio(
-            acc1=game_state.third_place_address.native,
-            acc2=game_state.admin_address.native,
-            acc3=Global.creator_address,
-        )
-
-        # Issue prize pool share payouts to first, second and third place accounts if their share is non-zero amount
-        if first_prize_share > UInt64(0):
-            payout_itxn(
-                receiver=first_place_receiver,
-                amount=first_prize_share,
-                note=String(
-                    'pieout:j{"method":"play_game","subroutine:"is_game_over","concern":"itxn.pay;first_prize_share"}'
-                ),
-            )
-        if second_prize_share > UInt64(0):
-            payout_itxn(
-                receiver=second_place_receiver,
-                amount=second_prize_share,
-                note=String(
-                    'pieout:j{"method":"play_game","subroutine:"is_game_over","concern":"itxn.pay;second_prize_share"}'
-                ),
-            )
-        if third_prize_share > UInt64(0):
-            payout_itxn(
-                receiver=third_place_receiver,
-                amount=third_prize_share,
-                note=String(
-                    'pieout:j{"method":"play_game","subroutine:"is_game_over","concern":"itxn.pay;third_prize_share"}'
-                ),
-            )
-
-        # Set prize pool amount to zero after making payouts
-        game_state.prize_pool = arc4.UInt64(0)
+    )
@@ -3,7 +3,22 @@ from typing import TypeAlias
 
 from algopy import arc4
 
+from . import structs as stc
+
 # Type alias from arc4 dynamic array data type
 GamePlayersArr: TypeAlias = arc4.DynamicArray[arc4.Address]
 
+# Type alias from arc4 tuple data type holding the first, second and third place addresses
+GamePlacementsTuple: TypeAlias = arc4.Tuple[arc4.Address, arc4.Address, arc4.Address]
+
+# Type alias from arc4 dynamic array data type holding game state entries
+GameStatesArr: TypeAlias = arc4.DynamicArray[stc.GameStateEntry]
+
+# Type alias from arc4 dynamic array data type holding game roster summaries
+GameRosterSummariesArr: TypeAlias = arc4.DynamicArray[stc.GameRosterSummary]
+
+# Type alias from arc4 dynamic array data type holding open lobby index entries
+GameLobbyEntriesArr: TypeAlias = arc4.DynamicArray[stc.GameLobbyEntry]
 
+# Type alias from arc4 dynamic array data type holding leaderboard entries
+LeaderboardEntriesArr: TypeAlias = arc4.DynamicArray[stc.LeaderboardEntry]
@@ -0,0 +1,673 @@
+import base64
+import json
+import logging
+import math
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Literal, TypedDict, cast
+
+from algokit_utils import (
+    AppClientCompilationParams,
+    CommonAppCallParams,
+    OnSchemaBreak,
+    OnUpdate,
+    PaymentParams,
+    SendParams,
+    TealTemplateParams,
+    micro_algo,
+)
+from algokit_utils.algorand import AlgorandClient
+from algokit_utils.models import SigningAccount
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+
+from smart_contracts.artifacts.pieout.pieout_client import (
+    PieoutClient,
+    PieoutComposer,
+    PieoutFactory,
+    PieoutMethodCallCreateParams,
+)
+from smart_contracts.artifacts.vrf_beacon_stub.vrf_beacon_stub_client import (
+    VrfBeaconStubFactory,
+)
+from smart_contracts.pieout import constants as cst
+
+logger = logging.getLogger(__name__)
+
+# Lobby sizes every game cycle scenario is profiled at by default
+DEFAULT_LOBBY_SIZES = (3, 8, 16)
+
+# Static fee paid by profiled app calls, high enough to cover every inner transaction they may spawn
+PROFILE_STATIC_FEE = 60_000
+
+# Opcodes whose stack output is the box data they read
+BOX_READ_OPS = ("box_get", "box_extract")
+
+# Num of players resolved through `play_game_batch` per game cycle, the rest play through `play_game_v2`
+PLAY_BATCH_SIZE = 2
+
+# Num of rounds to wait after the game goes live before the game commit round seed is available
+COMMIT_ROUND_DELAY = 5
+
+# Deploy-time approval program source, read to map simulate trace program counters back to opcodes
+APPROVAL_TEAL_PATH = (
+    Path(__file__).parent / "artifacts" / "pieout" / "Pieout.approval.teal"
+)
+
+# Subset of the algod simulate response read by the profiler, keys are hyphenated so the functional syntax is used
+TraceValue = TypedDict("TraceValue", {"type": int, "bytes": str}, total=False)
+StateChange = TypedDict(
+    "StateChange",
+    {"app-state-type": str, "operation": str, "new-value": TraceValue},
+    total=False,
+)
+TraceUnit = TypedDict(
+    "TraceUnit",
+    {"pc": int, "stack-additions": list[TraceValue], "state-changes": list[StateChange]},
+    total=False,
+)
+ExecTrace = TypedDict(
+    "ExecTrace", {"approval-program-trace": list[TraceUnit]}, total=False
+)
+TxnFields = TypedDict("TxnFields", {"apid": int}, total=False)
+SignedTxn = TypedDict("SignedTxn", {"txn": TxnFields})
+PendingTxnResult = TypedDict(
+    "PendingTxnResult",
+    {"txn": SignedTxn, "inner-txns": list["PendingTxnResult"]},
+    total=False,
+)
+SimulateTxnResult = TypedDict(
+    "SimulateTxnResult",
+    {"txn-result": PendingTxnResult, "exec-trace": ExecTrace},
+    total=False,
+)
+SimulateTxnGroup = TypedDict(
+    "SimulateTxnGroup",
+    {
+        "txn-results": list[SimulateTxnResult],
+        "failure-message": str,
+        "app-budget-consumed": int,
+    },
+    total=False,
+)
+SimulateResponse = TypedDict(
+    "SimulateResponse", {"txn-groups": list[SimulateTxnGroup]}
+)
+
+# Names of the metrics measured for every profiled group
+MetricName = Literal[
+    "opcode_cost", "box_bytes_read", "box_bytes_written", "inner_txn_count", "min_fee"
+]
+METRIC_NAMES: tuple[MetricName, ...] = (
+    "opcode_cost",
+    "box_bytes_read",
+    "box_bytes_written",
+    "inner_txn_count",
+    "min_fee",
+)
+
+# Worst case of every metric per scenario and method, plus the num of calls, keyed by scenario then method
+Summary = dict[str, dict[str, dict[str, int]]]
+
+
+class Metrics(TypedDict):
+    """Costs measured for a single simulated group."""
+
+    opcode_cost: int
+    box_bytes_read: int
+    box_bytes_written: int
+    inner_txn_count: int
+    min_fee: int
+
+
+class ProfileRecord(Metrics):
+    """Costs of a single simulated group, tagged w/ the scenario and method it profiles."""
+
+    scenario: str
+    method: str
+
+
+class ProfileReport(TypedDict):
+    """Profile results written to the JSON report."""
+
+    app_id: int
+    min_txn_fee: int
+    lobby_sizes: list[int]
+    box_mbr: dict[str, int]
+    summary: Summary
+    records: list[ProfileRecord]
+
+
+class Profiler:
+    """Runs Pieout ABI method calls through simulate with exec trace enabled and records their costs."""
+
+    def __init__(
+        self,
+        algorand: AlgorandClient,
+        app: PieoutClient,
+        template_params: TealTemplateParams,
+    ) -> None:
+        self.algorand = algorand
+        self.app = app
+        self.min_txn_fee = algorand.client.algod.suggested_params().min_fee
+        self.records: list[ProfileRecord] = []
+        self.box_mbr: dict[str, int] = {}
+        self.scenario_min_balance = 0
+
+        # Compile the approval program w/ the same deploy-time params to map trace program counters to opcodes
+        compiled = algorand.app.compile_teal_template(
+            APPROVAL_TEAL_PATH.read_text(),
+            template_params=template_params,
+            deployment_metadata={"deletable": True},
+        )
+        assert compiled.source_map is not None, "Approval program source map missing."
+        self.teal_lines = compiled.teal.splitlines()
+        self.pc_to_line: dict[int, int] = compiled.source_map.pc_to_line
+
+    def app_min_balance(self) -> int:
+        """Returns the app account minimum balance, which grows w/ the MBR of every box it holds."""
+        return self.algorand.account.get_information(
+            self.app.app_address
+        ).min_balance.micro_algo
+
+    def begin(self, scenario: str) -> None:
+        """Starts a scenario, its box MBR is tracked as the peak app minimum balance growth from here on."""
+        self.scenario_min_balance = self.app_min_balance()
+        self.box_mbr[scenario] = 0
+
+    def opcode_at(self, pc: int) -> str:
+        """Returns the opcode of the approval program TEAL line the program counter maps to."""
+        line = self.teal_lines[self.pc_to_line[pc]].split()
+        return line[0] if line else ""
+
+    def measure(self, simulate_response: SimulateResponse) -> Metrics:
+        """Extracts opcode cost, box bytes read/written, inner transaction count and minimum fee of a group."""
+        group = simulate_response["txn-groups"][0]
+        if group.get("failure-message"):
+            raise RuntimeError(group["failure-message"])
+
+        box_bytes_read = 0
+        box_bytes_written = 0
+        inner_txn_count = 0
+        txn_count = len(group["txn-results"])
+        for txn_result in group["txn-results"]:
+            inner_txn_count += count_inner_txns(txn_result["txn-result"])
+
+            # Only app calls to this app have a trace the approval program source map applies to
+            if txn_result["txn-result"]["txn"]["txn"].get("apid") != self.app.app_id:
+                continue
+            for unit in txn_result.get("exec-trace", {}).get(
+                "approval-program-trace", []
+            ):
+                # Box reads push the data they read onto the stack
+                if self.opcode_at(unit["pc"]) in BOX_READ_OPS:
+                    box_bytes_read += sum(
+                        len(base64.b64decode(value.get("bytes", "")))
+                        for value in unit.get("stack-additions", [])
+                        if value.get("type") == 1
+                    )
+                # Box writes report the whole box value left after the write
+                for change in unit.get("state-changes", []):
+                    if change["app-state-type"] == "b" and change["operation"] == "w":
+                        box_bytes_written += len(
+                            base64.b64decode(change["new-value"].get("bytes", ""))
+                        )
+
+        return Metrics(
+            opcode_cost=group.get("app-budget-consumed", 0),
+            box_bytes_read=box_bytes_read,
+            box_bytes_written=box_bytes_written,
+            inner_txn_count=inner_txn_count,
+            min_fee=(txn_count + inner_txn_count) * self.min_txn_fee,
+        )
+
+    def profile(
+        self,
+        scenario: str,
+        method: str,
+        build_group: Callable[[], PieoutComposer],
+        *,
+        send: bool = True,
+    ) -> None:
+        """Simulates a group w/ exec trace, records its costs, then sends it to advance the scenario state."""
+        result = build_group().simulate(
+            allow_unnamed_resources=True,
+            exec_trace_config=SimulateTraceConfig(
+                enable=True, stack_change=True, scratch_change=False, state_change=True
+            ),
+        )
+        metrics = self.measure(cast(SimulateResponse, result.simulate_response))
+        record = ProfileRecord(
+            scenario=scenario,
+            method=method,
+            opcode_cost=metrics["opcode_cost"],
+            box_bytes_read=metrics["box_bytes_read"],
+            box_bytes_written=metrics["box_bytes_written"],
+            inner_txn_count=metrics["inner_txn_count"],
+            min_fee=metrics["min_fee"],
+        )
+        self.records.append(record)
+        logger.info(f"Profiled {scenario}/{method}: {record}")
+
+        # Read-only methods are simulate only
+        if send:
+            build_group().send(SendParams(populate_app_call_resources=True))
+            self.box_mbr[scenario] = max(
+                self.box_mbr[scenario],
+                self.app_min_balance() - self.scenario_min_balance,
+            )
+
+    def call_params(self, sender: SigningAccount) -> CommonAppCallParams:
+        """Returns app call params paying the profile static fee."""
+        return CommonAppCallParams(
+            sender=sender.address,
+            signer=sender.signer,
+            static_fee=micro_algo(PROFILE_STATIC_FEE),
+        )
+
+    def pay(self, sender: SigningAccount, amount: int) -> Transaction:
+        """Creates a payment transaction from the sender to the app account."""
+        return self.algorand.create_transaction.payment(
+            PaymentParams(
+                sender=sender.address,
+                signer=sender.signer,
+                receiver=self.app.app_address,
+                amount=micro_algo(amount),
+            )
+        )
+
+
+def count_inner_txns(txn_result: PendingTxnResult) -> int:
+    """Counts the inner transactions spawned by a transaction, including nested ones."""
+    inner_txns = txn_result.get("inner-txns", [])
+    return len(inner_txns) + sum(count_inner_txns(inner) for inner in inner_txns)
+
+
+def fund_account(
+    algorand: AlgorandClient, dispenser: SigningAccount, amount: int
+) -> SigningAccount:
+    """Creates a random account and funds it from the dispenser."""
+    account = algorand.account.random()
+    algorand.send.payment(
+        PaymentParams(
+            sender=dispenser.address,
+            signer=dispenser.signer,
+            receiver=account.address,
+            amount=micro_algo(amount),
+        )
+    )
+    return account
+
+
+def wait_rounds(algorand: AlgorandClient, dispenser: SigningAccount, rounds: int) -> None:
+    """Advances LocalNet by a num of rounds, each sent transaction closes a block in dev mode."""
+    for i in range(rounds):
+        algorand.send.payment(
+            PaymentParams(
+                sender=dispenser.address,
+                signer=dispenser.signer,
+                receiver=dispenser.address,
+                amount=micro_algo(0),
+                note=f"profiler:wait_round_{i}".encode(),
+            )
+        )
+
+
+def skip_phase(algorand: AlgorandClient, dispenser: SigningAccount) -> None:
+    """Moves the LocalNet block timestamp past a game phase expiry, dev mode only."""
+    offset = algorand.client.algod.get_timestamp_offset()["offset"]
+    algorand.client.algod.set_timestamp_offset(offset + cst.PHASE_EXPIRY_INTERVAL + 1)
+    wait_rounds(algorand, dispenser, 1)
+
+
+def profile_setup(profiler: Profiler, creator: SigningAccount) -> None:
+    """Profiles the one-time creator setup methods that create the shared boxes."""
+    app = profiler.app
+    params = profiler.call_params(creator)
+    profiler.begin("setup")
+    profiler.profile(
+        "setup",
+        "mint_trophy",
+        lambda: app.new_group().mint_trophy(
+            args=(profiler.pay(creator, cst.BOX_T_COST), profiler.pay(creator, 100_000)),
+            params=params,
+        ),
+    )
+    profiler.profile(
+        "setup",
+        "init_game_pool",
+        lambda: app.new_group().init_game_pool(
+            args=(profiler.pay(creator, cst.BOX_F_COST),), params=params
+        ),
+    )
+    profiler.profile(
+        "setup",
+        "init_game_lobby",
+        lambda: app.new_group().init_game_lobby(
+            args=(profiler.pay(creator, cst.BOX_L_COST),), params=params
+        ),
+    )
+    profiler.profile(
+        "setup",
+        "init_leaderboard",
+        lambda: app.new_group().init_leaderboard(
+            args=(
+                profiler.pay(
+                    creator,
+                    cst.BOX_B_BASE_COST
+                    + cst.LEADERBOARD_MAX_CAPACITY * cst.BOX_B_ENTRY_COST,
+                ),
+                cst.LEADERBOARD_MAX_CAPACITY,
+            ),
+            params=params,
+        ),
+    )
+
+
+def profile_game_cycle(
+    profiler: Profiler,
+    algorand: AlgorandClient,
+    dispenser: SigningAccount,
+    lobby_size: int,
+) -> None:
+    """Profiles a full game cycle, from registration to deletion, at the given lobby size."""
+    app = profiler.app
+    scenario = f"lobby_{lobby_size}"
+    profiler.begin(scenario)
+    accounts = [fund_account(algorand, dispenser, 10_000_000) for _ in range(lobby_size)]
+    admin, players = accounts[0], accounts[1:]
+    stake = cst.STAKE_AMOUNT + cst.PLAY_FEE_ESCROW + cst.BOX_E_COST
+
+    # Every account gets a game register box
+    for account in accounts:
+        profiler.profile(
+            scenario,
+            "get_box_game_register",
+            lambda account=account: app.new_group().get_box_game_register(
+                args=(profiler.pay(account, cst.BOX_R_COST),),
+                params=profiler.call_params(account),
+            ),
+        )
+
+    # Admin creates the game w/ quick play disabled, so the last join fills the lobby and starts it
+    # The global game id is the id the next new game instance is created with, no retired games are recycled here
+    game_id = app.state.global_state.game_id
+    page_count = math.ceil(lobby_size / cst.PLAYERS_PAGE_SEATS)
+    profiler.profile(
+        scenario,
+        "new_game",
+        lambda: app.new_group().new_game(
+            args=(
+                False,
+                lobby_size,
+                profiler.pay(admin, cst.BOX_S_COST),
+                profiler.pay(admin, page_count * cst.BOX_P_PAGE_COST),
+                profiler.pay(admin, stake + cst.SEED_CACHE_DEPOSIT),
+            ),
+            params=profiler.call_params(admin),
+        ),
+    )
+
+    # Every other account joins the game, each join is recorded at its lobby fill level
+    for player in players:
+        profiler.profile(
+            scenario,
+            "join_game",
+            lambda player=player: app.new_group().join_game(
+                args=(game_id, profiler.pay(player, stake)),
+                params=profiler.call_params(player),
+            ),
+        )
+
+    # Read-only views of the live game
+    for method, args in (
+        ("read_box_game_players", (game_id, 0)),
+        ("read_games_page", (game_id, cst.READ_GAMES_PAGE_MAX)),
+        ("read_rosters_page", (game_id, cst.READ_ROSTERS_PAGE_MAX)),
+        ("read_open_lobbies", (0, cst.READ_LOBBY_PAGE_MAX)),
+        ("read_leaderboard", (0, cst.READ_LEADERBOARD_PAGE_MAX)),
+    ):
+        profiler.profile(
+            scenario,
+            method,
+            lambda method=method, args=args: getattr(app.new_group(), method)(
+                args=args, params=profiler.call_params(admin)
+            ),
+            send=False,
+        )
+
+    # The roster was committed to a future round when the game went live, wait for it
+    wait_rounds(algorand, dispenser, COMMIT_ROUND_DELAY)
+
+    # A keeper resolves a few plays in one batch, the remaining accounts play on their own
+    batch, solo = accounts[:PLAY_BATCH_SIZE], accounts[PLAY_BATCH_SIZE:]
+    profiler.profile(
+        scenario,
+        "play_game_batch",
+        lambda: app.new_group().play_game_batch(
+            args=(game_id, [account.address for account in batch]),
+            params=profiler.call_params(dispenser),
+        ),
+    )
+    for account in solo:
+        profiler.profile(
+            scenario,
+            "play_game_v2",
+            lambda account=account: app.new_group().play_game_v2(
+                args=(game_id,), params=profiler.call_params(account)
+            ),
+        )
+
+    # Settle the game once every play is resolved
+    profiler.profile(
+        scenario,
+        "read_game_placements",
+        lambda: app.new_group().read_game_placements(
+            args=(game_id,), params=profiler.call_params(admin)
+        ),
+        send=False,
+    )
+    profiler.profile(
+        scenario,
+        "trigger_game_event",
+        lambda: app.new_group().trigger_game_event(
+            args=(game_id, 2), params=profiler.call_params(dispenser)
+        ),
+    )
+
+    # Every account credited at game over claims its winnings
+    for account in accounts:
+        if app.state.box.box_game_register.get_value(account.address).claimable > 0:
+            profiler.profile(
+                scenario,
+                "claim_winnings",
+                lambda account=account: app.new_group().claim_winnings(
+                    params=profiler.call_params(account)
+                ),
+            )
+
+    # Admin resets the game for another round, then deletes it
+    profiler.profile(
+        scenario,
+        "reset_game",
+        lambda: app.new_group().reset_game(
+            args=(game_id, False, False, 0, profiler.pay(admin, stake + cst.SEED_CACHE_DEPOSIT)),
+            params=profiler.call_params(admin),
+        ),
+    )
+    profiler.profile(
+        scenario,
+        "delete_game",
+        lambda: app.new_group().delete_game(
+            args=(game_id,), params=profiler.call_params(admin)
+        ),
+    )
+
+    # Players release their game register boxes
+    for player in players:
+        profiler.profile(
+            scenario,
+            "del_box_game_register_for_self",
+            lambda player=player: app.new_group().del_box_game_register_for_self(
+                params=profiler.call_params(player)
+            ),
+        )
+
+
+def profile_timeout_finalization(
+    profiler: Profiler, algorand: AlgorandClient, dispenser: SigningAccount
+) -> None:
+    """Profiles a game that goes live and ends by its phase timers expiring rather than filling up or playing out."""
+    app = profiler.app
+    scenario = "timeout"
+    profiler.begin(scenario)
+    admin, player = (fund_account(algorand, dispenser, 10_000_000) for _ in range(2))
+    stake = cst.STAKE_AMOUNT + cst.PLAY_FEE_ESCROW + cst.BOX_E_COST
+
+    # Admin hosts a three seat game that only one other account joins
+    for account in (admin, player):
+        profiler.profile(
+            scenario,
+            "get_box_game_register",
+            lambda account=account: app.new_group().get_box_game_register(
+                args=(profiler.pay(account, cst.BOX_R_COST),),
+                params=profiler.call_params(account),
+            ),
+        )
+    game_id = app.state.global_state.game_id  # Id the next new game instance is created with
+    profiler.profile(
+        scenario,
+        "new_game",
+        lambda: app.new_group().new_game(
+            args=(
+                False,
+                3,
+                profiler.pay(admin, cst.BOX_S_COST),
+                profiler.pay(admin, cst.BOX_P_PAGE_COST),
+                profiler.pay(admin, stake + cst.SEED_CACHE_DEPOSIT),
+            ),
+            params=profiler.call_params(admin),
+        ),
+    )
+    profiler.profile(
+        scenario,
+        "join_game",
+        lambda: app.new_group().join_game(
+            args=(game_id, profiler.pay(player, stake)),
+            params=profiler.call_params(player),
+        ),
+    )
+
+    # Let the staking phase expire, so a keeper starts the game w/ an open seat
+    skip_phase(algorand, dispenser)
+    profiler.profile(
+        scenario,
+        "trigger_game_event",
+        lambda: app.new_group().trigger_game_event(
+            args=(game_id, 0), params=profiler.call_params(dispenser)
+        ),
+    )
+
+    # Let the live phase expire w/o any plays, so a keeper finalizes the game
+    skip_phase(algorand, dispenser)
+    profiler.profile(
+        scenario,
+        "trigger_game_event",
+        lambda: app.new_group().trigger_game_event(
+            args=(game_id, 2), params=profiler.call_params(dispenser)
+        ),
+    )
+    algorand.client.algod.set_timestamp_offset(0)
+
+
+def summarize(records: list[ProfileRecord]) -> Summary:
+    """Reduces the records to the worst case of every metric per scenario and method."""
+    summary: Summary = {}
+    for record in records:
+        worst = summary.setdefault(record["scenario"], {}).setdefault(
+            record["method"], {"calls": 0}
+        )
+        worst["calls"] += 1
+        for metric in METRIC_NAMES:
+            worst[metric] = max(worst.get(metric, 0), record[metric])
+    return summary
+
+
+def deploy_app(
+    algorand: AlgorandClient, creator: SigningAccount, closed_form_score: int = 0
+) -> tuple[PieoutClient, TealTemplateParams]:
+    """Deploys a stub VRF beacon, then a funded Pieout app pointed at it, and returns the app w/ its template params."""
+    beacon_client, _ = algorand.client.get_typed_app_factory(
+        VrfBeaconStubFactory,
+        default_sender=creator.address,
+        default_signer=creator.signer,
+    ).send.create.bare()
+    template_params: TealTemplateParams = {
+        "GEN_UNIX": int(datetime.now().timestamp()),
+        "CLOSED_FORM_SCORE": closed_form_score,
+        "VRF_BEACON_APP_ID": beacon_client.app_id,
+    }
+    app, _ = algorand.client.get_typed_app_factory(
+        PieoutFactory,
+        default_sender=creator.address,
+        default_signer=creator.signer,
+        compilation_params=AppClientCompilationParams(
+            deploy_time_params=template_params,
+            updatable=None,
+            deletable=True,
+        ),
+    ).deploy(
+        on_update=OnUpdate.ReplaceApp,
+        on_schema_break=OnSchemaBreak.ReplaceApp,
+        create_params=PieoutMethodCallCreateParams(
+            method="generate", max_fee=micro_algo(5_000)
+        ),
+    )
+
+    # Fund the app account minimum balance
+    algorand.send.payment(
+        PaymentParams(
+            sender=creator.address,
+            signer=creator.signer,
+            receiver=app.app_address,
+            amount=micro_algo(1_000_000),
+        )
+    )
+    return app, template_params
+
+
+def profile(
+    output_path: Path, lobby_sizes: tuple[int, ...] = DEFAULT_LOBBY_SIZES
+) -> ProfileReport:
+    """
+    Deploys Pieout against a stub VRF beacon on LocalNet, profiles its ABI methods through full game cycles
+    at every lobby size plus a timed out game, and writes the results to a JSON file.
+    Methods that need rounds or game states out of reach of these scenarios (the deprecated
+    `play_game` pair, `retire_game`, `prune_round_seeds` and the register sweeps) are not profiled.
+    """
+    algorand = AlgorandClient.from_environment()
+    dispenser = algorand.account.dispenser_from_environment()
+    creator = fund_account(algorand, dispenser, 100_000_000)
+    app, template_params = deploy_app(algorand, creator)
+
+    # Profile the one-time setup, then a full game cycle at every lobby size and a timed out game
+    profiler = Profiler(algorand=algorand, app=app, template_params=template_params)
+    profile_setup(profiler, creator)
+    for lobby_size in lobby_sizes:
+        profile_game_cycle(profiler, algorand, dispenser, lobby_size)
+    profile_timeout_finalization(profiler, algorand, dispenser)
+
+    # Write the records and their per scenario worst cases as JSON, sorted so runs can be diffed
+    report = ProfileReport(
+        app_id=app.app_id,
+        min_txn_fee=profiler.min_txn_fee,
+        lobby_sizes=list(lobby_sizes),
+        box_mbr=profiler.box_mbr,
+        summary=summarize(profiler.records),
+        records=profiler.records,
+    )
+    output_path.parent.mkdir(exist_ok=True, parents=True)
+    output_path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+    logger.info(f"Profile written to {output_path}")
+    return report
@@ -0,0 +1,16 @@
+# smart_contracts/vrf_beacon_stub/contract.py
+from algopy import ARC4Contract, Bytes, Global, UInt64, arc4, op
+
+
+# Stub of the VRF Randomness Beacon smart contract for offline LocalNet deployments
+# NOTE: IMPORTANT: Outputs are deterministic and public, never point a TestNet or MainNet deployment at this app
+class VrfBeaconStub(ARC4Contract):
+    # Return a deterministic randomness value for a round that is not in the future, else fail like the beacon
+    # The round arg is named `round_` so it does not shadow the builtin, the method selector is unchanged
+    @arc4.abimethod(readonly=True)
+    def must_get(self, round_: UInt64, user_data: Bytes) -> Bytes:
+        # Fail transaction unless the assertion below evaluates True
+        assert round_ <= Global.round, "Round not available yet."
+
+        # Derive the randomness value from the round and the user data, mirroring the 32-byte beacon output
+        return op.sha512_256(op.itob(round_) + user_data)
@@ -1,8 +1,12 @@
 # tests/helpers.py
 import inspect
+import json
+import os
 from logging import Logger
+from pathlib import Path
 from typing import Callable, Optional
 
+import pytest
 from algokit_utils import CommonAppCallParams, PaymentParams, SendParams, micro_algo
 from algokit_utils.models import SigningAccount
 from algokit_utils.transactions.transaction_sender import SendAppTransactionResult
@@ -81,6 +85,70 @@ def send_app_call_txn(
         logger.warning(f"{description} transaction failed: {e}")
 
 
+# Define a helper method that advances LocalNet by a number of rounds, every transaction produces a round in dev mode
+def advance_rounds(app: PieoutClient, sender: SigningAccount, rounds: int) -> None:
+    for i in range(rounds):
+        app.algorand.send.payment(
+            PaymentParams(
+                sender=sender.address,
+                signer=sender.signer,
+                receiver=sender.address,
+                amount=micro_algo(0),
+                note=f'pieout:j{{"concern":"txn.pay;advance_round_{i}"}}',
+            )
+        )
+
+
+# Define a helper method that lists every value of the current metrics that grew past its baseline headroom
+def find_regressions(
+    baseline: dict, current: dict, tolerance: float, prefix: str = ""
+) -> list[str]:
+    regressions = []
+    for name, value in current.items():
+        # An entry new to the baseline fails until the baseline is re-recorded, it must not slip through unchecked
+        if name not in baseline:
+            regressions.append(f"{prefix}{name}: missing from baseline")
+            continue
+        if isinstance(value, dict):
+            regressions += find_regressions(
+                baseline[name], value, tolerance, f"{prefix}{name}."
+            )
+        else:
+            limit = int(baseline[name] * (1 + tolerance))
+            if value > limit:
+                regressions.append(f"{prefix}{name}: {value} > {limit}")
+    return regressions
+
+
+# Define a helper method that compares the current metrics of an entry against its stored baseline
+# Set the update env var to "1" to record the current metrics as the new baseline instead of comparing against it
+def check_baseline(
+    baseline_path: Path,
+    update_env: str,
+    key: str,
+    current: dict,
+    tolerance: float = 0.0,
+) -> None:
+    baseline = (
+        json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+    )
+
+    # Record the entry only when an update is requested
+    if os.environ.get(update_env) == "1":
+        baseline[key] = current
+        baseline_path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        pytest.skip(f"Recorded {baseline_path.name} baseline for {key}")
+
+    # A missing baseline fails instead of silently passing
+    assert (
+        key in baseline
+    ), f"No {baseline_path.name} baseline for {key}, record it by setting {update_env}=1"
+
+    # Fail on every metric that grew past its baseline headroom
+    regressions = find_regressions(baseline[key], current, tolerance)
+    assert not regressions, f"{key} regressed past baseline: {regressions}"
+
+
 # # Define a helper method that makes a read-only app call to read various game data
 # def read_game_data(
 #     app_client: PieoutClient,
@@ -0,0 +1,64 @@
+# tests/pieout_artifacts_test.py
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+# Contract source files and the compiled app spec generated from them
+PIEOUT_PATH = Path(__file__).parent.parent / "smart_contracts" / "pieout"
+SOURCE_PATHS = (PIEOUT_PATH / "contract.py", PIEOUT_PATH / "subroutines.py")
+ARC56_PATH = (
+    Path(__file__).parent.parent
+    / "smart_contracts"
+    / "artifacts"
+    / "pieout"
+    / "Pieout.arc56.json"
+)
+
+
+# Define a helper method that loads the compiled app spec, skip if the contract has not been built
+def load_arc56() -> dict:
+    if not ARC56_PATH.exists():
+        pytest.skip("Compiled app spec not found, build the contract with `algokit project run build`")
+    return json.loads(ARC56_PATH.read_text())
+
+
+# Guard against an app spec compiled from an older contract, its ABI methods must match the source
+def test_arc56_methods_match_source() -> None:
+    # Collect the names of the ABI methods defined in the contract source
+    source = SOURCE_PATHS[0].read_text()
+    source_methods = set(re.findall(r"@arc4\.abimethod[^\n]*\n\s+def (\w+)\(", source))
+
+    # Collect the names of the ABI methods found in the compiled app spec
+    arc56_methods = {method["name"] for method in load_arc56()["methods"]}
+
+    # Fail with the methods missing on either side, rebuild the artifacts to fix it
+    assert source_methods == arc56_methods, (
+        f"Stale artifacts, rebuild the contract with `algokit project run build`. "
+        f"Missing from app spec: {sorted(source_methods - arc56_methods)}, "
+        f"missing from source: {sorted(arc56_methods - source_methods)}"
+    )
+
+
+# Guard against an app spec compiled from an older contract, its ARC-28 event signatures must match the source
+def test_arc56_events_match_source() -> None:
+    # Collect the ARC-28 event signatures emitted by the contract source
+    source_events = {
+        signature
+        for path in SOURCE_PATHS
+        for signature in re.findall(r'arc4\.emit\(\s*"([^"]+)"', path.read_text())
+    }
+
+    # Collect the ARC-28 event signatures found in the compiled app spec
+    arc56_events = {
+        f"{event['name']}({','.join(arg['type'] for arg in event['args'])})"
+        for event in load_arc56().get("events", [])
+    }
+
+    # Fail with the events missing on either side, rebuild the artifacts to fix it
+    assert source_events == arc56_events, (
+        f"Stale artifacts, rebuild the contract with `algokit project run build`. "
+        f"Missing from app spec: {sorted(source_events - arc56_events)}, "
+        f"missing from source: {sorted(arc56_events - source_events)}"
+    )
@@ -0,0 +1,103 @@
+# tests/pieout_benchmark_test.py
+import logging
+from pathlib import Path
+
+import pytest
+from algokit_utils.algorand import AlgorandClient
+from algokit_utils.models import SigningAccount
+
+from smart_contracts.profiler import (
+    Profiler,
+    deploy_app,
+    fund_account,
+    profile_game_cycle,
+    profile_setup,
+    profile_timeout_finalization,
+    summarize,
+)
+
+from .helpers import check_baseline
+
+# Setup the logging.Logger
+logger = logging.getLogger(__name__)
+
+# Stored per scenario baseline of the worst opcode cost and min fee per method, plus the peak box MBR
+BASELINE_PATH = Path(__file__).parent / "pieout_benchmark_baseline.json"
+
+# Set this env var to "1" to record the current costs as the new baseline, a missing baseline fails the benchmark
+UPDATE_BASELINE_ENV = "PIEOUT_BENCHMARK_UPDATE"
+
+# Relative headroom a metric may grow over its baseline before the benchmark fails
+BENCHMARK_TOLERANCE = 0.05
+
+# Metrics gated against the baseline
+GATED_METRICS = ("opcode_cost", "min_fee")
+
+
+# Return an instance of the AlgorandClient object from the environment config
+@pytest.fixture(scope="module")
+def algorand() -> AlgorandClient:
+    return AlgorandClient.from_environment()
+
+
+# Return a dispenser account as SigningAccount object that will fund other accounts
+@pytest.fixture(scope="module")
+def dispenser(algorand: AlgorandClient) -> SigningAccount:
+    return algorand.account.dispenser_from_environment()  # LocalNet
+
+
+# Deploy the app w/ the constant-cost score sampler, so play costs do not depend on the rolled scores
+@pytest.fixture(scope="module")
+def profiler(algorand: AlgorandClient, dispenser: SigningAccount) -> Profiler:
+    creator = fund_account(algorand, dispenser, 100_000_000)
+    app, template_params = deploy_app(algorand, creator, closed_form_score=1)
+    profiler = Profiler(algorand=algorand, app=app, template_params=template_params)
+    profile_setup(profiler, creator)
+    return profiler
+
+
+# Define a helper method that compares a scenario against its committed baseline
+def check_scenario(profiler: Profiler, scenario: str) -> None:
+    summary = summarize(profiler.records)[scenario]
+    current = {
+        "box_mbr": profiler.box_mbr[scenario],
+        "methods": {
+            method: {metric: metrics[metric] for metric in GATED_METRICS}
+            for method, metrics in summary.items()
+        },
+    }
+    logger.info(f"Benchmark {scenario}: {current}")
+    check_baseline(
+        baseline_path=BASELINE_PATH,
+        update_env=UPDATE_BASELINE_ENV,
+        key=scenario,
+        current=current,
+        tolerance=BENCHMARK_TOLERANCE,
+    )
+
+
+# Benchmark the one-time creator setup that creates the shared boxes
+def test_benchmark_setup(profiler: Profiler) -> None:
+    check_scenario(profiler, "setup")
+
+
+# Benchmark a full play-through, reset and deletion of a game at every lobby size
+@pytest.mark.parametrize("lobby_size", [3, 8, 16])
+def test_benchmark_game_cycle(
+    profiler: Profiler,
+    algorand: AlgorandClient,
+    dispenser: SigningAccount,
+    lobby_size: int,
+) -> None:
+    profile_game_cycle(profiler, algorand, dispenser, lobby_size)
+    check_scenario(profiler, f"lobby_{lobby_size}")
+
+
+# Benchmark a game that goes live and is finalized by its phase timers expiring
+def test_benchmark_timeout_finalization(
+    profiler: Profiler,
+    algorand: AlgorandClient,
+    dispenser: SigningAccount,
+) -> None:
+    profile_timeout_finalization(profiler, algorand, dispenser)
+    check_scenario(profiler, "timeout")
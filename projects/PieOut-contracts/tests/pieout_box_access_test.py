@@ -0,0 +1,98 @@
+# tests/pieout_box_access_test.py
+import json
+import logging
+import re
+from pathlib import Path
+
+import pytest
+
+from .helpers import check_baseline
+
+# Setup the logging.Logger
+logger = logging.getLogger(__name__)
+
+# Compiled app artifacts, rebuild them before running this test so the TEAL matches the contract source
+ARTIFACTS_PATH = Path(__file__).parent.parent / "smart_contracts" / "artifacts" / "pieout"
+APPROVAL_TEAL_PATH = ARTIFACTS_PATH / "Pieout.approval.teal"
+ARC56_PATH = ARTIFACTS_PATH / "Pieout.arc56.json"
+
+# Stored per method baseline of the box read and write opcodes found in the compiled TEAL
+BASELINE_PATH = Path(__file__).parent / "pieout_box_access_baseline.json"
+
+# Set this env var to "1" to record the current counts as the new baseline, a missing baseline fails the test
+UPDATE_BASELINE_ENV = "PIEOUT_BOX_ACCESS_UPDATE"
+
+# Box opcodes gated against the baseline, whole box reads and writes plus partial ones
+GATED_OPS = ("box_get", "box_put", "box_extract", "box_replace")
+
+
+# Define a helper method that splits the approval TEAL into its subroutines, keyed by label
+def split_subroutines(teal: str) -> dict[str, list[str]]:
+    subroutines: dict[str, list[str]] = {}
+    current = None
+    for line in teal.splitlines():
+        code = line.split("//")[0].strip()
+        # A label without a block suffix opens a new subroutine, block labels stay inside the current one
+        if code.endswith(":") and "@" not in code:
+            current = code[:-1]
+            subroutines[current] = []
+        elif code and current is not None:
+            subroutines[current].append(code)
+    return subroutines
+
+
+# Define a helper method that counts the box opcodes of a subroutine, including every subroutine it calls
+def count_box_ops(
+    subroutines: dict[str, list[str]],
+    label: str,
+    memo: dict[str, dict[str, int]],
+    visiting: frozenset[str] = frozenset(),
+) -> dict[str, int]:
+    if label in memo:
+        return memo[label]
+    counts = dict.fromkeys(GATED_OPS, 0)
+    for code in subroutines.get(label, []):
+        op, *args = code.split()
+        if op in counts:
+            counts[op] += 1
+        elif op == "callsub" and args and args[0] not in visiting:
+            callee = count_box_ops(subroutines, args[0], memo, visiting | {label})
+            for box_op in GATED_OPS:
+                counts[box_op] += callee[box_op]
+    memo[label] = counts
+    return counts
+
+
+# Define a helper method that maps every ABI method to its implementation subroutine label
+def find_method_labels(subroutines: dict[str, list[str]]) -> dict[str, str]:
+    methods = [method["name"] for method in json.loads(ARC56_PATH.read_text())["methods"]]
+    labels = {}
+    for label in subroutines:
+        # Implementation labels are either the bare method name or its fully qualified name
+        name = re.sub(r"^.*\.", "", label)
+        if name in methods:
+            labels[name] = label
+    return labels
+
+
+# Guard against methods reading or writing the same box more often than the recorded baseline
+def test_box_access_per_method() -> None:
+    if not APPROVAL_TEAL_PATH.exists():
+        pytest.skip("Compiled approval TEAL not found, build the contract first")
+
+    # Count the static box reads and writes reachable from each ABI method
+    subroutines = split_subroutines(APPROVAL_TEAL_PATH.read_text())
+    memo: dict[str, dict[str, int]] = {}
+    current = {
+        method: count_box_ops(subroutines, label, memo)
+        for method, label in sorted(find_method_labels(subroutines).items())
+    }
+    logger.info(f"Box access per method: {current}")
+
+    # Fail on every method missing from the committed baseline or whose box reads or writes grew past it
+    check_baseline(
+        baseline_path=BASELINE_PATH,
+        update_env=UPDATE_BASELINE_ENV,
+        key="Pieout",
+        current=current,
+    )
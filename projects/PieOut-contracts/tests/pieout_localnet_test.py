@@ -28,9 +28,12 @@ from smart_contracts.artifacts.pieout.pieout_client import (
     PieoutMethodCallCreateParams,
     PieoutMethodCallDeleteParams,
 )
+from smart_contracts.artifacts.vrf_beacon_stub.vrf_beacon_stub_client import (
+    VrfBeaconStubFactory,
+)
 from smart_contracts.pieout import constants as cst
 
-from .helpers import create_payment_txn, send_app_call_txn
+from .helpers import advance_rounds, create_payment_txn, send_app_call_txn
 from .subscriber import (
     AlgorandSubscriber,
     create_subscriber,
@@ -84,15 +87,36 @@ def creator(algorand: AlgorandClient, dispenser: SigningAccount) -> SigningAccou
     return creator
 
 
+# Deploy the stub VRF beacon smart contract and return its app ID, LocalNet has no Randomness Beacon app
+@pytest.fixture(scope="session")
+def vrf_beacon_app_id(
+    algorand: AlgorandClient,
+    creator: SigningAccount,
+) -> int:
+    # Get a typed factory for the stub beacon and create a new instance of it
+    beacon_factory = algorand.client.get_typed_app_factory(
+        VrfBeaconStubFactory,
+        default_sender=creator.address,
+        default_signer=creator.signer,
+    )
+    beacon_client, _ = beacon_factory.send.create.bare()
+
+    # Return the stub beacon app ID
+    return beacon_client.app_id
+
+
 # Return a typed smart contract factory with default sender and signer
 @pytest.fixture(scope="session")
 def app_factory(
     algorand: AlgorandClient,
     creator: SigningAccount,
+    vrf_beacon_app_id: int,
 ) -> PieoutFactory:
     # Define the on-deployment/compilation parameters
     template_params: TealTemplateParams = {
         "GEN_UNIX": int(datetime.now().timestamp()),
+        "CLOSED_FORM_SCORE": 0,  # Score players by streaming PCG rolls
+        "VRF_BEACON_APP_ID": vrf_beacon_app_id,  # Stub beacon returns deterministic round seeds
     }
 
     # Return typed app factory object
@@ -265,6 +289,130 @@ def test_mint_trophy(
     logger.info(f"After mint: {read_box_game_trophy_after_txn.abi_return}")
 
 
+# Test case for app call transaction to call `init_game_pool` method of the smart contract
+def test_init_game_pool(
+    creator: SigningAccount,
+    apps: dict[str, PieoutClient],
+) -> None:
+    # Log
+    logger.info("Testing init_game_pool()")
+
+    # Get smart contract application from from apps dict
+    app = apps["pieout_client_1"]
+
+    # Define nested function that attemps to call the `init_game_pool` method
+    def try_init_game_pool_txn(
+        sender: SigningAccount, note: bytes | str | None = None
+    ) -> None:
+        # Create the required payment transaction
+        box_f_pay = create_payment_txn(
+            app=app,
+            sender=sender,
+            amount=cst.BOX_F_COST,
+            note=b'pieout:j{"concern":"txn.pay;box_f_mbr_pay"}',
+        )  # Box game pool MBR cost payment
+
+        # Send app call transaction to execute smart contract method `init_game_pool`
+        send_app_call_txn(
+            logger=logger,
+            app=app,
+            sender=sender,
+            method=app.send.init_game_pool,
+            args=(box_f_pay,),
+            note=note,
+            description="Init Game Pool App Call",
+        )
+
+    # Call `try_init_game_pool_txn`
+    try_init_game_pool_txn(
+        sender=creator,
+        note=b'pieout:j{"method":"init_game_pool","concern":"txn.app_call;init_game_pool_creator"}',
+    )
+
+
+# Test case for app call transaction to call `init_game_lobby` method of the smart contract
+def test_init_game_lobby(
+    creator: SigningAccount,
+    apps: dict[str, PieoutClient],
+) -> None:
+    # Log
+    logger.info("Testing init_game_lobby()")
+
+    # Get smart contract application from from apps dict
+    app = apps["pieout_client_1"]
+
+    # Define nested function that attemps to call the `init_game_lobby` method
+    def try_init_game_lobby_txn(
+        sender: SigningAccount, note: bytes | str | None = None
+    ) -> None:
+        # Create the required payment transaction
+        box_l_pay = create_payment_txn(
+            app=app,
+            sender=sender,
+            amount=cst.BOX_L_COST,
+            note=b'pieout:j{"concern":"txn.pay;box_l_mbr_pay"}',
+        )  # Box game lobby MBR cost payment
+
+        # Send app call transaction to execute smart contract method `init_game_lobby`
+        send_app_call_txn(
+            logger=logger,
+            app=app,
+            sender=sender,
+            method=app.send.init_game_lobby,
+            args=(box_l_pay,),
+            note=note,
+            description="Init Game Lobby App Call",
+        )
+
+    # Call `try_init_game_lobby_txn`
+    try_init_game_lobby_txn(
+        sender=creator,
+        note=b'pieout:j{"method":"init_game_lobby","concern":"txn.app_call;init_game_lobby_creator"}',
+    )
+
+
+# Test case for app call transaction to call `init_leaderboard` method of the smart contract
+def test_init_leaderboard(
+    creator: SigningAccount,
+    apps: dict[str, PieoutClient],
+) -> None:
+    # Log
+    logger.info("Testing init_leaderboard()")
+
+    # Get smart contract application from from apps dict
+    app = apps["pieout_client_1"]
+
+    # Define nested function that attemps to call the `init_leaderboard` method
+    def try_init_leaderboard_txn(
+        sender: SigningAccount, capacity: int, note: bytes | str | None = None
+    ) -> None:
+        # Create the required payment transaction
+        box_b_pay = create_payment_txn(
+            app=app,
+            sender=sender,
+            amount=cst.BOX_B_BASE_COST + capacity * cst.BOX_B_ENTRY_COST,
+            note=b'pieout:j{"concern":"txn.pay;box_b_mbr_pay"}',
+        )  # Box leaderboard MBR cost payment
+
+        # Send app call transaction to execute smart contract method `init_leaderboard`
+        send_app_call_txn(
+            logger=logger,
+            app=app,
+            sender=sender,
+            method=app.send.init_leaderboard,
+            args=(box_b_pay, capacity),
+            note=note,
+            description="Init Leaderboard App Call",
+        )
+
+    # Call `try_init_leaderboard_txn`
+    try_init_leaderboard_txn(
+        sender=creator,
+        capacity=cst.LEADERBOARD_MAX_CAPACITY,
+        note=b'pieout:j{"method":"init_leaderboard","concern":"txn.app_call;init_leaderboard_creator"}',
+    )
+
+
 # Test case for app call transaction to call `get_box_commit_rand` method of the smart contract
 def test_get_box_game_register(
     creator: SigningAccount,
@@ -344,12 +492,8 @@ def test_new_game(
         max_players: int,
         note: bytes | str | None = None,
     ) -> None:
-        # Define payment amounts
-        box_p_cost = (
-            apps["pieout_client_1"]
-            .send.calc_single_box_cost((10, max_players * 32))
-            .abi_return
-        )
+        # Define payment amounts, one players page box is paid for every 16 seats
+        box_p_cost = -(-max_players // cst.PLAYERS_PAGE_SEATS) * cst.BOX_P_PAGE_COST
 
         # Create the required payment transactions
         box_s_pay = create_payment_txn(
@@ -363,11 +507,11 @@ def test_new_game(
             sender=sender,
             amount=box_p_cost,
             note=b'pieout:j{"concern":"txn.pay;box_p_mbr_pay"}',
-        )  # Box game players MBR cost payment
+        )  # Box game players pages MBR cost payment
         stake_pay = create_payment_txn(
             app=app,
             sender=sender,
-            amount=cst.STAKE_AMOUNT,
+            amount=cst.STAKE_AMOUNT + cst.PLAY_FEE_ESCROW + cst.BOX_E_COST + cst.SEED_CACHE_DEPOSIT,
             note=b'pieout:j{"concern":"txn.pay;admin_stake_deposit_pay"}',
         )  # Admin stake deposit for prize pool payment
 
@@ -460,7 +604,7 @@ def test_join_game(
         stake_pay = create_payment_txn(
             app=app,
             sender=sender,
-            amount=cst.STAKE_AMOUNT,
+            amount=cst.STAKE_AMOUNT + cst.PLAY_FEE_ESCROW + cst.BOX_E_COST,
             note=b'pieout:j{"concern":"txn.pay;player_stake_deposit_pay"}',
         )  # Player stake deposit for prize pool payment
 
@@ -614,71 +758,48 @@ def test_trigger_game_event(
     logger.info(f"Global State: {app.state.global_state.get_all()}")
 
 
-# Test case for app call transaction to call `set_game_commit` method of the smart contract
-def test_set_game_commit(
-    creator: SigningAccount,
+# Test case for app call transaction to call `trigger_game_events` method of the smart contract
+def test_trigger_game_events(
     randy_factory: dict[str, SigningAccount],
     apps: dict[str, PieoutClient],
 ) -> None:
     # Log
-    logger.info("Testing set_game_commit()")
+    logger.info("Testing trigger_game_events()")
 
-    # Get smart contract applicationfrom from apps dict
+    # Get smart contract application from from apps dict
     app = apps["pieout_client_1"]
 
-    # Define nested function to try `set_game_commit` method call
-    def try_set_game_commit_txn(
-        sender: SigningAccount, game_id: int, note: bytes | str | None = None
+    # Define nested function that attemps to call the `trigger_game_events` method
+    def try_trigger_game_events_txn(
+        sender: SigningAccount,
+        game_ids: list[int],
+        trigger_ids: list[int],
+        note: bytes | str | None = None,
     ) -> None:
-        # Send app call transaction to execute smart contract method `set_game_commit`
+
+        # Send app call transaction to execute smart contract method `trigger_game_events`
         send_app_call_txn(
             logger=logger,
             app=app,
             sender=sender,
-            method=app.send.set_game_commit,
-            args=(game_id,),
+            method=app.send.trigger_game_events,
+            args=(game_ids, trigger_ids),
+            max_fee=micro_algo(10_000),
             note=note,
-            description="Set Game Commit App Call",
+            send_params=SendParams(cover_app_call_inner_transaction_fees=True),
+            description="Trigger Game Events App Call",
         )
 
-    # Randies to set_game_commit
-    randies_set_list = [
-        "randy_1",
-        "randy_2",
-        "randy_3",
-        "randy_4",
-        "randy_5",
-        "randy_6",
-        "randy_7",
-        # "randy_8",
-        # "randy_9",
-    ]
-
-    # Call `try_set_game_commit_txn` for creator
-    try_set_game_commit_txn(
-        sender=creator,
-        game_id=1,
-        note=b'pieout:j{"method":"set_game_commit","concern":"txn.app_call;set_game_commit_creator"}',
+    # Call `try_trigger_game_events_txn` for Games 1 and 2, events whose conditions are not met are skipped
+    try_trigger_game_events_txn(
+        sender=randy_factory["randy_1"],
+        game_ids=[1, 2, 1],
+        trigger_ids=[0, 0, 2],
+        note=b'pieout:j{"method":"trigger_game_events","concern":"txn.app_call;trigger_games_1_2_sweep"}',
     )
 
     # Log
-    logger.info(app.app_client.state.box.get_map_value(
-        map_name="box_game_register", key=decode_address(creator.address)
-    ))
-
-    # For every randy in `randies_set_list`
-    for randy in randies_set_list:
-        # Call `try_set_game_commit_txn`
-        try_set_game_commit_txn(
-            sender=randy_factory[randy],
-            game_id=1,
-            note=b'pieout:j{"method":"set_game_commit","concern":"txn.app_call;set_game_commit_randy_enum"}',
-        )
-
-        # Log
-        logger.info(app.app_client.state.box.get_map_value(
-            map_name="box_game_register", key=decode_address(randy_factory[randy].address)
-        ))
+    logger.info(f"Global State: {app.state.global_state.get_all()}")
 
 
 # Test case for app call transaction to call `play_game` method of the smart contract
@@ -694,45 +815,44 @@ def test_play_game(
     # Get smart contract application from from apps dict
     app = apps["pieout_client_1"]
 
-    # Define nested function that attemps to call the `play_game` method
+    # Define nested function that attemps to call the `play_game_v2` method
     def try_play_game_txn(
         sender: SigningAccount,
         game_id: int,
-        note_1: bytes | str | None = None,
-        note_2: bytes | str | None = None,
+        note: bytes | str | None = None,
+        settles: bool = False,  # noqa: FBT001, FBT002
     ) -> None:
         # Create a new atomic group composer
         composer = app.new_group().composer()
 
-        # Add `add_resource_budget_play_game` abimethod as first transaction of group
-        composer.add_app_call_method_call(
-            params=AppCallMethodCallParams(
-                sender=sender.address,
-                signer=sender.signer,
-                app_id=app.app_id,
-                max_fee=micro_algo(10_000),
-                method=Method.from_signature(
-                    s="up_ref_budget_for_play_game(uint64)void"
-                ),
-                args=[game_id],
-                note=note_1,
+        # A play that ends the game needs more than 8 references, a companion app call adds resource references
+        if settles:
+            composer.add_app_call_method_call(
+                params=AppCallMethodCallParams(
+                    sender=sender.address,
+                    signer=sender.signer,
+                    app_id=app.app_id,
+                    max_fee=micro_algo(10_000),
+                    method=Method.from_signature(s="up_ref_budget_for_play_game_batch(uint64)void"),
+                    args=[game_id],
+                    note=b'pieout:j{"method":"up_ref_budget_for_play_game_batch","concern":"txn.app_call;final_play_ref_budget"}',
+                )
             )
-        )
 
-        # Add `play_game` abimethod as second transaction of group
+        # Add `play_game_v2` abimethod as the last transaction of the group
         composer.add_app_call_method_call(
             params=AppCallMethodCallParams(
                 sender=sender.address,
                 signer=sender.signer,
                 app_id=app.app_id,
                 max_fee=micro_algo(50_000),
-                method=Method.from_signature(s="play_game(uint64)void"),
+                method=Method.from_signature(s="play_game_v2(uint64)void"),
                 args=[game_id],
-                note=note_2,
+                note=note,
             )
         )
 
-        # Use composer to send group transaction for sender
+        # Use composer to send standalone transaction for sender
         composer.send(params=SendParams(cover_app_call_inner_transaction_fees=True))
 
     # Randies to play Game 1
@@ -748,12 +868,14 @@ def test_play_game(
         # "randy_9",
     ]
 
+    # Every seated player is committed to the game commit round once Game 1 goes live, advance LocalNet past it
+    advance_rounds(app=app, sender=creator, rounds=cst.COMMIT_ROUND_DELTA + 1)
+
     # Call `try_play_game` for creator
     try_play_game_txn(
         sender=creator,
         game_id=1,
-        note_1=b'pieout:j{"method":"up_ref_budget_for_play_game","concern":"txn.app_call;up_ref_budget_for_play_game_creator"}',
-        note_2=b'pieout:j{"method":"play_game","concern":"txn.app_call;play_game_creator"}',
+        note=b'pieout:j{"method":"play_game_v2","concern":"txn.app_call;play_game_v2_creator"}',
     )
 
     # Log
@@ -763,12 +885,12 @@ def test_play_game(
 
     # For every randy in `randies_game_1`
     for randy in randies_game_1:
-        # Call `try_play_game`
+        # Call `try_play_game`, the last randy's play ends the game and is grouped with a companion app call
         try_play_game_txn(
             sender=randy_factory[randy],
             game_id=1,
-            note_1=b'pieout:j{"method":"up_ref_budget_for_play_game","concern":"txn.app_call;up_ref_budget_for_play_game_randy_enum"}',
-            note_2=b'pieout:j{"method":"play_game","concern":"txn.app_call;play_game_randy_enum"}',
+            note=b'pieout:j{"method":"play_game_v2","concern":"txn.app_call;play_game_v2_randy_enum"}',
+            settles=randy == randies_game_1[-1],
         )
 
         # Log
@@ -776,17 +898,228 @@ def test_play_game(
             map_name="box_game_register", key=decode_address(randy_factory[randy].address)
         ))
 
-    # Log
+    # Log, the last `play_game_v2` call settled Game 1 so its prize pool has been credited to the placements
     game_1_state = app.app_client.state.box.get_map_value(
         map_name="box_game_state", key=int.to_bytes(1, length=8, byteorder="big")
     )
 
     logger.info(game_1_state)
 
+    # The final play grouped with its companion app call must have settled Game 1
+    game_1_settled = app.state.box.box_game_state.get_value(1)
+    assert game_1_settled is not None
+    assert game_1_settled.active_players == 0, "final play_game_v2 did not settle Game 1"
+    assert game_1_settled.prize_pool == 0, "final play_game_v2 left the Game 1 prize pool unsettled"
+
     # Run subscriber in poll once mode
     # subscriber.poll_once()
 
 
+# Test case for app call transaction to call `claim_winnings` method of the smart contract
+def test_claim_winnings(
+    creator: SigningAccount,
+    randy_factory: dict[str, SigningAccount],
+    apps: dict[str, PieoutClient],
+) -> None:
+    # Log
+    logger.info("Testing claim_winnings()")
+
+    # Get smart contract application from from apps dict
+    app = apps["pieout_client_1"]
+
+    # Every Game 1 player may have placed, players without winnings are expected to fail the claim
+    for sender in [creator] + [randy_factory[f"randy_{i}"] for i in range(1, 8)]:
+        # Send app call transaction to execute smart contract method `claim_winnings`
+        send_app_call_txn(
+            logger=logger,
+            app=app,
+            sender=sender,
+            method=app.send.claim_winnings,
+            max_fee=micro_algo(2_000),
+            note=b'pieout:j{"method":"claim_winnings","concern":"txn.app_call;claim_winnings_enum"}',
+            send_params=SendParams(cover_app_call_inner_transaction_fees=True),
+            description="Claim Winnings App Call",
+        )
+
+
+# Test case for app call transaction to call `promote_ath` method of the smart contract
+def test_promote_ath(
+    randy_factory: dict[str, SigningAccount],
+    apps: dict[str, PieoutClient],
+) -> None:
+    # Log
+    logger.info("Testing promote_ath()")
+
+    # Get smart contract application from from apps dict
+    app = apps["pieout_client_1"]
+
+    # Any account may promote, a game already promoted on game over is expected to fail with no ath to promote
+    send_app_call_txn(
+        logger=logger,
+        app=app,
+        sender=randy_factory["randy_1"],
+        method=app.send.promote_ath,
+        args=(1,),
+        max_fee=micro_algo(2_000),
+        note=b'pieout:j{"method":"promote_ath","concern":"txn.app_call;promote_game_1_ath"}',
+        send_params=SendParams(cover_app_call_inner_transaction_fees=True),
+        description="Promote ATH App Call",
+    )
+
+    # Log
+    logger.info(f"Game Trophy: {app.state.box.box_game_trophy}")
+
+
+# Test case for a game whose last non-admin player plays via `play_game_v2`, it must settle before it can be deleted
+def test_play_game_v2_settles_game(
+    algorand: AlgorandClient,
+    randy_factory: dict[str, SigningAccount],
+    apps: dict[str, PieoutClient],
+) -> None:
+    # Log
+    logger.info("Testing play_game_v2() game over settlement")
+
+    # Get smart contract application from from apps dict
+    app = apps["pieout_client_1"]
+
+    # Players may hold seats in many games, randy_9 hosts no game yet
+    admin = randy_factory["randy_9"]
+    player = randy_factory["randy_3"]
+
+    # The global game id is the id the next new game instance is created with
+    game_id = app.state.global_state.game_id
+
+    # Create a quick play game hosted by the admin
+    send_app_call_txn(
+        logger=logger,
+        app=app,
+        sender=admin,
+        method=app.send.new_game,
+        args=(
+            True,  # noqa: FBT003
+            3,
+            create_payment_txn(app=app, sender=admin, amount=cst.BOX_S_COST),
+            create_payment_txn(app=app, sender=admin, amount=cst.BOX_P_PAGE_COST),
+            create_payment_txn(
+                app=app,
+                sender=admin,
+                amount=cst.STAKE_AMOUNT + cst.PLAY_FEE_ESCROW + cst.BOX_E_COST + cst.SEED_CACHE_DEPOSIT,
+            ),
+        ),
+        max_fee=micro_algo(3_000),
+        note=b'pieout:j{"method":"new_game","concern":"txn.app_call;new_game_v2_settle_admin"}',
+        description="New Game App Call",
+    )
+
+    # Seat the player next to the admin
+    send_app_call_txn(
+        logger=logger,
+        app=app,
+        sender=player,
+        method=app.send.join_game,
+        args=(
+            game_id,
+            create_payment_txn(
+                app=app,
+                sender=player,
+                amount=cst.STAKE_AMOUNT + cst.PLAY_FEE_ESCROW + cst.BOX_E_COST,
+            ),
+        ),
+        max_fee=micro_algo(50_000),
+        note=b'pieout:j{"method":"join_game","concern":"txn.app_call;join_game_v2_settle_player"}',
+        description="Join Game App Call",
+    )
+
+    # Admin makes the game go live via quick play
+    send_app_call_txn(
+        logger=logger,
+        app=app,
+        sender=admin,
+        method=app.send.trigger_game_event,
+        args=(game_id, 0),
+        max_fee=micro_algo(2_000),
+        note=b'pieout:j{"method":"trigger_game_event","concern":"txn.app_call;trigger_game_v2_settle_live"}',
+        send_params=SendParams(cover_app_call_inner_transaction_fees=True),
+        description="Trigger Game Event App Call",
+    )
+
+    # Advance LocalNet past the game commit round
+    advance_rounds(app=app, sender=player, rounds=cst.COMMIT_ROUND_DELTA + 1)
+
+    # The only non-admin player plays, leaving the admin as the sole remaining player, so the game is over
+    composer = app.new_group().composer()
+    composer.add_app_call_method_call(
+        params=AppCallMethodCallParams(
+            sender=player.address,
+            signer=player.signer,
+            app_id=app.app_id,
+            max_fee=micro_algo(10_000),
+            method=Method.from_signature(s="up_ref_budget_for_play_game_batch(uint64)void"),
+            args=[game_id],
+            note=b'pieout:j{"method":"up_ref_budget_for_play_game_batch","concern":"txn.app_call;v2_settle_ref_budget"}',
+        )
+    )
+    composer.add_app_call_method_call(
+        params=AppCallMethodCallParams(
+            sender=player.address,
+            signer=player.signer,
+            app_id=app.app_id,
+            max_fee=micro_algo(50_000),
+            method=Method.from_signature(s="play_game_v2(uint64)void"),
+            args=[game_id],
+            note=b'pieout:j{"method":"play_game_v2","concern":"txn.app_call;play_game_v2_settle_player"}',
+        )
+    )
+    composer.send(params=SendParams(cover_app_call_inner_transaction_fees=True))
+
+    # The game must be settled by the play itself, leaving nothing in the prize pool for the admin to take
+    game_state = app.state.box.box_game_state.get_value(game_id)
+    logger.info(game_state)
+    assert game_state is not None
+    assert game_state.active_players == 0, "play_game_v2 did not settle the game"
+    assert game_state.prize_pool == 0, "play_game_v2 left the prize pool unsettled"
+
+    # Deleting the settled game refunds only the box MBR to the admin, their winnings stay claimable
+    admin_balance_before = algorand.account.get_information(admin.address).amount.micro_algo
+    send_app_call_txn(
+        logger=logger,
+        app=app,
+        sender=admin,
+        method=app.send.delete_game,
+        args=(game_id,),
+        max_fee=micro_algo(5_000),
+        note=b'pieout:j{"method":"delete_game","concern":"txn.app_call;delete_game_v2_settled"}',
+        send_params=SendParams(cover_app_call_inner_transaction_fees=True),
+        description="Delete Game App Call",
+    )
+    admin_balance_after = algorand.account.get_information(admin.address).amount.micro_algo
+
+    # Log
+    logger.info(f"Admin balance change: {admin_balance_after - admin_balance_before}")
+    assert app.state.box.box_game_state.get_value(game_id) is None
+    assert (
+        admin_balance_after - admin_balance_before
+        <= cst.BOX_S_COST + cst.BOX_P_PAGE_COST
+    ), "delete_game paid out more than the box MBR"
+
+    # The admin never played, so their game seat box outlived the game and can be deleted for its MBR refund
+    send_app_call_txn(
+        logger=logger,
+        app=app,
+        sender=player,
+        method=app.send.del_box_game_seat,
+        args=(game_id, admin.address),
+        max_fee=micro_algo(2_000),
+        note=b'pieout:j{"method":"del_box_game_seat","concern":"txn.app_call;del_box_game_seat_v2_settled_admin"}',
+        send_params=SendParams(cover_app_call_inner_transaction_fees=True),
+        description="Delete Game Seat App Call",
+    )
+    admin_seat_key = game_id.to_bytes(8, "big") + decode_address(admin.address)
+    assert (
+        app.state.box.box_game_seat.get_value(admin_seat_key) is None
+    ), "del_box_game_seat did not delete the stale game seat box"
+
+
 # # Test case for app call transaction to call `trigger_game_event` method of the smart contract
 # def test_trigger_game_event(
 #     creator: SigningAccount,
@@ -938,6 +1271,44 @@ def test_play_game(
 #     # Log App Global State
 #     logger.info(f"Global State: {app.state.global_state.get_all()}")
 
+# def test_sweep_box_game_registers(
+#     creator: SigningAccount,
+#     randy_factory: dict[str, SigningAccount],
+#     apps: dict[str, PieoutClient],
+# ) -> None:
+#     # Get the app client from the apps dict
+#     app = apps["pieout_client_1"]
+
+#     # Define nested function to try `sweep_box_game_registers` method call
+#     def try_sweep_box_game_registers_txn(
+#         sender: SigningAccount,
+#         players: list[str],
+#         note: bytes | str | None = None
+#     ) -> None:
+
+#         # Send app call transaction to execute smart contract method `sweep_box_game_registers`
+#         send_app_call_txn(
+#             logger=logger,
+#             app=app,
+#             sender=sender,
+#             method=app.send.sweep_box_game_registers,
+#             args=(players, ),
+#             max_fee=micro_algo(1_000 * (len(players) + 2)),
+#             note=note,
+#             send_params=SendParams(cover_app_call_inner_transaction_fees=True),
+#             description="Sweep Box Game Registers App Call",
+#         )
+
+#     # Call `try_sweep_box_game_registers_txn` for creator and randies, ineligible registers are skipped
+#     try_sweep_box_game_registers_txn(
+#         sender=randy_factory["randy_1"],
+#         players=[creator.address, randy_factory["randy_2"].address, randy_factory["randy_3"].address],
+#         note=b'pieout:j{"method":"sweep_box_game_registers","concern":"txn.app_call;sweep_box_game_registers_creator_randies"}'
+#     )
+
+#     # Log App Global State
+#     logger.info(f"Global State: {app.state.global_state.get_all()}")
+
 # Test case for app call transaction to call `reset_game` method of the smart contract
 def test_reset_game(
     randy_factory: dict[str, SigningAccount],
@@ -962,7 +1333,7 @@ def test_reset_game(
         stake_pay = create_payment_txn(
             app=app,
             sender=sender,
-            amount=cst.STAKE_AMOUNT,
+            amount=cst.STAKE_AMOUNT + cst.PLAY_FEE_ESCROW + cst.BOX_E_COST + cst.SEED_CACHE_DEPOSIT,
             note=b'pieout:j{"concern":"txn.pay;admin_stake_deposit_pay"}'
         )  # Admin stake deposit for prize pool payment
 
@@ -995,6 +1366,460 @@ def test_reset_game(
     logger.info(game_1_state)
 
 
+# Test case for a read-only call to `read_games_page` returning a full page of game states
+def test_read_games_page(
+    algorand: AlgorandClient,
+    dispenser: SigningAccount,
+    apps: dict[str, PieoutClient],
+) -> None:
+    # Log
+    logger.info("Testing read_games_page() with a full page")
+
+    # Get smart contract application from from apps dict
+    app = apps["pieout_client_1"]
+
+    # The global game id is the id the next new game instance is created with, the game pool holds no retired games
+    start_id = app.state.global_state.game_id
+
+    # Create one game per host until a full page of consecutive game IDs exists
+    for i in range(cst.READ_GAMES_PAGE_MAX):
+        # Fund and register a fresh host account, an account can host only one game at a time
+        host = algorand.account.random()
+        algorand.send.payment(
+            PaymentParams(
+                sender=dispenser.address,
+                signer=dispenser.signer,
+                receiver=host.address,
+                amount=micro_algo(5_000_000),
+            )
+        )
+        send_app_call_txn(
+            logger=logger,
+            app=app,
+            sender=host,
+            method=app.send.get_box_game_register,
+            args=(create_payment_txn(app=app, sender=host, amount=cst.BOX_R_COST),),
+            note=b'pieout:j{"method":"get_box_game_register","concern":"txn.app_call;get_box_game_register_page_host"}',
+            description="Get Box Game Register App Call",
+        )
+        send_app_call_txn(
+            logger=logger,
+            app=app,
+            sender=host,
+            method=app.send.new_game,
+            args=(
+                False,  # noqa: FBT003
+                cst.PLAYERS_PAGE_SEATS,
+                create_payment_txn(app=app, sender=host, amount=cst.BOX_S_COST),
+                create_payment_txn(app=app, sender=host, amount=cst.BOX_P_PAGE_COST),
+                create_payment_txn(
+                    app=app,
+                    sender=host,
+                    amount=cst.STAKE_AMOUNT + cst.PLAY_FEE_ESCROW + cst.BOX_E_COST + cst.SEED_CACHE_DEPOSIT,
+                ),
+            ),
+            max_fee=micro_algo(3_000),
+            note=f'pieout:j{{"method":"new_game","concern":"txn.app_call;new_game_page_host_{i}"}}',
+            description="New Game App Call",
+        )
+
+    # A full page must fit inside the 1024-byte ABI return log
+    game_states = app.send.read_games_page(
+        args=(start_id, cst.READ_GAMES_PAGE_MAX)
+    ).abi_return
+
+    # Log
+    logger.info(game_states)
+    assert game_states is not None
+    assert len(game_states) == cst.READ_GAMES_PAGE_MAX, "read_games_page returned a partial page"
+    assert [entry.game_id for entry in game_states] == list(
+        range(start_id, start_id + cst.READ_GAMES_PAGE_MAX)
+    )
+
+
+
+# Test case for deleting a game with more players page boxes than a single app call can reference
+def test_delete_game_many_pages(
+    algorand: AlgorandClient,
+    dispenser: SigningAccount,
+    apps: dict[str, PieoutClient],
+) -> None:
+    # Log
+    logger.info("Testing delete_game() with many players pages")
+
+    # Get smart contract application from from apps dict
+    app = apps["pieout_client_1"]
+
+    # Seven players page boxes plus the game state, admin register and lobby boxes exceed the 8 references of one call
+    page_count = 7
+    seated_count = (page_count - 1) * cst.PLAYERS_PAGE_SEATS + 1
+    stake = cst.STAKE_AMOUNT + cst.PLAY_FEE_ESCROW + cst.BOX_E_COST
+
+    # Define nested function that funds a fresh account and creates its game register box
+    def fund_and_register(amount: int) -> SigningAccount:
+        account = algorand.account.random()
+        algorand.send.payment(
+            PaymentParams(
+                sender=dispenser.address,
+                signer=dispenser.signer,
+                receiver=account.address,
+                amount=micro_algo(amount),
+            )
+        )
+        send_app_call_txn(
+            logger=logger,
+            app=app,
+            sender=account,
+            method=app.send.get_box_game_register,
+            args=(create_payment_txn(app=app, sender=account, amount=cst.BOX_R_COST),),
+            note=b'pieout:j{"method":"get_box_game_register","concern":"txn.app_call;get_box_game_register_many_pages"}',
+            description="Get Box Game Register App Call",
+        )
+        return account
+
+    # The admin hosts a quick play game paying for every players page box
+    admin = fund_and_register(20_000_000)
+    game_id = app.state.global_state.game_id
+    send_app_call_txn(
+        logger=logger,
+        app=app,
+        sender=admin,
+        method=app.send.new_game,
+        args=(
+            True,  # noqa: FBT003
+            page_count * cst.PLAYERS_PAGE_SEATS,
+            create_payment_txn(app=app, sender=admin, amount=cst.BOX_S_COST),
+            create_payment_txn(
+                app=app, sender=admin, amount=page_count * cst.BOX_P_PAGE_COST
+            ),
+            create_payment_txn(app=app, sender=admin, amount=stake + cst.SEED_CACHE_DEPOSIT),
+        ),
+        max_fee=micro_algo(3_000),
+        note=b'pieout:j{"method":"new_game","concern":"txn.app_call;new_game_many_pages_admin"}',
+        description="New Game App Call",
+    )
+
+    # Seat enough players for the last players page box to be created
+    for i in range(seated_count - 1):
+        player = fund_and_register(2_000_000)
+        send_app_call_txn(
+            logger=logger,
+            app=app,
+            sender=player,
+            method=app.send.join_game,
+            args=(game_id, create_payment_txn(app=app, sender=player, amount=stake)),
+            max_fee=micro_algo(50_000),
+            note=f'pieout:j{{"method":"join_game","concern":"txn.app_call;join_game_many_pages_{i}"}}',
+            description="Join Game App Call",
+        )
+    game_state = app.state.box.box_game_state.get_value(game_id)
+    assert game_state is not None
+    assert game_state.pages_allocated == page_count
+
+    # Admin makes the game go live via quick play
+    send_app_call_txn(
+        logger=logger,
+        app=app,
+        sender=admin,
+        method=app.send.trigger_game_event,
+        args=(game_id, 0),
+        max_fee=micro_algo(2_000),
+        note=b'pieout:j{"method":"trigger_game_event","concern":"txn.app_call;trigger_game_many_pages_live"}',
+        send_params=SendParams(cover_app_call_inner_transaction_fees=True),
+        description="Trigger Game Event App Call",
+    )
+
+    # Move LocalNet block timestamps past the play window so the game can be ended without every player playing
+    algorand.client.algod.set_timestamp_offset(cst.PHASE_EXPIRY_INTERVAL + 60)
+    try:
+        advance_rounds(app=app, sender=admin, rounds=1)
+        send_app_call_txn(
+            logger=logger,
+            app=app,
+            sender=admin,
+            method=app.send.trigger_game_event,
+            args=(game_id, 2),
+            max_fee=micro_algo(20_000),
+            note=b'pieout:j{"method":"trigger_game_event","concern":"txn.app_call;trigger_game_many_pages_over"}',
+            send_params=SendParams(cover_app_call_inner_transaction_fees=True),
+            description="Trigger Game Event App Call",
+        )
+    finally:
+        algorand.client.algod.set_timestamp_offset(0)
+
+    # Delete the game, one ref budget call is added for every 8 players page boxes
+    composer = app.new_group().composer()
+    for i in range(-(-page_count // 8)):
+        composer.add_app_call_method_call(
+            params=AppCallMethodCallParams(
+                sender=admin.address,
+                signer=admin.signer,
+                app_id=app.app_id,
+                method=Method.from_signature(s="up_ref_budget_for_delete_game(uint64)void"),
+                args=[game_id],
+                note=f'pieout:j{{"method":"up_ref_budget_for_delete_game","concern":"txn.app_call;many_pages_ref_budget_{i}"}}',
+            )
+        )
+    composer.add_app_call_method_call(
+        params=AppCallMethodCallParams(
+            sender=admin.address,
+            signer=admin.signer,
+            app_id=app.app_id,
+            max_fee=micro_algo(5_000),
+            method=Method.from_signature(s="delete_game(uint64)void"),
+            args=[game_id],
+            note=b'pieout:j{"method":"delete_game","concern":"txn.app_call;delete_game_many_pages"}',
+        )
+    )
+    composer.send(params=SendParams(cover_app_call_inner_transaction_fees=True))
+
+    # The game state box and every players page box must be gone
+    page_key_prefix = b"p_" + game_id.to_bytes(8, "big")
+    box_names = [box.name_raw for box in algorand.app.get_box_names(app.app_id)]
+    assert app.state.box.box_game_state.get_value(game_id) is None
+    assert not [
+        name for name in box_names if name.startswith(page_key_prefix)
+    ], "delete_game left players page boxes behind"
+
+
+# Test case for deleting a game retired to the game pool and refunding its box MBR to the retired admin
+def test_delete_retired_game(
+    algorand: AlgorandClient,
+    dispenser: SigningAccount,
+    apps: dict[str, PieoutClient],
+) -> None:
+    # Log
+    logger.info("Testing delete_retired_game()")
+
+    # Get smart contract application from from apps dict
+    app = apps["pieout_client_1"]
+
+    # Fund and register a fresh admin account
+    admin = algorand.account.random()
+    algorand.send.payment(
+        PaymentParams(
+            sender=dispenser.address,
+            signer=dispenser.signer,
+            receiver=admin.address,
+            amount=micro_algo(5_000_000),
+        )
+    )
+    send_app_call_txn(
+        logger=logger,
+        app=app,
+        sender=admin,
+        method=app.send.get_box_game_register,
+        args=(create_payment_txn(app=app, sender=admin, amount=cst.BOX_R_COST),),
+        note=b'pieout:j{"method":"get_box_game_register","concern":"txn.app_call;get_box_game_register_retired_admin"}',
+        description="Get Box Game Register App Call",
+    )
+
+    # The admin hosts a game and retires it to the game pool before anyone joins
+    game_id = app.state.global_state.game_id
+    send_app_call_txn(
+        logger=logger,
+        app=app,
+        sender=admin,
+        method=app.send.new_game,
+        args=(
+            False,  # noqa: FBT003
+            3,
+            create_payment_txn(app=app, sender=admin, amount=cst.BOX_S_COST),
+            create_payment_txn(app=app, sender=admin, amount=cst.BOX_P_PAGE_COST),
+            create_payment_txn(
+                app=app,
+                sender=admin,
+                amount=cst.STAKE_AMOUNT + cst.PLAY_FEE_ESCROW + cst.BOX_E_COST + cst.SEED_CACHE_DEPOSIT,
+            ),
+        ),
+        max_fee=micro_algo(3_000),
+        note=b'pieout:j{"method":"new_game","concern":"txn.app_call;new_game_retired_admin"}',
+        description="New Game App Call",
+    )
+    send_app_call_txn(
+        logger=logger,
+        app=app,
+        sender=admin,
+        method=app.send.retire_game,
+        args=(game_id,),
+        max_fee=micro_algo(5_000),
+        note=b'pieout:j{"method":"retire_game","concern":"txn.app_call;retire_game_retired_admin"}',
+        send_params=SendParams(cover_app_call_inner_transaction_fees=True),
+        description="Retire Game App Call",
+    )
+
+    # The retired game is the head of its game pool bucket, so there is no previous pool entry
+    admin_balance_before = algorand.account.get_information(admin.address).amount.micro_algo
+    send_app_call_txn(
+        logger=logger,
+        app=app,
+        sender=admin,
+        method=app.send.delete_retired_game,
+        args=(game_id, 0),
+        max_fee=micro_algo(5_000),
+        note=b'pieout:j{"method":"delete_retired_game","concern":"txn.app_call;delete_retired_game_head"}',
+        send_params=SendParams(cover_app_call_inner_transaction_fees=True),
+        description="Delete Retired Game App Call",
+    )
+    admin_balance_after = algorand.account.get_information(admin.address).amount.micro_algo
+
+    # Log
+    logger.info(f"Admin balance change: {admin_balance_after - admin_balance_before}")
+    assert app.state.box.box_game_state.get_value(game_id) is None
+    assert (
+        admin_balance_after - admin_balance_before
+        >= cst.BOX_S_COST + cst.BOX_P_PAGE_COST - 5_000
+    ), "delete_retired_game did not refund the retired game box MBR"
+
+
+# Test case for a placed player who deletes their game register after playing, the settlement pays them directly
+def test_settle_pays_player_without_register(
+    algorand: AlgorandClient,
+    dispenser: SigningAccount,
+    apps: dict[str, PieoutClient],
+) -> None:
+    # Log
+    logger.info("Testing game over settlement for a placed player without a game register")
+
+    # Get smart contract application from from apps dict
+    app = apps["pieout_client_1"]
+
+    # Fund and register fresh admin and player accounts
+    admin, player_1, player_2 = [algorand.account.random() for _ in range(3)]
+    for account in (admin, player_1, player_2):
+        algorand.send.payment(
+            PaymentParams(
+                sender=dispenser.address,
+                signer=dispenser.signer,
+                receiver=account.address,
+                amount=micro_algo(5_000_000),
+            )
+        )
+        send_app_call_txn(
+            logger=logger,
+            app=app,
+            sender=account,
+            method=app.send.get_box_game_register,
+            args=(create_payment_txn(app=app, sender=account, amount=cst.BOX_R_COST),),
+            note=b'pieout:j{"method":"get_box_game_register","concern":"txn.app_call;get_box_game_register_no_register_settle"}',
+            description="Get Box Game Register App Call",
+        )
+
+    # The admin hosts a quick play game and both players join it
+    game_id = app.state.global_state.game_id
+    send_app_call_txn(
+        logger=logger,
+        app=app,
+        sender=admin,
+        method=app.send.new_game,
+        args=(
+            True,  # noqa: FBT003
+            3,
+            create_payment_txn(app=app, sender=admin, amount=cst.BOX_S_COST),
+            create_payment_txn(app=app, sender=admin, amount=cst.BOX_P_PAGE_COST),
+            create_payment_txn(
+                app=app,
+                sender=admin,
+                amount=cst.STAKE_AMOUNT + cst.PLAY_FEE_ESCROW + cst.BOX_E_COST + cst.SEED_CACHE_DEPOSIT,
+            ),
+        ),
+        max_fee=micro_algo(3_000),
+        note=b'pieout:j{"method":"new_game","concern":"txn.app_call;new_game_no_register_settle"}',
+        description="New Game App Call",
+    )
+    for player in (player_1, player_2):
+        send_app_call_txn(
+            logger=logger,
+            app=app,
+            sender=player,
+            method=app.send.join_game,
+            args=(
+                game_id,
+                create_payment_txn(
+                    app=app,
+                    sender=player,
+                    amount=cst.STAKE_AMOUNT + cst.PLAY_FEE_ESCROW + cst.BOX_E_COST,
+                ),
+            ),
+            max_fee=micro_algo(50_000),
+            note=b'pieout:j{"method":"join_game","concern":"txn.app_call;join_game_no_register_settle"}',
+            description="Join Game App Call",
+        )
+
+    # Admin makes the game go live via quick play, then LocalNet advances past the game commit round
+    send_app_call_txn(
+        logger=logger,
+        app=app,
+        sender=admin,
+        method=app.send.trigger_game_event,
+        args=(game_id, 0),
+        max_fee=micro_algo(2_000),
+        note=b'pieout:j{"method":"trigger_game_event","concern":"txn.app_call;trigger_no_register_settle_live"}',
+        send_params=SendParams(cover_app_call_inner_transaction_fees=True),
+        description="Trigger Game Event App Call",
+    )
+    advance_rounds(app=app, sender=player_1, rounds=cst.COMMIT_ROUND_DELTA + 1)
+
+    # Define nested function that plays via `play_game_v2` preceded by a companion call adding resource references
+    def play_game_v2_txn(sender: SigningAccount) -> None:
+        composer = app.new_group().composer()
+        composer.add_app_call_method_call(
+            params=AppCallMethodCallParams(
+                sender=sender.address,
+                signer=sender.signer,
+                app_id=app.app_id,
+                max_fee=micro_algo(10_000),
+                method=Method.from_signature(s="up_ref_budget_for_play_game_batch(uint64)void"),
+                args=[game_id],
+                note=b'pieout:j{"method":"up_ref_budget_for_play_game_batch","concern":"txn.app_call;no_register_settle_ref_budget"}',
+            )
+        )
+        composer.add_app_call_method_call(
+            params=AppCallMethodCallParams(
+                sender=sender.address,
+                signer=sender.signer,
+                app_id=app.app_id,
+                max_fee=micro_algo(50_000),
+                method=Method.from_signature(s="play_game_v2(uint64)void"),
+                args=[game_id],
+                note=b'pieout:j{"method":"play_game_v2","concern":"txn.app_call;play_game_v2_no_register_settle"}',
+            )
+        )
+        composer.send(params=SendParams(cover_app_call_inner_transaction_fees=True))
+
+    # The first player plays, placing in the game, then deletes their game register while the game is still live
+    claimable_before = app.state.box.box_game_register.get_value(player_1.address).claimable
+    play_game_v2_txn(player_1)
+
+    # Resolving their own play refunds the player their unused fee escrow along with the game seat box MBR
+    assert (
+        app.state.box.box_game_register.get_value(player_1.address).claimable - claimable_before
+        == cst.BOX_E_COST + cst.PLAY_FEE_ESCROW
+    ), "player resolving their own play was not refunded their fee escrow"
+    send_app_call_txn(
+        logger=logger,
+        app=app,
+        sender=player_1,
+        method=app.send.del_box_game_register_for_self,
+        max_fee=micro_algo(2_000),
+        note=b'pieout:j{"method":"del_box_game_register_for_self","concern":"txn.app_call;del_register_placed_player"}',
+        send_params=SendParams(cover_app_call_inner_transaction_fees=True),
+        description="Del Box Game Register For Self App Call",
+    )
+    assert app.state.box.box_game_register.get_value(player_1.address) is None
+
+    # The second player plays, leaving the admin as the sole remaining player, so the game settles
+    player_1_balance_before = algorand.account.get_information(player_1.address).amount.micro_algo
+    play_game_v2_txn(player_2)
+    player_1_balance_after = algorand.account.get_information(player_1.address).amount.micro_algo
+
+    # Both players placed first or second, the smallest of those shares must reach the first player's account
+    logger.info(f"Player 1 balance change: {player_1_balance_after - player_1_balance_before}")
+    assert (
+        player_1_balance_after - player_1_balance_before
+        >= 3 * cst.STAKE_AMOUNT * 30 // 100
+    ), "game over settlement did not pay the placed player without a game register"
+
 # # Test case for app call transaction to call `delete_game` method of the smart contract
 # def test_delete_game(
 #     randy_factory: dict[str, SigningAccount],
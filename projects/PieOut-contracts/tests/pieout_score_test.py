@@ -0,0 +1,122 @@
+# tests/pieout_score_test.py
+import hashlib
+from fractions import Fraction
+
+from smart_contracts.pieout import constants as cst
+
+# Define the number of seeds sampled by each scoring path
+SAMPLE_SIZE = 100_000
+
+# Define the score bins compared by the chi-square test (scores at or above the last bin are pooled together)
+SCORE_BINS = 26
+
+# Chi-square critical value for 25 degrees of freedom at a 0.001 significance level
+CHI_SQUARE_CRITICAL = 52.62
+
+# Define the PCG32 constants used to model the on-chain PCG path
+PCG_MULTIPLIER = 6364136223846793005
+PCG_INCREMENT = 1442695040888963407
+MASK_64 = 2**64 - 1
+
+# Define the survival probability of a single roll and the fixed-point survival powers used by the contract
+SURVIVAL = Fraction(65535 - cst.ELIM_THRESHOLD, 65535)
+SURVIVAL_POWS = {
+    1: cst.SCORE_SURVIVAL_POW_1,
+    2: cst.SCORE_SURVIVAL_POW_2,
+    4: cst.SCORE_SURVIVAL_POW_4,
+    8: cst.SCORE_SURVIVAL_POW_8,
+    16: cst.SCORE_SURVIVAL_POW_16,
+    32: cst.SCORE_SURVIVAL_POW_32,
+    64: cst.SCORE_SURVIVAL_POW_64,
+    128: cst.SCORE_SURVIVAL_POW_128,
+}
+
+
+# Define a helper method that derives a deterministic 32-byte seed, standing in for the VRF beacon output
+def make_seed(i: int) -> bytes:
+    return hashlib.new("sha512_256", i.to_bytes(8, "big")).digest()
+
+
+# Define a helper method that advances a PCG32 state and returns the new state with its 32-bit output
+def pcg32_step(state: int) -> tuple[int, int]:
+    new_state = (state * PCG_MULTIPLIER + PCG_INCREMENT) & MASK_64
+    xorshifted = (((state >> 18) ^ state) >> 27) & 0xFFFFFFFF
+    rot = state >> 59
+    return new_state, ((xorshifted >> rot) | (xorshifted << ((-rot) & 31))) & 0xFFFFFFFF
+
+
+# Define a helper method that draws a 16-bit roll in [1, 65535] using rejection sampling
+def pcg16_roll(state: int) -> tuple[int, int]:
+    while True:
+        state, candidate = pcg32_step(state)
+        candidate >>= 16
+        if candidate >= 1:
+            return state, candidate % 65535 + 1
+
+
+# Define a helper method that models the PCG scoring path of the contract
+def score_pcg(seed: bytes) -> int:
+    state = int.from_bytes(seed[16:24], "big")
+    state, _ = pcg16_roll(state)  # First roll is discarded
+    score = 0
+    while score < cst.MAX_SCORE:
+        state, roll = pcg16_roll(state)
+        if roll <= cst.ELIM_THRESHOLD:
+            break
+        score += 1
+    return score
+
+
+# Define a helper method that mirrors the fixed-point arithmetic of the contract closed-form scoring path
+def score_closed_form(seed: bytes) -> int:
+    draw = int.from_bytes(hashlib.new("sha512_256", seed).digest()[:8], "big")
+    score = 0
+    survival = MASK_64
+    for step in (128, 64, 32, 16, 8, 4, 2, 1):
+        candidate = (survival * SURVIVAL_POWS[step]) >> 64
+        if draw < candidate:
+            score += step
+            survival = candidate
+    return min(score, cst.MAX_SCORE)
+
+
+# Define a helper method that counts scores into bins, pooling the tail into the last bin
+def bin_scores(scores: list[int]) -> list[int]:
+    bins = [0] * SCORE_BINS
+    for score in scores:
+        bins[min(score, SCORE_BINS - 1)] += 1
+    return bins
+
+
+# Test that the fixed-point survival powers match q^k scaled by 2^64
+def test_survival_pow_constants() -> None:
+    for step, survival_pow in SURVIVAL_POWS.items():
+        assert survival_pow == int(SURVIVAL**step * 2**64), f"q^{step} constant mismatch"
+
+
+# Test that the closed-form sampler matches the geometric survival curve of the PCG path
+def test_closed_form_survival_curve() -> None:
+    scores = [score_closed_form(make_seed(i)) for i in range(SAMPLE_SIZE)]
+    for k in (1, 5, 10, 20):
+        observed = sum(score >= k for score in scores) / SAMPLE_SIZE
+        expected = float(SURVIVAL**k)
+        assert abs(observed - expected) < 0.01, f"P(score >= {k}) = {observed}, expected {expected}"
+
+
+# Test that the closed-form and PCG scoring paths produce statistically equivalent score distributions
+def test_closed_form_matches_pcg_distribution() -> None:
+    pcg_scores = [score_pcg(make_seed(i)) for i in range(SAMPLE_SIZE)]
+    closed_form_scores = [score_closed_form(make_seed(i)) for i in range(SAMPLE_SIZE)]
+
+    # Two-sample chi-square homogeneity test over the binned score counts of equal sized samples
+    chi_square = sum(
+        (a - b) ** 2 / (a + b)
+        for a, b in zip(bin_scores(pcg_scores), bin_scores(closed_form_scores))
+        if a + b
+    )
+    assert chi_square < CHI_SQUARE_CRITICAL, f"Chi-square statistic too large: {chi_square}"
+
+    # Both paths must also agree on the mean score within sampling error
+    pcg_mean = sum(pcg_scores) / SAMPLE_SIZE
+    closed_form_mean = sum(closed_form_scores) / SAMPLE_SIZE
+    assert abs(pcg_mean - closed_form_mean) < 0.1, f"Mean mismatch: {pcg_mean} vs {closed_form_mean}"
@@ -107,6 +107,7 @@
 #     # Define the on-deployment/compilation parameters
 #     template_params: TealTemplateParams = {
 #         "GEN_UNIX": int(datetime.now().timestamp()),
+#         "VRF_BEACON_APP_ID": cst.VRF_BEACON_TESTNET_APP_ID,
 #     }
 
 #     # Get creator account from accs dict
@@ -4,6 +4,10 @@ from algosdk.v2client import algod, indexer
 # Define a global watermark to track the last processed round to ensure continuous synchronized event monitoring
 watermark = 0
 
+# Define the last processed global event sequence number and the last one per game id to detect missed events
+event_seq = 0
+game_event_seqs: dict[int, int] = {}
+
 # Event schema defining the structure of game events emitted by the smart contract for the subscriber to monitor
 PIEOUT_EVENTS = {
     "group_name": "game_events",  # Logical grouping for related events
@@ -11,15 +15,29 @@ PIEOUT_EVENTS = {
         {
             "name": "game_live",  # Emitted when a new game starts and is ready for players
             "args": [
+                {"name": "seq", "type": "uint64"},
                 {"name": "game_id", "type": "uint64"},
+                {"name": "game_seq", "type": "uint64"},
                 {"name": "staking_finalized", "type": "bool"},
                 {"name": "expiry_ts", "type": "uint64"},
+                {"name": "commit_round", "type": "uint64"},
+            ],
+        },
+        {
+            "name": "fee_escrow_updated",  # Emitted when the play fee escrow held by a game changes
+            "args": [
+                {"name": "seq", "type": "uint64"},
+                {"name": "game_id", "type": "uint64"},
+                {"name": "game_seq", "type": "uint64"},
+                {"name": "fee_escrow", "type": "uint64"},
             ],
         },
         {
             "name": "player_score",  # Emitted when a player achieves a score in the game
             "args": [
+                {"name": "seq", "type": "uint64"},
                 {"name": "game_id", "type": "uint64"},
+                {"name": "game_seq", "type": "uint64"},
                 {"name": "player", "type": "address"},
                 {"name": "score", "type": "uint8"},
             ],
@@ -27,13 +45,126 @@ PIEOUT_EVENTS = {
         {
             "name": "game_over",  # Emitted when a game ends with final rankings
             "args": [
+                {"name": "seq", "type": "uint64"},
                 {"name": "game_id", "type": "uint64"},
-                {"name": "high_score", "type": "uint8"},
+                {"name": "game_seq", "type": "uint64"},
+                {"name": "first_place_score", "type": "uint8"},
+                {"name": "second_place_score", "type": "uint8"},
+                {"name": "third_place_score", "type": "uint8"},
                 {"name": "first_place_address", "type": "address"},
                 {"name": "second_place_address", "type": "address"},
                 {"name": "third_place_address", "type": "address"},
             ],
         },
+        {
+            "name": "game_created",  # Emitted when a new game instance is created and its admin is seated
+            "args": [
+                {"name": "seq", "type": "uint64"},
+                {"name": "game_id", "type": "uint64"},
+                {"name": "game_seq", "type": "uint64"},
+                {"name": "admin_address", "type": "address"},
+                {"name": "max_players", "type": "uint16"},
+                {"name": "quick_play_enabled", "type": "bool"},
+                {"name": "expiry_ts", "type": "uint64"},
+            ],
+        },
+        {
+            "name": "player_joined",  # Emitted when a player is seated in a game
+            "args": [
+                {"name": "seq", "type": "uint64"},
+                {"name": "game_id", "type": "uint64"},
+                {"name": "game_seq", "type": "uint64"},
+                {"name": "player", "type": "address"},
+                {"name": "seat_idx", "type": "uint16"},
+                {"name": "active_players", "type": "uint16"},
+            ],
+        },
+        {
+            "name": "seat_cleared",  # Emitted when a player's seat is vacated after their play resolves
+            "args": [
+                {"name": "seq", "type": "uint64"},
+                {"name": "game_id", "type": "uint64"},
+                {"name": "game_seq", "type": "uint64"},
+                {"name": "seat_idx", "type": "uint16"},
+            ],
+        },
+        {
+            "name": "game_reset",  # Emitted when a finished game is reset back to its staking phase w/ the admin seated
+            "args": [
+                {"name": "seq", "type": "uint64"},
+                {"name": "game_id", "type": "uint64"},
+                {"name": "game_seq", "type": "uint64"},
+                {"name": "max_players", "type": "uint16"},
+                {"name": "quick_play_enabled", "type": "bool"},
+                {"name": "expiry_ts", "type": "uint64"},
+            ],
+        },
+        {
+            "name": "game_deleted",  # Emitted when a game instance and its boxes are deleted
+            "args": [
+                {"name": "seq", "type": "uint64"},
+                {"name": "game_id", "type": "uint64"},
+                {"name": "game_seq", "type": "uint64"},
+            ],
+        },
+        {
+            "name": "game_retired",  # Emitted when a game instance is retired to the game pool
+            "args": [
+                {"name": "seq", "type": "uint64"},
+                {"name": "game_id", "type": "uint64"},
+                {"name": "game_seq", "type": "uint64"},
+            ],
+        },
+        {
+            "name": "register_created",  # Emitted when an account creates its game register box
+            "args": [
+                {"name": "seq", "type": "uint64"},
+                {"name": "player", "type": "address"},
+            ],
+        },
+        {
+            "name": "register_deleted",  # Emitted when a game register box is deleted and its balance refunded
+            "args": [
+                {"name": "seq", "type": "uint64"},
+                {"name": "player", "type": "address"},
+                {"name": "refund", "type": "uint64"},
+            ],
+        },
+        {
+            "name": "claimable_credited",  # Emitted when winnings or seat box refunds are credited to a game register
+            "args": [
+                {"name": "seq", "type": "uint64"},
+                {"name": "player", "type": "address"},
+                {"name": "amount", "type": "uint64"},
+            ],
+        },
+        {
+            "name": "seat_deleted",  # Emitted when a stale game seat box is deleted and its MBR refunded
+            "args": [
+                {"name": "seq", "type": "uint64"},
+                {"name": "game_id", "type": "uint64"},
+                {"name": "player", "type": "address"},
+                {"name": "refund", "type": "uint64"},
+            ],
+        },
+        {
+            "name": "winnings_claimed",  # Emitted when an account collects its claimable winnings
+            "args": [
+                {"name": "seq", "type": "uint64"},
+                {"name": "player", "type": "address"},
+                {"name": "amount", "type": "uint64"},
+            ],
+        },
+        {
+            "name": "ath_promoted",  # Emitted when a game topscorer beats the all-time highest score
+            "args": [
+                {"name": "seq", "type": "uint64"},
+                {"name": "game_id", "type": "uint64"},
+                {"name": "game_seq", "type": "uint64"},
+                {"name": "ath_address", "type": "address"},
+                {"name": "ath_score", "type": "uint8"},
+            ],
+        },
     ],
     "continue_on_error": False,  # Stop processing if event parsing fails
 }
@@ -45,6 +176,17 @@ def update_watermark(new_watermark: int) -> None:
 def get_watermark() -> int:
     return watermark
 
+# Record the sequence numbers of a parsed event and return the range of global sequence numbers missed before it
+def record_event_seq(args: dict) -> range:
+    global event_seq
+    missed = range(event_seq + 1, args["seq"])
+    event_seq = max(event_seq, args["seq"])
+    if "game_seq" in args:
+        game_event_seqs[args["game_id"]] = max(
+            game_event_seqs.get(args["game_id"], 0), args["game_seq"]
+        )
+    return missed
+
 def create_subscriber(
     algod_client: algod.AlgodClient,
     indexer_client: indexer.IndexerClient,
@@ -21,16 +21,10 @@ const ProfileAboutContent = () => {
           <strong>Hosting Game:</strong> Indicates if the user is currently hosting a game. Only one game can be hosted at a time; users
           must delete an existing game before creating a new one.
         </li>
-        <li>
-          <strong>Game ID:</strong> If zero, the user can join an existing game. A non-zero value means they’re already in one.
-        </li>
         <li>
           <strong>Best Score:</strong> The user's personal best score across all games ever played. This data does NOT persist if account gets
           unregistered from the application.
         </li>
-        <li>
-          <strong>Commit Round:</strong> The round used to generate a random score. It must be ≤ the current blockchain round.
-        </li>
         <li>
           <strong>Expiry Round:</strong> The round after which a user's registration expires. Playing games extends this window. Once
           expired, other users may unregister the account.
@@ -38,8 +32,8 @@ const ProfileAboutContent = () => {
       </ul>
 
       <p className="text-xs text-gray-400">
-        <strong>Note:</strong> Users can only commit to one game at a time. A non-zero Game ID means the user must first finish or expire
-        from the current game before committing again.
+        <strong>Note:</strong> Users can hold a seat in many games at once, but only one seat per round of each game. The seat deposit
+        of every game is credited back to the user's claimable balance once they play.
       </p>
     </div>
   )
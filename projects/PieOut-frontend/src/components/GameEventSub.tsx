@@ -229,6 +229,12 @@ const GameEventSub: React.FC = React.memo(() => {
                         <span className="text-red-400 font-semibold">Game Over</span>
                       </div>
                     )}
+                    {subCurrentEvent.name === 'ath_promoted' && (
+                      <div className="flex items-center gap-1">
+                        <div className="w-2 h-2 bg-purple-400 rounded-full"></div>
+                        <span className="text-purple-400 font-semibold">New ATH</span>
+                      </div>
+                    )}
                   </div>
                   <div className="flex items-center gap-1 ml-2">
                     <button
@@ -286,6 +292,13 @@ const GameEventSub: React.FC = React.memo(() => {
                       </div>
                     </div>
                   )}
+                  {subCurrentEvent.name === 'ath_promoted' && (
+                    <>
+                      {' '}
+                      • ATH Score: {String(subCurrentEvent.args.ath_score)}pts, Player:{' '}
+                      {ellipseAddress(String(subCurrentEvent.args.ath_address), 6)}
+                    </>
+                  )}
                 </div>
               </motion.div>
             </AnimatePresence>
@@ -100,8 +100,6 @@ const GameTable: React.FC = React.memo(() => {
   const [expectedStates, setExpectedStates] = useState({
     join: false,
     play: false,
-    set: false,
-    waitingForCommitRound: false,
     reset: false,
     gameLive: false,
     gameOver: false,
@@ -184,8 +182,6 @@ const GameTable: React.FC = React.memo(() => {
     setExpectedStates({
       join: false,
       play: false,
-      set: false,
-      waitingForCommitRound: false,
       reset: false,
       gameLive: false,
       gameOver: false,
@@ -242,17 +238,6 @@ const GameTable: React.FC = React.memo(() => {
     }
   }, [handleMethod, gameId, updateExpectedState])
 
-  // Handle set commit game transaction method call
-  const handleSetCommitGameTxn = useCallback(async () => {
-    try {
-      updateExpectedState('set', true)
-      await handleMethod('setGameCommit', { gameId })
-    } catch (error) {
-      updateExpectedState('set', false)
-      throw error
-    }
-  }, [handleMethod, gameId, updateExpectedState])
-
   // Handle reset game transaction method call
   const handleResetGameTxn = useCallback(async () => {
     if (!gameStateData) return
@@ -329,28 +314,6 @@ const GameTable: React.FC = React.memo(() => {
     }
   }, [expectedStates.play, gameStateData, updateExpectedState])
 
-  // Reset set state once game commit is registered and check commit round status
-  useEffect(() => {
-    if (expectedStates.set && gameRegisterData && gameRegisterData.gameId !== 0n) {
-      updateExpectedState('set', false)
-      const wasCommitRandRoundReached =
-        typeof lastRound === 'number' && lastRound !== null && BigInt(lastRound) >= gameRegisterData.commitRandRound
-      if (!wasCommitRandRoundReached) {
-        updateExpectedState('waitingForCommitRound', true)
-      }
-    }
-  }, [expectedStates.set, gameRegisterData, lastRound, updateExpectedState])
-
-  // Clear `waitingForCommitRound` once commit round is reached
-  useEffect(() => {
-    if (expectedStates.waitingForCommitRound && gameRegisterData && lastRound) {
-      const wasCommitRandRoundReached = typeof lastRound === 'number' && BigInt(lastRound) >= gameRegisterData.commitRandRound
-      if (wasCommitRandRoundReached) {
-        updateExpectedState('waitingForCommitRound', false)
-      }
-    }
-  }, [expectedStates.waitingForCommitRound, gameRegisterData, lastRound, updateExpectedState])
-
   // Reset "reset" state once reset conditions are met
   useEffect(() => {
     if (expectedStates.reset && gameStateData) {
@@ -500,15 +463,14 @@ const GameTable: React.FC = React.memo(() => {
 
       // Boolean conditions determining if the user can click play
       const canPlay =
-        gameRegisterData?.gameId === gameId &&
         gameStateData.stakingFinalized &&
         isPlayerInGame &&
         hasGameRegisterData &&
         currentTimestamp <= Number(gameStateData.expiryTs) &&
-        wasCommitRandRoundReached(lastRound, gameRegisterData.commitRandRound)
+        wasCommitRandRoundReached(lastRound, gameStateData.commitRound)
 
       // Boolean conditions determining if the play button click should display the loading animation
-      const isPlayLoading = isMethodLoading || expectedStates.play || expectedStates.set || expectedStates.waitingForCommitRound
+      const isPlayLoading = isMethodLoading || expectedStates.play
 
       // Define the tooltip message based on what condition is met
       const playTooltipMessage = !hasGameRegisterData
@@ -519,9 +481,9 @@ const GameTable: React.FC = React.memo(() => {
             ? 'Unavailable: This game has not started yet.'
             : currentTimestamp > Number(gameStateData.expiryTs)
               ? 'Unavailable: Live phase has ended. Pending game over trigger...'
-              : !wasCommitRandRoundReached(lastRound, gameRegisterData.commitRandRound)
+              : !wasCommitRandRoundReached(lastRound, gameStateData.commitRound)
                 ? 'Unavailable: Randomness commitment round not yet reached'
-                : 'Unavailable: A commit must be set first in order to play.'
+                : 'Unavailable: Your seat in this game has already been played.'
 
       return (
         <>
@@ -593,59 +555,23 @@ const GameTable: React.FC = React.memo(() => {
     gameId,
   ])
 
-  // Render the set table cell content
-  const renderSetContent = useCallback(() => {
-    // Only render content if game state data and activeAddres exists, else return null
-    if (!gameStateData || !activeAddress) return null
+  // Render the commit table cell content, every seated player is committed to the game commit round once it goes live
+  const renderCommitContent = useCallback(() => {
+    // Only render content if game state data exists, else return null
+    if (!gameStateData) return null
 
-    // Boolean conditiond determining if player is in game or not
-    const isPlayerInGame = gamePlayersData?.includes(activeAddress) || false
-
-    // Boolean conditions determining if the user can click join
-    const canSet =
-      gameStateData.stakingFinalized &&
-      isPlayerInGame &&
-      gameRegisterData !== undefined &&
-      gameRegisterData.gameId === 0n &&
-      currentTimestamp <= Number(gameStateData.expiryTs)
-
-    // Boolean conditions determining if the set button click should display the loading animation
-    const isSetLoading = isMethodLoading || expectedStates.set
-
-    // Define the tooltip message based on what condition is met
-    const tooltipMessage = !gameStateData.stakingFinalized
-      ? 'Unavailable: Game has not started yet.'
-      : !isPlayerInGame
-        ? 'Unavailable: You are not an active player in this game.'
-        : gameRegisterData === undefined
-          ? 'Unavailable: Profile registration data not available.'
-          : gameRegisterData.gameId !== 0n
-            ? 'Unavailable: Prior commitment unresolved.'
-            : 'Unavailable: Commitment set deadline expired.'
-
-    if (canSet && !isSetLoading) {
-      return <TableBtn onClick={handleSetCommitGameTxn}>Set</TableBtn>
+    // The game commit round is set once the game goes live
+    if (!gameStateData.stakingFinalized) {
+      return <Tooltip message="Pending: The commit round is set once the game goes live.">—</Tooltip>
     }
 
-    if (isSetLoading) {
-      return (
-        <TableBtn onClick={() => {}} disabled>
-          Set
-        </TableBtn>
-      )
-    }
+    // Boolean condition determining if the game commit round has been reached
+    const wasCommitRoundReached = typeof lastRound === 'number' && BigInt(lastRound) >= gameStateData.commitRound
 
-    return <Tooltip message={tooltipMessage}>Set</Tooltip>
-  }, [
-    gameStateData,
-    gameRegisterData,
-    gamePlayersData,
-    activeAddress,
-    handleSetCommitGameTxn,
-    expectedStates.set,
-    isMethodLoading,
-    currentTimestamp,
-  ])
+    return (
+      <span className={wasCommitRoundReached ? 'text-cyan-300' : 'text-indigo-200'}>{`${gameStateData.commitRound.toString()} ❒`}</span>
+    )
+  }, [gameStateData, lastRound])
 
   // Render the table body
   const renderTableBody = useCallback(() => {
@@ -718,7 +644,7 @@ const GameTable: React.FC = React.memo(() => {
             )}
           </TableCell>
 
-          <TableCell>{renderSetContent()}</TableCell>
+          <TableCell>{renderCommitContent()}</TableCell>
 
           <TableCell className="relative">
             <button
@@ -778,7 +704,7 @@ const GameTable: React.FC = React.memo(() => {
     activeAddress,
     renderAdminDropdown,
     renderPhaseContent,
-    renderSetContent,
+    renderCommitContent,
     renderTriggerDropdown,
     toggleDropdown,
     toggleModal,
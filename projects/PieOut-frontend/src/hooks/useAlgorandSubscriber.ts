@@ -9,15 +9,29 @@ const pieoutEvents = {
     {
       name: 'game_live',
       args: [
+        { name: 'seq', type: 'uint64' },
         { name: 'game_id', type: 'uint64' },
+        { name: 'game_seq', type: 'uint64' },
         { name: 'staking_finalized', type: 'bool' },
         { name: 'expiry_ts', type: 'uint64' },
+        { name: 'commit_round', type: 'uint64' },
+      ],
+    },
+    {
+      name: 'fee_escrow_updated',
+      args: [
+        { name: 'seq', type: 'uint64' },
+        { name: 'game_id', type: 'uint64' },
+        { name: 'game_seq', type: 'uint64' },
+        { name: 'fee_escrow', type: 'uint64' },
       ],
     },
     {
       name: 'player_score',
       args: [
+        { name: 'seq', type: 'uint64' },
         { name: 'game_id', type: 'uint64' },
+        { name: 'game_seq', type: 'uint64' },
         { name: 'player', type: 'address' },
         { name: 'score', type: 'uint8' },
       ],
@@ -25,7 +39,9 @@ const pieoutEvents = {
     {
       name: 'game_over',
       args: [
+        { name: 'seq', type: 'uint64' },
         { name: 'game_id', type: 'uint64' },
+        { name: 'game_seq', type: 'uint64' },
         { name: 'first_place_score', type: 'uint8' },
         { name: 'second_place_score', type: 'uint8' },
         { name: 'third_place_score', type: 'uint8' },
@@ -34,6 +50,16 @@ const pieoutEvents = {
         { name: 'third_place_address', type: 'address' },
       ],
     },
+    {
+      name: 'ath_promoted',
+      args: [
+        { name: 'seq', type: 'uint64' },
+        { name: 'game_id', type: 'uint64' },
+        { name: 'game_seq', type: 'uint64' },
+        { name: 'ath_address', type: 'address' },
+        { name: 'ath_score', type: 'uint8' },
+      ],
+    },
   ],
   continueOnError: false,
 }
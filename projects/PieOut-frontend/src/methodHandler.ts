@@ -23,7 +23,6 @@ const METHOD_REQUIREMENTS: Record<MethodNames, (keyof MethodHandlerProps)[]> = {
   resetGame: ['activeAddress', 'appMethods', 'appClient', 'gameId', 'changeQuickPlay', 'changeMaxPlayers', 'newMaxPlayers'],
   deleteGame: ['activeAddress', 'appMethods', 'appClient', 'gameId'],
   getBoxGameRegister: ['activeAddress', 'appMethods', 'appClient'],
-  setGameCommit: ['activeAddress', 'appMethods', 'appClient', 'gameId'],
   delBoxGameRegisterForSelf: ['activeAddress', 'appMethods', 'appClient'],
   delBoxGameRegisterForOther: ['activeAddress', 'appMethods', 'appClient', 'player'],
   triggerGameEvent: ['activeAddress', 'appMethods', 'appClient', 'gameId', 'triggerId'],
@@ -61,7 +60,6 @@ const METHOD_HANDLERS: Record<MethodNames, MethodHandler> = {
     ),
   deleteGame: (props) => mW.handleDeleteGame(props.appClient!, props.appMethods!, props.activeAddress!, props.gameId!),
   getBoxGameRegister: (props) => mW.handleGetBoxGameRegister(props.appClient!, props.appMethods!, props.activeAddress!),
-  setGameCommit: (props) => mW.handleSetGameCommit(props.appClient!, props.appMethods!, props.activeAddress!, props.gameId!),
   delBoxGameRegisterForSelf: (props) => mW.handleDelBoxGameRegisterForSelf(props.appClient!, props.appMethods!, props.activeAddress!),
   delBoxGameRegisterForOther: (props) =>
     mW.handleDelBoxGameRegisterForOther(props.appClient!, props.appMethods!, props.activeAddress!, props.player!),
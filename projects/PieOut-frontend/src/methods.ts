@@ -17,7 +17,13 @@ export class PieoutMethods {
       defaultSender: sender,
       defaultSigner: this.algorand.account.getSigner(sender),
       // GEN_UNIX must be different on each deployment to ensure approval bytecode is unique
-      deployTimeParams: { GEN_UNIX: BigInt(Math.floor(Date.now() / 1000)) },
+      // CLOSED_FORM_SCORE selects the constant-cost score sampler when set to 1, else PCG rolls are streamed
+      // VRF_BEACON_APP_ID is the Randomness Beacon app called for round seeds (TestNet: 600011887)
+      deployTimeParams: {
+        GEN_UNIX: BigInt(Math.floor(Date.now() / 1000)),
+        CLOSED_FORM_SCORE: BigInt(0),
+        VRF_BEACON_APP_ID: BigInt(600011887),
+      },
       updatable: undefined, // App has no update logic
       deletable: true, // Allow app deletion
     })
@@ -170,20 +176,94 @@ export class PieoutMethods {
     return result
   }
 
-  // Simulate read-only transaction that reads the game players box contents under a given key
-  async readBoxGamePlayers(appId: bigint, sender: string, gameId: bigint, note?: string | Uint8Array) {
+  // Simulate read-only transactions that read the game players page box contents under a given key
+  async readBoxGamePlayers(appId: bigint, sender: string, gameId: bigint, pageCount: bigint = 1n, note?: string | Uint8Array) {
+    // Use factory to get an instance of the application client by referencing the client unique ID
+    const client = this.factory.getAppClientById({ appId })
+
+    // Define an array to collect the active players of every page
+    const result: string[] = []
+
+    // Simulate an app call read-only transaction that executes the smart contract method called `readBoxGamePlayers` per page
+    for (let pageIdx = 0n; pageIdx < pageCount; pageIdx++) {
+      const page = await client.readBoxGamePlayers({
+        sender: sender,
+        signer: this.algorand.account.getSigner(sender),
+        args: { gameId: gameId, pageIdx: pageIdx }, // GAME ID and PAGE IDX args identify the game players page box
+        note: note,
+      })
+      result.push(...page)
+    }
+
+    // Return an array of string values, each element is an Algorand address of an active player
+    return result
+  }
+
+  // Simulate read-only transaction that reads the game states of up to 6 consecutive game IDs in a single call
+  async readGamesPage(appId: bigint, sender: string, startId: bigint, count: bigint, note?: string | Uint8Array) {
     // Use factory to get an instance of the application client by referencing the client unique ID
     const client = this.factory.getAppClientById({ appId })
 
-    // Simulate an app call read-only transaction that executes the smart contract method called `readBoxGamePlayers`
-    const result = await client.readBoxGamePlayers({
+    // Simulate an app call read-only transaction that executes the smart contract method called `readGamesPage`
+    const result = await client.readGamesPage({
       sender: sender,
       signer: this.algorand.account.getSigner(sender),
-      args: { gameId: gameId }, // GAME ID arg is the key that identifies the game players box we are looking up
+      args: { startId: startId, count: count }, // START ID and COUNT args identify the range of game IDs to read
       note: note,
     })
 
-    // Return an array of string values, each element is an Algorand address of an active player
+    // Return an array of (game ID, game state) entries, one per existing game in the range
+    return result
+  }
+
+  // Simulate read-only transaction that reads the roster summaries of up to 16 consecutive game IDs in a single call
+  async readRostersPage(appId: bigint, sender: string, startId: bigint, count: bigint, note?: string | Uint8Array) {
+    // Use factory to get an instance of the application client by referencing the client unique ID
+    const client = this.factory.getAppClientById({ appId })
+
+    // Simulate an app call read-only transaction that executes the smart contract method called `readRostersPage`
+    const result = await client.readRostersPage({
+      sender: sender,
+      signer: this.algorand.account.getSigner(sender),
+      args: { startId: startId, count: count }, // START ID and COUNT args identify the range of game IDs to read
+      note: note,
+    })
+
+    // Return an array of roster summaries, one per existing game in the range
+    return result
+  }
+
+  // Read a page of the open lobby index, listing games still in the staking phase w/ their free seat count
+  async readOpenLobbies(appId: bigint, sender: string, startSlot: bigint, count: bigint, note?: string | Uint8Array) {
+    // Use factory to get an instance of the application client by referencing the client unique ID
+    const client = this.factory.getAppClientById({ appId })
+
+    // Simulate an app call read-only transaction that executes the smart contract method called `readOpenLobbies`
+    const result = await client.readOpenLobbies({
+      sender: sender,
+      signer: this.algorand.account.getSigner(sender),
+      args: { startSlot: startSlot, count: count }, // START SLOT and COUNT args identify the range of lobby slots to read
+      note: note,
+    })
+
+    // Return an array of open lobby entries, one per listed game in the range
+    return result
+  }
+
+  // Read a page of the leaderboard, ranking the top personal best scores from highest to lowest
+  async readLeaderboard(appId: bigint, sender: string, startRank: bigint, count: bigint, note?: string | Uint8Array) {
+    // Use factory to get an instance of the application client by referencing the client unique ID
+    const client = this.factory.getAppClientById({ appId })
+
+    // Simulate an app call read-only transaction that executes the smart contract method called `readLeaderboard`
+    const result = await client.readLeaderboard({
+      sender: sender,
+      signer: this.algorand.account.getSigner(sender),
+      args: { startRank: startRank, count: count }, // START RANK and COUNT args identify the range of ranks to read
+      note: note,
+    })
+
+    // Return an array of leaderboard entries, one per ranked player in the range
     return result
   }
 
@@ -243,6 +323,22 @@ export class PieoutMethods {
     })
   }
 
+  // Allow user to collect the winnings credited to their game register box across every game they placed in
+  async claimWinnings(appId: bigint, sender: string, note?: string | Uint8Array) {
+    // Use factory to get an instance of the application client by referencing the client unique ID
+    const client = this.factory.getAppClientById({ appId })
+
+    // Send an app call transaction that executes the smart contract method called `claimWinnings`
+    await client.send.claimWinnings({
+      sender: sender,
+      signer: this.algorand.account.getSigner(sender),
+      args: [],
+      note: note,
+      maxFee: microAlgo(2_000), // Cover for inner transaction fee that pays out the claimable balance
+      coverAppCallInnerTransactionFees: true,
+    })
+  }
+
   // Allow user to create a new game instance within the application
   async newGame(
     appId: bigint,
@@ -257,15 +353,18 @@ export class PieoutMethods {
     // Use factory to get an instance of the application client by referencing the client unique ID
     const client = this.factory.getAppClientById({ appId })
 
-    // Simulate the app `calcSingleBoxCost` method to calculate the storage cost of creating a game players box
-    const { return: boxPAmount } = await client.send.calcSingleBoxCost({
+    // Simulate the app `calcSingleBoxCost` method to calculate the storage cost of creating a single game players page box
+    const { return: boxPPageAmount } = await client.send.calcSingleBoxCost({
       sender: sender,
       signer: this.algorand.account.getSigner(sender),
-      args: { keySize: 10, valueSize: maxPlayers * 32n }, // Num of max players * address size in bytes dictate value size
+      args: { keySize: 11, valueSize: 514 }, // Each page holds a 2-byte live seat bitmap plus 16 seats * address size in bytes
     })
 
-    // If game players box storage cost amount was not calculated successfully and remains undefined, throw error
-    if (boxPAmount === undefined) throw new Error('boxPAmount is undefined')
+    // If game players page box storage cost amount was not calculated successfully and remains undefined, throw error
+    if (boxPPageAmount === undefined) throw new Error('boxPPageAmount is undefined')
+
+    // One game players page box is paid for upfront for every 16 seats
+    const boxPAmount = boxPPageAmount * ((maxPlayers + 15n) / 16n)
 
     // Define the payment transactions to cover the cost of creating a new game instance
     const [boxSPay, boxPPay, stakePay] = await Promise.all([
@@ -274,15 +373,15 @@ export class PieoutMethods {
         sender: sender,
         signer: this.algorand.account.getSigner(sender),
         receiver: client.appAddress,
-        amount: microAlgo(80_500), // Amount needed to cover cost: 0.0805A
+        amount: microAlgo(62_900), // Amount needed to cover cost: 0.0629A
         note: noteBoxSPay,
       }),
-      // Create a payment transaction to cover the storage cost of creating a game players box
+      // Create a payment transaction to cover the storage cost of creating the game players page boxes
       this.algorand.createTransaction.payment({
         sender: sender,
         signer: this.algorand.account.getSigner(sender),
         receiver: client.appAddress,
-        amount: microAlgo(boxPAmount), // Amount needed to cover cost: depends on dynamic size at creation
+        amount: microAlgo(boxPAmount), // Amount needed to cover cost: depends on num of pages at creation
         note: noteBoxPPay,
       }),
       // Create a payment transaction to cover the entry stake
@@ -290,7 +389,7 @@ export class PieoutMethods {
         sender: sender,
         signer: this.algorand.account.getSigner(sender),
         receiver: client.appAddress,
-        amount: microAlgo(1_000_000), // current arbitrary stake pay amount
+        amount: microAlgo(1_052_600), // current arbitrary stake pay amount plus play fee escrow, game seat box MBR and seed cache deposit
         note: noteStakePay,
       }),
     ])
@@ -301,6 +400,8 @@ export class PieoutMethods {
       signer: this.algorand.account.getSigner(sender),
       args: { quickPlayEnabled: quickPlayEnabled, maxPlayers: maxPlayers, boxSPay: boxSPay, boxPPay: boxPPay, stakePay: stakePay },
       note: noteNewGame,
+      maxFee: microAlgo(3_000), // Cover for inner transaction fee that forwards box payments when a retired game is recycled
+      coverAppCallInnerTransactionFees: true,
     })
   }
 
@@ -314,7 +415,7 @@ export class PieoutMethods {
       sender,
       signer: this.algorand.account.getSigner(sender),
       receiver: client.appAddress,
-      amount: microAlgo(1_000_000), // current arbitrary stake pay amount
+      amount: microAlgo(1_033_300), // current arbitrary stake pay amount plus play fee escrow and game seat box MBR
       note: noteStakePay,
     })
 
@@ -337,7 +438,7 @@ export class PieoutMethods {
       sender: sender,
       signer: this.algorand.account.getSigner(sender),
       receiver: client.appAddress,
-      amount: microAlgo(29_700), // Amount needed to cover cost: 0.0297A
+      amount: microAlgo(23_300), // Amount needed to cover cost: 0.0233A
       note: noteBoxCPay,
     })
 
@@ -350,20 +451,6 @@ export class PieoutMethods {
     })
   }
 
-  // Allow user to set a commitment to a specific game instance, this is required in order to play the game one committed to
-  async setGameCommit(appId: bigint, sender: string, gameId: bigint, noteSetGameCommit?: string | Uint8Array) {
-    // Use factory to get an instance of the application client by referencing the client unique ID
-    const client = this.factory.getAppClientById({ appId })
-
-    // Send an app call transaction that executes the smart contract method called `setGameCommit`
-    await client.send.setGameCommit({
-      sender: sender,
-      signer: this.algorand.account.getSigner(sender),
-      args: { gameId: gameId }, // GAME ID is arg that denotes the game instance tied to the player's commitment
-      note: noteSetGameCommit,
-    })
-  }
-
   // Allow users to delete the game register box for their own account
   async delBoxGameRegisterForSelf(appId: bigint, sender: string, noteDelBoxGameRegisterForSelf?: string | Uint8Array) {
     // Use factory to get an instance of the application client by referencing the client unique ID
@@ -396,6 +483,22 @@ export class PieoutMethods {
     })
   }
 
+  // Allow any account to delete many expired game register boxes in one app call, ineligible registers are skipped
+  async sweepBoxGameRegisters(appId: bigint, sender: string, players: string[], noteSweepBoxGameRegisters?: string | Uint8Array) {
+    // Use factory to get an instance of the application client by referencing the client unique ID
+    const client = this.factory.getAppClientById({ appId })
+
+    // Send an app call transaction that executes the smart contract method called `sweepBoxGameRegisters`
+    await client.send.sweepBoxGameRegisters({
+      sender: sender,
+      signer: this.algorand.account.getSigner(sender),
+      args: { players: players }, // PLAYERS arg holds the keys of the game register boxes being deleted (max 3)
+      note: noteSweepBoxGameRegisters,
+      maxFee: microAlgo(1_000 * (2 * players.length + 2)), // Cover for an MBR refund and a claimable inner transaction per player plus the sender
+      coverAppCallInnerTransactionFees: true,
+    })
+  }
+
   // Allow user to play the designated game they committed to
   async playGame(
     appId: bigint,
@@ -453,6 +556,44 @@ export class PieoutMethods {
     })
   }
 
+  // Allow any account to act as a keeper and trigger the game events of many game instances in one app call
+  async triggerGameEvents(
+    appId: bigint,
+    sender: string,
+    gameIds: bigint[],
+    triggerIds: bigint[],
+    noteTriggerGameEvents?: string | Uint8Array,
+  ) {
+    // Use factory to get an instance of the application client by referencing the client unique ID
+    const client = this.factory.getAppClientById({ appId })
+
+    // Send an app call transaction that executes the smart contract method called `triggerGameEvents`
+    await client.send.triggerGameEvents({
+      sender: sender,
+      signer: this.algorand.account.getSigner(sender),
+      args: { gameIds: gameIds, triggerIds: triggerIds }, // Pair each game ID w/ its trigger ID, unmet events are skipped
+      note: noteTriggerGameEvents,
+      maxFee: microAlgo(10_000n * BigInt(gameIds.length)), // Cover for inner transaction fees of every game over check
+      coverAppCallInnerTransactionFees: true,
+    })
+  }
+
+  // Allow any user to promote the topscorer of a game to all-time high score holder if they beat the ath score
+  async promoteAth(appId: bigint, sender: string, gameId: bigint, notePromoteAth?: string | Uint8Array) {
+    // Use factory to get an instance of the application client by referencing the client unique ID
+    const client = this.factory.getAppClientById({ appId })
+
+    // Send an app call transaction that executes the smart contract method called `promoteAth`
+    await client.send.promoteAth({
+      sender: sender,
+      signer: this.algorand.account.getSigner(sender),
+      args: { gameId: gameId },
+      note: notePromoteAth,
+      maxFee: microAlgo(2_000), // Cover for the trophy clawback inner transaction fee
+      coverAppCallInnerTransactionFees: true,
+    })
+  }
+
   // Allow authorized user to reset an existing game instance within the application
   async resetGame(
     appId: bigint,
@@ -472,7 +613,7 @@ export class PieoutMethods {
       sender,
       signer: this.algorand.account.getSigner(sender),
       receiver: client.appAddress,
-      amount: microAlgo(1_000_000), // current arbitrary stake pay amount
+      amount: microAlgo(1_052_600), // current arbitrary stake pay amount plus play fee escrow, game seat box MBR and seed cache deposit
       note: noteStakePay,
     })
 
@@ -496,14 +637,37 @@ export class PieoutMethods {
     // Use factory to get an instance of the application client by referencing the client unique ID
     const client = this.factory.getAppClientById({ appId })
 
-    // Send an app call transaction that executes the smart contract method called `deleteGame`
-    await client.send.deleteGame({
+    // Every allocated players page box is deleted along with the game state box, add one ref budget call per 8 pages
+    const gameStateData = await client.state.box.boxGameState.value(gameId)
+    const refBudgetCalls = Math.ceil(Number(gameStateData?.pagesAllocated ?? 0n) / 8)
+
+    // Use algorand client to access the transaction composer
+    const composer = this.algorand.newGroup()
+
+    // Add app call transactions that execute the smart contract method called `upRefBudgetForDeleteGame`
+    for (let i = 0; i < refBudgetCalls; i++) {
+      composer.addAppCallMethodCall({
+        sender: sender,
+        signer: this.algorand.account.getSigner(sender),
+        appId: client.appId,
+        method: ABIMethod.fromSignature('up_ref_budget_for_delete_game(uint64)void'),
+        args: [gameId],
+        note: `up_ref_budget_for_delete_game_${i}`,
+      })
+    }
+
+    // Add an app call transaction that executes the smart contract method called `deleteGame`
+    composer.addAppCallMethodCall({
       sender: sender,
       signer: this.algorand.account.getSigner(sender),
-      args: { gameId: gameId }, // GAME ID arg is the key that identifies the game state box we are trying to delete
+      appId: client.appId,
       maxFee: microAlgo(10_000), // Cover for inner transaction fees
-      coverAppCallInnerTransactionFees: true,
+      method: ABIMethod.fromSignature('delete_game(uint64)void'),
+      args: [gameId], // GAME ID arg is the key that identifies the game state box we are trying to delete
       note: noteDeleteGame,
     })
+
+    // Use the transaction composer object to send the entire atomic group to the network
+    await composer.send({ coverAppCallInnerTransactionFees: true })
   }
 }
@@ -173,11 +173,6 @@ export const handleDelBoxGameRegisterForOther = async (
   )
 }
 
-export const handleSetGameCommit = async (appClient: PieoutClient, appMethods: PieoutMethods, sender: string, gameId: bigint) => {
-  if (!appClient || !appMethods || !sender || !gameId) throw new Error('[handleSetGameCommit] - Missing required parameters!')
-  return await safeCall(() => appMethods.setGameCommit(appClient.appId, sender, gameId), 'handleSetGameCommit', 'setGameCommit')
-}
-
 export const handleTriggerGameEvent = async (
   appClient: PieoutClient,
   appMethods: PieoutMethods,
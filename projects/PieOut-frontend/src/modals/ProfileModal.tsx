@@ -41,15 +41,9 @@ const ProfileData = ({
           <p>
             Hosting Game: <span className="text-cyan-300">{registerData.hostingGame.toString()}</span>
           </p>
-          <p>
-            Game ID: <span className="text-cyan-300">{`${registerData.gameId.toString()}`}</span>
-          </p>
           <p>
             Best Score: <span className="text-cyan-300">{`${registerData.bestScore.toString()} ☆`}</span>
           </p>
-          <p>
-            Commit Round: <span className="text-cyan-300">{`${registerData.commitRandRound.toString()} ❒`}</span>
-          </p>
           <p>
             Expiry Round: <span className="text-cyan-300">{`${registerData.expiryRound.toString()} ❒`}</span>
           </p>
@@ -101,10 +95,7 @@ const ProfileModal = React.memo(({ openModal, closeModal }: ModalInterface) => {
   // Computed values: Account States
   const accountStates = useMemo(() => {
     const isRegistered = !!gameRegisterData
-    const isInActiveGame =
-      gameRegisterData?.gameId !== undefined &&
-      gameRegisterData.gameId !== 0n &&
-      gamePlayersData?.some((player) => player === activeAddress)
+    const isInActiveGame = !!gamePlayersData?.some((player) => player === activeAddress)
     const isHostingGame = gameRegisterData?.hostingGame === true
 
     return {
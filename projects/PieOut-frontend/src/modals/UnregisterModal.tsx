@@ -78,12 +78,6 @@ const UnregisterModal = ({ openModal, closeModal }: ModalInterface) => {
         return
       }
 
-      // If game register box `gameId` property does NOT equal 0, the player is currently in-game, set user status message and return early
-      if (gameRegisterData.gameId !== 0n) {
-        setUserStatusMsg(`Account commitment to Game ${gameRegisterData.gameId} still active. Game ID must be 0 to unregister.`)
-        return
-      }
-
       // If `lastRound` on blockchain is lesser or equal than the game register box `expiryRound`, set user status message and return early
       if (lastRound <= gameRegisterData.expiryRound) {
         setUserStatusMsg(`This account's registration expires after round ${gameRegisterData.expiryRound}.`)
@@ -41,7 +41,6 @@ export type MethodNames =
   | 'resetGame'
   | 'deleteGame'
   | 'getBoxGameRegister'
-  | 'setGameCommit'
   | 'delBoxGameRegisterForSelf'
   | 'delBoxGameRegisterForOther'
   | 'triggerGameEvent'